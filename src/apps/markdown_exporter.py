@@ -15,6 +15,18 @@ from pathlib import Path
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Heading that starts the research sources section of the researcher's output
+SOURCES_HEADING_RE = re.compile(r"(?m)^## Research Sources\b")
+
+# Disclaimer appended to every report
+DISCLAIMER_TEXT = """
+This report was generated by Zero-Day Scout, an autonomous security research agent that uses Retrieval-Augmented Generation (RAG) technology.
+The information provided should be used for informational purposes only and verified by security professionals before implementation.
+This is an AI-generated analysis and may not cover all aspects of the security topic. Security best practices and vulnerabilities
+change over time, so ensure you consult current security resources and subject matter experts for critical security decisions.
+Zero-Day Scout is designed to assist security research, not replace human expertise and judgment.
+"""
+
 # Base directory for reports
 REPORTS_DIR = os.path.abspath(os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
@@ -82,93 +94,90 @@ def export_to_markdown(
     # Full path to the Markdown file
     md_path = os.path.join(REPORTS_DIR, filename)
     
+    # Timestamp shown under the title and in the footer
+    timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
     try:
-        # Build content
-        md_content = []
-        
-        # Add title
-        md_content.append("# Zero-Day Scout Security Analysis\n")
-        
-        # Add timestamp
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        md_content.append(f"*Report generated on: {timestamp}*\n")
-        
-        # Add brief disclaimer at the top
-        md_content.append("***AI-generated analysis for informational purposes only. Requires verification by security professionals.***\n")
-        
-        # Add query
-        md_content.append("## Security Query\n")
-        md_content.append(f"{query}\n")
-        
-        # Add divider
-        md_content.append("---\n")
-        
-        # If we have agent outputs, include them
-        if agent_outputs and isinstance(agent_outputs, dict):
-            # Planner output
-            if "security_planner" in agent_outputs and agent_outputs["security_planner"].get("output"):
-                md_content.append("## Research Plan\n")
-                planner_output = agent_outputs["security_planner"]["output"]
-                md_content.append(f"{planner_output}\n")
-            
-            # Researcher output - Split to separate research findings from sources
-            if "security_researcher" in agent_outputs and agent_outputs["security_researcher"].get("output"):
-                researcher_output = agent_outputs["security_researcher"]["output"]
-                
-                # Split research findings from sources if present
-                if "## Research Sources" in researcher_output:
-                    parts = researcher_output.split("## Research Sources", 1)
-                    research_content = parts[0].strip()
-                    sources_content = "## Research Sources" + parts[1]
-                    
-                    # Add research findings
-                    md_content.append("## Research Findings\n")
-                    md_content.append(f"{research_content}\n")
-                    
-                    # Add sources if requested
-                    if include_sources:
-                        md_content.append(f"{sources_content}\n")
-                else:
-                    # Just add the whole content
-                    md_content.append("## Research Findings\n")
-                    md_content.append(f"{researcher_output}\n")
-            
-            # Analysis output
-            if "security_analyst" in agent_outputs and agent_outputs["security_analyst"].get("output"):
-                md_content.append("## Security Analysis\n")
-                analyst_output = agent_outputs["security_analyst"]["output"]
-                md_content.append(f"{analyst_output}\n")
-                
+        # Sections are written to the file as they are produced, rather than
+        # assembling the whole report in memory first
+        with open(md_path, 'w', buffering=64 * 1024) as f:
+            def write_section(*parts: str) -> None:
+                for part in parts:
+                    f.write(part)
+                f.write("\n")
+
+            # Add title
+            write_section("# Zero-Day Scout Security Analysis\n")
+
+            # Add timestamp (also used in the footer)
+            write_section(f"*Report generated on: {timestamp}*\n")
+
+            # Add brief disclaimer at the top
+            write_section("***AI-generated analysis for informational purposes only. Requires verification by security professionals.***\n")
+
+            # Add query
+            write_section("## Security Query\n")
+            write_section(query, "\n")
+
             # Add divider
-            md_content.append("---\n")
-        
-        # Add final response
-        md_content.append("## Final Analysis\n")
-        md_content.append(f"{final_response}\n")
-        
-        # Add disclaimer
-        md_content.append("## DISCLAIMER\n")
-        
-        disclaimer_text = """
-This report was generated by Zero-Day Scout, an autonomous security research agent that uses Retrieval-Augmented Generation (RAG) technology.
-The information provided should be used for informational purposes only and verified by security professionals before implementation.
-This is an AI-generated analysis and may not cover all aspects of the security topic. Security best practices and vulnerabilities
-change over time, so ensure you consult current security resources and subject matter experts for critical security decisions.
-Zero-Day Scout is designed to assist security research, not replace human expertise and judgment.
-"""
-        
-        md_content.append(disclaimer_text)
-        
-        # Add footer
-        md_content.append(f"\n*Generated by Zero-Day Scout Agentic RAG System on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
-        
-        # Write content to file
-        with open(md_path, 'w') as f:
-            f.write('\n'.join(md_content))
-        
+            write_section("---\n")
+
+            # If we have agent outputs, include them
+            if agent_outputs and isinstance(agent_outputs, dict):
+                # Planner output
+                if "security_planner" in agent_outputs and agent_outputs["security_planner"].get("output"):
+                    write_section("## Research Plan\n")
+                    planner_output = agent_outputs["security_planner"]["output"]
+                    write_section(planner_output, "\n")
+
+                # Researcher output - Split to separate research findings from sources
+                if "security_researcher" in agent_outputs and agent_outputs["security_researcher"].get("output"):
+                    researcher_output = agent_outputs["security_researcher"]["output"]
+
+                    # Split research findings from sources if present
+                    sources_match = SOURCES_HEADING_RE.search(researcher_output)
+                    if sources_match:
+                        research_content = researcher_output[:sources_match.start()].strip()
+
+                        # Add research findings
+                        write_section("## Research Findings\n")
+                        write_section(research_content, "\n")
+
+                        # Add sources if requested
+                        if include_sources:
+                            write_section(researcher_output[sources_match.start():], "\n")
+                    else:
+                        # Just add the whole content
+                        write_section("## Research Findings\n")
+                        write_section(researcher_output, "\n")
+
+                # Analysis output
+                if "security_analyst" in agent_outputs and agent_outputs["security_analyst"].get("output"):
+                    write_section("## Security Analysis\n")
+                    analyst_output = agent_outputs["security_analyst"]["output"]
+                    write_section(analyst_output, "\n")
+
+                # Add divider
+                write_section("---\n")
+
+            # Add final response
+            write_section("## Final Analysis\n")
+            write_section(final_response, "\n")
+
+            # Add disclaimer
+            write_section("## DISCLAIMER\n")
+
+            write_section(DISCLAIMER_TEXT)
+
+            # Add footer
+            write_section(f"\n*Generated by Zero-Day Scout Agentic RAG System on {timestamp}*")
+
         logger.info(f"Markdown report saved to: {md_path}")
         return md_path
         
     except Exception as e:
         logger.error(f"Error generating Markdown report: {e}")
+        # Don't leave a partially written report behind
+        if os.path.exists(md_path):
+            os.remove(md_path)
         return ""
\ No newline at end of file
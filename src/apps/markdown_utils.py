@@ -2,7 +2,6 @@
 Markdown export utilities for the Scout CLI.
 """
 
-import os
 import logging
 from typing import Dict, Any, Optional
 
@@ -41,10 +40,13 @@ def export_results_to_markdown(
             include_sources=include_sources
         )
         
-        if md_path and os.path.exists(md_path):
+        # export_to_markdown returns the path only once the file is written
+        if md_path:
             if console:
-                console.print(f"[bright_green]Report successfully exported to Markdown:[/bright_green]")
-                console.print(f"[bright_white]{md_path}[/bright_white]")
+                console.print(
+                    "[bright_green]Report successfully exported to Markdown:[/bright_green]\n"
+                    f"[bright_white]{md_path}[/bright_white]"
+                )
             logger.info(f"Report exported to Markdown: {md_path}")
             return md_path
         else:
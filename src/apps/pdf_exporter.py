@@ -12,6 +12,8 @@ import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from src.apps.markdown_exporter import SOURCES_HEADING_RE
+
 try:
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.lib import colors
@@ -26,6 +28,7 @@ except ImportError:
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+
 # Base directory for reports
 REPORTS_DIR = os.path.abspath(os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
@@ -278,10 +281,10 @@ def export_to_pdf(
                 researcher_output = agent_outputs["security_researcher"]["output"]
                 
                 # Split research findings from sources if present
-                if "## Research Sources" in researcher_output:
-                    parts = researcher_output.split("## Research Sources", 1)
-                    research_content = parts[0].strip()
-                    sources_content = "## Research Sources" + parts[1]
+                sources_match = SOURCES_HEADING_RE.search(researcher_output)
+                if sources_match:
+                    research_content = researcher_output[:sources_match.start()].strip()
+                    sources_content = researcher_output[sources_match.start():]
                     
                     # Add research findings
                     elements.append(Paragraph("Research Findings:", styles["Heading2"]))
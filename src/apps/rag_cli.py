@@ -7,34 +7,42 @@ import sys
 import os
 import argparse
 import time
-import asyncio
 import io
 import logging
-from typing import Optional, List, Tuple, Dict, Any
-from dotenv import load_dotenv
+import threading
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Any
 import json
+import operator
 import re
+from collections import OrderedDict
+from types import SimpleNamespace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import count, islice
+from urllib.parse import quote
 
 # Rich library for beautiful terminal output
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.theme import Theme
     from rich.panel import Panel
-    from rich.markdown import Markdown
-    from rich.prompt import Prompt
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
     from rich.live import Live
     from rich.table import Table
-    from rich.layout import Layout
     from rich.align import Align
-    from rich.spinner import Spinner
-    from rich.status import Status
+    from rich.rule import Rule
+    from rich.text import Text
     from rich.logging import RichHandler
     from rich import box
 except ImportError:
     print("This utility requires the 'rich' library. Install with: pip install rich")
     sys.exit(1)
 
+# orjson is optional - it speeds up reading and writing large tracking files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Handle import paths whether running as a script or from another module
 try:
     # Try direct import first (when run as a script directly)
@@ -45,13 +53,21 @@ try:
     if project_root not in sys.path:
         sys.path.insert(0, project_root)
     
-    from src.rag.pipeline import VertexRagPipeline
     from config.config_manager import get_config
 except ImportError:
     # Fallback for when run as a module (like from zero_day_hq.py)
-    from src.rag.pipeline import VertexRagPipeline
     from config.config_manager import get_config
-from vertexai.generative_models import GenerativeModel
+
+# The RAG pipeline, dotenv, the Vertex AI SDK and the Rich components used only
+# by some commands (Markdown, Status, Prompt, Layout, Spinner) are imported
+# lazily where they are used so the CLI reaches its first prompt quickly
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+    from rich.segment import Segments
+    from src.rag.gcs_utils import GcsManager
+    from src.rag.pipeline import VertexRagPipeline
+    from src.rag.response_cache import ResponseCache
+    from src.rag.semantic_cache import LSHCache
 
 # Custom theme for output
 custom_theme = Theme(
@@ -102,9 +118,14 @@ logger.addHandler(log_capture_handler)
 # Print a debug message to confirm logging is working
 logger.debug("Logging system initialized")
 
+# Name of the console display level, refreshed only when set_log_level runs
+_current_level_name = logging.getLevelName(logging.WARNING)
+
 
 def set_log_level(debug=False, verbose=False):
     """Set the appropriate log level based on debug and verbose flags."""
+    global _current_level_name
+
     # Find the console handler among the handlers
     console_handler = None
     for handler in logging.root.handlers:
@@ -140,9 +161,259 @@ def set_log_level(debug=False, verbose=False):
     # The capture handler always stays at DEBUG level to capture everything for the logs panel
     # We want all logs to be available in the logs panel, regardless of console display
 
+    # Cache the display level name for the logs panel title
+    display_level = logging.DEBUG if debug else logging.INFO if verbose else logging.WARNING
+    _current_level_name = logging.getLevelName(display_level)
+
     return logging.getLogger().getEffectiveLevel()
 
 
+def _get_pipeline() -> "VertexRagPipeline":
+    """
+    Create a VertexRagPipeline, importing the RAG stack on first use.
+
+    Construction is not cached, so a transient initialization failure can be
+    retried simply by calling this function again.
+    """
+    from src.rag.pipeline import VertexRagPipeline
+
+    return VertexRagPipeline()
+
+
+def _prefetch_pipeline(ready: Optional[threading.Event] = None) -> Future:
+    """
+    Start initializing the RAG pipeline on a background thread.
+
+    The thread is a daemon, so a command that ends up not needing the
+    pipeline (e.g. a cached answer) can exit without waiting for it.
+
+    Args:
+        ready: Event to wait for before initializing, e.g. the startup
+            tracking sync the pipeline reads from (optional)
+
+    Returns:
+        Future resolving to the initialized VertexRagPipeline
+    """
+    future = Future()
+
+    def prefetch():
+        if ready is not None:
+            ready.wait()
+        try:
+            future.set_result(_get_pipeline())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=prefetch, daemon=True).start()
+    return future
+
+
+def _resolve_prefetched_pipeline(future: Optional[Future]) -> Optional["VertexRagPipeline"]:
+    """
+    Wait for a prefetched pipeline.
+
+    Args:
+        future: Future from _prefetch_pipeline, or None if nothing was prefetched
+
+    Returns:
+        The pipeline, or None if there was no prefetch or it failed; callers
+        then initialize (and report errors for) the pipeline themselves
+    """
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception as e:
+        logger.warning(f"Pipeline prefetch failed: {e}")
+        return None
+
+
+def _print_lines(lines: List[str]) -> None:
+    """Print a block of markup lines with a single console.print call."""
+    console.print("\n".join(lines))
+
+
+@lru_cache(maxsize=4)
+def _get_gcs_manager(project_id: Optional[str]) -> "GcsManager":
+    """
+    Get a GcsManager for the configured bucket, shared across calls.
+
+    The GCS client and its credentials are created once per project and reused
+    by every command in the session. Failed constructions are not cached.
+
+    Args:
+        project_id: Google Cloud project ID
+    """
+    from src.rag.gcs_utils import GcsManager
+
+    return GcsManager(project_id=project_id, bucket_name=None)
+
+
+def _embed_query(query: str) -> Optional[List[float]]:
+    """
+    Embed a query with the configured embedding model for cache lookups.
+
+    Args:
+        query: The query to embed
+
+    Returns:
+        The embedding values, or None if the query could not be embedded
+    """
+    try:
+        import vertexai
+        from vertexai.language_models import TextEmbeddingModel
+
+        config = get_config()
+        vertexai.init(project=config.get("project_id"), location=config.get("location"))
+        model = TextEmbeddingModel.from_pretrained(config.get("embedding_model"))
+        return model.get_embeddings([query])[0].values
+    except Exception as e:
+        logger.warning(f"Could not embed query for the response cache: {e}")
+        return None
+
+
+def _open_semantic_cache() -> Optional["LSHCache"]:
+    """Open the persisted semantic response cache, or None if it's unavailable."""
+    try:
+        from src.rag.semantic_cache import LSHCache
+
+        return LSHCache()
+    except Exception as e:
+        # numpy missing or the cache directory is unusable
+        logger.warning(f"Semantic response cache unavailable: {e}")
+        return None
+
+
+def _open_response_cache() -> Optional["ResponseCache"]:
+    """Open the persisted exact-match response cache, or None if it's unavailable."""
+    try:
+        from src.rag.response_cache import ResponseCache
+
+        return ResponseCache()
+    except Exception as e:
+        logger.warning(f"Response cache unavailable: {e}")
+        return None
+
+
+def _snapshot_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy query metrics into a picklable form for the response caches.
+
+    Retrieved contexts are reduced to the fields used for previews and
+    source citations.
+    """
+    contexts = [
+        SimpleNamespace(
+            text=_first_attr(ctx, _CONTEXT_TEXT_GETTERS),
+            source_display_name=getattr(ctx, "source_display_name", None),
+            source_uri=getattr(ctx, "source_uri", None),
+        )
+        for ctx in metrics.get("contexts", [])
+    ]
+    return {**metrics, "contexts": contexts}
+
+
+class _NullStatus:
+    """Stand-in for a Rich Status that draws nothing, used when output isn't a terminal."""
+
+    def __enter__(self) -> "_NullStatus":
+        return self
+
+    def __exit__(self, *exc_info) -> bool:
+        return False
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+
+def maybe_status(message: str, **kwargs):
+    """
+    Create a spinner for a long-running step, only when output is a terminal.
+
+    When output is piped or redirected a spinner serves no purpose: it costs a
+    render thread and fills logs with escape codes. A no-op stand-in with the
+    same start/stop/update interface is returned instead.
+
+    Args:
+        message: Status message, may contain markup
+        **kwargs: Extra arguments for rich.status.Status (e.g. spinner)
+
+    Returns:
+        A Rich Status, or a no-op stand-in
+    """
+    if not console.is_terminal:
+        return _NullStatus()
+
+    from rich.status import Status
+
+    return Status(message, console=console, **kwargs)
+
+
+def run_daemon() -> int:
+    """
+    Serve queries from a resident process over a Unix socket.
+
+    The pipeline is initialized once, up front, and reused for every query.
+
+    Returns:
+        Process exit code
+    """
+    from src.apps.rag_daemon import DEFAULT_SOCKET_PATH, serve
+
+    with maybe_status("[info]Initializing pipeline...[/info]", spinner="dots"):
+        pipeline = _get_pipeline()
+
+    def run_query(
+        query: str, use_reranking: bool, debug: bool, verbose: bool
+    ) -> Tuple[str, Dict[str, Any]]:
+        # Details panels are rendered by the client from the returned metrics
+        response, _, metrics = run_rag_query(
+            query, use_reranking, update_in_place=False, pipeline=pipeline
+        )
+        metrics.update(debug=debug, verbose=verbose)
+        # Contexts are sent as plain dicts of the fields used for display
+        metrics = _snapshot_metrics(metrics)
+        metrics["contexts"] = [vars(ctx) for ctx in metrics["contexts"]]
+        return response, metrics
+
+    console.print(f"[green]Zero-Day Scout daemon ready on {DEFAULT_SOCKET_PATH}[/green] [dim](Ctrl+C to stop)[/dim]")
+    return serve(run_query)
+
+
+# .env snapshot written by earlier versions; it held the .env secrets in plaintext
+_LEGACY_ENV_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "zero-day-scout", "env.pkl"
+)
+
+
+def print_traceback(exc: BaseException) -> None:
+    """
+    Print an exception's traceback with Rich's renderer.
+
+    The traceback is printed as a renderable rather than interpolated into
+    markup, so brackets in source lines or messages can't break the output.
+
+    Args:
+        exc: The exception to show
+    """
+    from rich.traceback import Traceback
+
+    console.print(
+        Traceback.from_exception(
+            type(exc), exc, exc.__traceback__,
+            width=console.width,
+            show_locals=False,
+            suppress=[argparse],
+        )
+    )
+
+
 def get_captured_logs() -> str:
     """Get the logs captured in the StringIO buffer."""
     return log_capture.getvalue()
@@ -154,10 +425,48 @@ def clear_captured_logs() -> None:
     log_capture.seek(0)
 
 
+# Most recent successful suggestion lists, keyed by normalized query and model
+SUGGESTION_CACHE_SIZE = 128
+_suggestion_cache: "OrderedDict[Tuple[str, Optional[str]], List[str]]" = OrderedDict()
+
+
+def _suggestion_cache_key(query: str, model_name: Optional[str]) -> Tuple[str, Optional[str]]:
+    """
+    Build the suggestion cache key for a query.
+
+    Case and whitespace differences are folded so near-identical re-asks of
+    the same query share one entry.
+    """
+    return " ".join(query.casefold().split()), model_name
+
+
+def get_cached_suggestions(query: str, model_name: Optional[str] = None) -> Optional[List[str]]:
+    """
+    Look up cached suggestions for a query without calling the model.
+
+    Args:
+        query: The original user query
+        model_name: Model used for suggestions (defaults to config value)
+
+    Returns:
+        The cached suggestions, or None if the query has not been seen
+    """
+    model_name = model_name or get_config().get("generative_model")
+    cache_key = _suggestion_cache_key(query, model_name)
+    cached = _suggestion_cache.get(cache_key)
+    if cached is None:
+        return None
+    _suggestion_cache.move_to_end(cache_key)
+    return list(cached)
+
+
 def suggest_query_improvements(query: str, model_name: Optional[str] = None) -> List[str]:
     """
     Generate query improvement suggestions based on the original query.
 
+    Successful results are kept in a small LRU cache, so asking again for the
+    same query does not make another model call.
+
     Args:
         query: The original user query
         model_name: Model to use for suggestions (defaults to config value)
@@ -165,10 +474,19 @@ def suggest_query_improvements(query: str, model_name: Optional[str] = None) ->
     Returns:
         List of suggested improved queries
     """
-    logger.info(f"Generating query improvement suggestions for: {query}")
     config = get_config()
     model_name = model_name or config.get("generative_model")
 
+    cached = get_cached_suggestions(query, model_name)
+    if cached is not None:
+        logger.info(f"Using cached query suggestions for: {query}")
+        return cached
+    cache_key = _suggestion_cache_key(query, model_name)
+
+    logger.info(f"Generating query improvement suggestions for: {query}")
+
+    from vertexai.generative_models import GenerativeModel
+
     # Use the generative model to suggest improvements
     model = GenerativeModel(model_name)
 
@@ -186,7 +504,12 @@ def suggest_query_improvements(query: str, model_name: Optional[str] = None) ->
         response = model.generate_content(prompt)
         suggestions = [line.strip() for line in response.text.strip().split('\n') if line.strip()]
         logger.info(f"Generated {len(suggestions)} query suggestions")
-        return suggestions[:3]  # Limit to 3 suggestions
+        suggestions = suggestions[:3]  # Limit to 3 suggestions
+        if suggestions:
+            _suggestion_cache[cache_key] = suggestions
+            if len(_suggestion_cache) > SUGGESTION_CACHE_SIZE:
+                _suggestion_cache.popitem(last=False)
+        return list(suggestions)
     except Exception as e:
         error_msg = f"Error generating suggestions: {e}"
         logger.error(error_msg)
@@ -292,6 +615,9 @@ class StepTracker:
 
 async def animated_progress(status_text: str, delay: float = 0.1) -> None:
     """Display an animated spinner with progress text."""
+    import asyncio
+    from rich.spinner import Spinner
+
     spinner = Spinner("dots", text=status_text)
     with Live(spinner, refresh_per_second=10) as live:
         while True:
@@ -304,7 +630,9 @@ def run_rag_query(
     use_reranking: bool = False,
     debug: bool = False,
     verbose: bool = False,
-    update_in_place: bool = True
+    update_in_place: bool = True,
+    pipeline: Optional["VertexRagPipeline"] = None,
+    stream: bool = False,
 ) -> Tuple[str, float, Dict[str, Any]]:
     """
     Run a RAG query and return the response with execution time and step info.
@@ -314,6 +642,10 @@ def run_rag_query(
         use_reranking: Whether to use reranking
         debug: Show debug information
         verbose: Show verbose output including contexts
+        update_in_place: Update the step display in place with a Live panel
+        pipeline: An already initialized VertexRagPipeline (optional)
+        stream: Show the response in the live panel as it is generated
+            (only with update_in_place)
 
     Returns:
         Tuple of (response text, execution time in seconds, step metrics)
@@ -349,23 +681,26 @@ def run_rag_query(
 
     # Create a function to generate the step panel content
     def get_step_panel_content(active_step: int) -> str:
-        content = "[bold blue]Processing your query...[/bold blue]\n"
-        content += "[dim]The system is performing these steps:[/dim]\n"
+        lines = [
+            "[bold blue]Processing your query...[/bold blue]",
+            "[dim]The system is performing these steps:[/dim]",
+        ]
 
         for i, step_name in enumerate(step_display_names):
             if i < active_step:  # Completed steps
-                content += f"  [green]✓[/green] {step_name}\n"
+                lines.append(f"  [green]✓[/green] {step_name}")
             elif i == active_step:  # Current step
-                content += f"  [bright_blue]►[/bright_blue] {step_name} [bright_blue](in progress...)[/bright_blue]\n"
+                lines.append(f"  [bright_blue]►[/bright_blue] {step_name} [bright_blue](in progress...)[/bright_blue]")
             else:  # Pending steps
-                content += f"  [dim]•[/dim] {step_name}\n"
+                lines.append(f"  [dim]•[/dim] {step_name}")
 
-        return content
+        lines.append("")
+        return "\n".join(lines)
 
     tracker = StepTracker(steps)
 
     # Create a visually appealing processing indicator with spinner
-    with Status(f"[bold cyan]{query[:60] + '...' if len(query) > 60 else query}[/bold cyan]", 
+    with maybe_status(f"[bold cyan]{query[:60] + '...' if len(query) > 60 else query}[/bold cyan]", 
                spinner="dots", 
                spinner_style="bright_blue") as status:
         # Show the step tracking animation with initial state
@@ -412,7 +747,8 @@ def run_rag_query(
             # Create a live display that updates in place
             with Live(get_progress_panel(), refresh_per_second=4) as live_display:
                 # Step 1: Initialize pipeline
-                pipeline = VertexRagPipeline()
+                if pipeline is None:
+                    pipeline = _get_pipeline()
                 current_step += 1
                 tracker.next_step()
                 live_display.update(get_progress_panel())
@@ -481,10 +817,26 @@ def run_rag_query(
                 live_display.update(get_progress_panel())
                 time.sleep(0.1)  # Small delay to ensure update is visible
 
-                response_text = pipeline.generate_answer(
-                    query=query,
-                    retrievals=contexts
-                )
+                if stream:
+                    # Show the answer as it arrives. Chunks are appended to one
+                    # plain Text that the live display repaints at its own rate,
+                    # so each chunk costs only the append; the Markdown is
+                    # rendered once, from the complete response
+                    partial_text = Text()
+                    live_display.update(create_streaming_response_panel(partial_text))
+                    chunks = []
+                    for chunk in pipeline.generate_answer_stream(
+                        query=query,
+                        retrievals=contexts
+                    ):
+                        chunks.append(chunk)
+                        partial_text.append(chunk)
+                    response_text = "".join(chunks)
+                else:
+                    response_text = pipeline.generate_answer(
+                        query=query,
+                        retrievals=contexts
+                    )
 
                 # Show completion
                 current_step = len(steps)  # Mark all steps as completed
@@ -502,11 +854,12 @@ def run_rag_query(
         # For non-live display mode, use the original approach with consecutive panels
         else:
             # Create a status display for progress
-            with Status(f"[bold cyan]{query[:60] + '...' if len(query) > 60 else query}[/bold cyan]", spinner="dots") as status:
+            with maybe_status(f"[bold cyan]{query[:60] + '...' if len(query) > 60 else query}[/bold cyan]", spinner="dots") as status:
                 # Step 1: Initialize pipeline
                 status.update("[bold blue]Initializing RAG pipeline...[/bold blue]")
                 logger.debug("Initializing RAG pipeline")
-                pipeline = VertexRagPipeline()
+                if pipeline is None:
+                    pipeline = _get_pipeline()
                 logger.info("RAG pipeline initialized successfully")
                 current_step += 1
                 tracker.next_step()
@@ -610,56 +963,7 @@ def run_rag_query(
 
         # Show debug information in the console if requested
         if debug or verbose:
-            # Create a more attractive debug info panel
-            pipeline_info = (
-                metrics.get("pipeline_info", {}) if isinstance(metrics, dict) else {}
-            )
-
-            # Only show debug panel if we have useful info
-            if pipeline_info:
-                reranking_status = pipeline_info.get("reranking_status", "unknown")
-                reranker_model = pipeline_info.get("reranker_model", "")
-                context_count = pipeline_info.get("context_count", 0)
-                response_type = pipeline_info.get("response_type", "")
-                contexts_type = pipeline_info.get("contexts_type", "")
-                errors = pipeline_info.get("errors", [])
-
-                # Create a small info table for tech details
-                info_table = Table.grid()
-                info_table.add_column(style="dim")
-                info_table.add_column(style="bold")
-
-                info_table.add_row("Documents retrieved:", f"{context_count}")
-                info_table.add_row("Reranking:", f"[{'green' if reranking_status == 'enabled' else 'yellow'}]{reranking_status.capitalize()}[/{'green' if reranking_status == 'enabled' else 'yellow'}]")
-                if reranker_model:
-                    info_table.add_row("Reranker model:", reranker_model)
-                if response_type:
-                    info_table.add_row("Response type:", response_type)
-                if contexts_type:
-                    info_table.add_row("Contexts type:", contexts_type)
-
-                # Only show the debug panel in verbose mode or if there are errors
-                if verbose or errors:
-                    debug_content = info_table
-
-                    # Add context previews in verbose mode
-                    # Wrap in a panel for better visuals
-                    debug_panel = Panel(
-                        info_table,
-                        title="RAG Pipeline Details",
-                        border_style="dim blue",
-                        expand=False
-                    )
-                    console.print(debug_panel)
-
-                    # Show context preview as a separate panel if verbose
-                    if verbose and contexts:
-                        preview_panel = Panel(
-                            format_context_preview(contexts),
-                            title="Context Samples",
-                            border_style="dim"
-                        )
-                        console.print(preview_panel)
+            show_pipeline_details(step_metrics, verbose)
 
         return response_text, execution_time, step_metrics
 
@@ -687,8 +991,7 @@ def run_rag_query(
         # Provide more detailed error information
         if debug:
             console.print("[bold red]Debug Traceback:[/bold red]")
-            import traceback
-            console.print(f"[dim red]{traceback.format_exc()}[/dim red]")
+            print_traceback(e)
 
         return f"Error: {str(e)}", time.time() - start_time, {
             "error": str(e),
@@ -762,6 +1065,66 @@ def display_performance_metrics(metrics: Dict[str, Any]) -> Panel:
     return Panel(table, title="Performance Metrics", border_style="blue")
 
 
+def show_pipeline_details(metrics: Dict[str, Any], verbose: bool = False) -> None:
+    """
+    Print the RAG pipeline details panel for a query's metrics.
+
+    The panel is shown in verbose mode or when the pipeline reported errors,
+    followed by context previews in verbose mode.
+
+    Args:
+        metrics: Step metrics from run_rag_query
+        verbose: Also show the panel without errors, plus context previews
+    """
+    pipeline_info = metrics.get("pipeline_info", {})
+    contexts = metrics.get("contexts")
+
+    # Only show debug panel if we have useful info
+    if not pipeline_info:
+        return
+
+    reranking_status = pipeline_info.get("reranking_status", "unknown")
+    reranker_model = pipeline_info.get("reranker_model", "")
+    context_count = pipeline_info.get("context_count", 0)
+    response_type = pipeline_info.get("response_type", "")
+    contexts_type = pipeline_info.get("contexts_type", "")
+    errors = pipeline_info.get("errors", [])
+
+    # Only show the debug panel in verbose mode or if there are errors
+    if not (verbose or errors):
+        return
+
+    # Create a small info table for tech details
+    info_table = Table.grid()
+    info_table.add_column(style="dim")
+    info_table.add_column(style="bold")
+
+    info_table.add_row("Documents retrieved:", f"{context_count}")
+    info_table.add_row("Reranking:", f"[{'green' if reranking_status == 'enabled' else 'yellow'}]{reranking_status.capitalize()}[/{'green' if reranking_status == 'enabled' else 'yellow'}]")
+    if reranker_model:
+        info_table.add_row("Reranker model:", reranker_model)
+    if response_type:
+        info_table.add_row("Response type:", response_type)
+    if contexts_type:
+        info_table.add_row("Contexts type:", contexts_type)
+
+    # Wrap in a panel for better visuals
+    console.print(Panel(
+        info_table,
+        title="RAG Pipeline Details",
+        border_style="dim blue",
+        expand=False
+    ))
+
+    # Show context preview as a separate panel if verbose
+    if verbose and contexts:
+        console.print(Panel(
+            format_context_preview(contexts),
+            title="Context Samples",
+            border_style="dim"
+        ))
+
+
 def create_context_panel(metrics: Dict[str, Any]) -> Optional[Panel]:
     """Create a panel showing context information for empty responses."""
     # Only show for empty responses and when we have contexts
@@ -830,8 +1193,88 @@ def create_context_panel(metrics: Dict[str, Any]) -> Optional[Panel]:
     )
 
 
+@lru_cache(maxsize=32)
+def _md(text: str) -> "Markdown":
+    """Build a Markdown renderable, reusing the parsed result for repeated text."""
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+def create_response_panel(response: str, metrics: Dict[str, Any]) -> Panel:
+    """
+    Create the panel showing a query response together with its source citations.
+
+    Args:
+        response: The generated response text
+        metrics: Step metrics returned by run_rag_query
+
+    Returns:
+        Panel rendering the response as Markdown, followed by plain-text citations
+    """
+    # Use yellow for empty responses
+    color = "yellow" if metrics.get("is_empty_response", False) else "green"
+    formatted_time = metrics.get("formatted_time", "unknown time")
+
+    # Extract source citations if contexts are available
+    source_citations = extract_source_citations(metrics.get("contexts", []))
+
+    # Only the response goes through the Markdown parser; the citations are
+    # plain text, set apart from it by a rule
+    body = _md(response)
+    if source_citations:
+        body = Group(body, Rule(style="dim"), Text(source_citations.strip()))
+
+    return Panel(
+        body,
+        title=f"[bold {color}]Response[/bold {color}] (completed in [time]{formatted_time}[/time])",
+        border_style=color,
+        expand=True,
+        padding=(1, 2)
+    )
+
+
+def create_streaming_response_panel(partial_response: Text) -> Panel:
+    """
+    Create the panel showing a response while it is still being generated.
+
+    Args:
+        partial_response: Text the response chunks are appended to; the
+            panel shows its current contents whenever it is repainted
+
+    Returns:
+        Panel rendering the partial response as plain text
+    """
+    return Panel(
+        partial_response,
+        title="[bold green]Response[/bold green] [dim](generating...)[/dim]",
+        border_style="green",
+        expand=True,
+        padding=(1, 2)
+    )
+
+
+def create_suggestion_grid(suggestions: List[str]) -> Table:
+    """
+    Create a numbered grid of query suggestions, laid out in a single render pass.
+
+    Args:
+        suggestions: Suggested queries to list
+
+    Returns:
+        Table grid with one row per suggestion
+    """
+    grid = Table.grid(padding=(0, 1))
+    grid.add_column(style="suggestion", justify="right")
+    grid.add_column(style="suggestion")
+    for i, suggestion in enumerate(suggestions, 1):
+        grid.add_row(f"{i}.", suggestion)
+    return grid
+
+
+@lru_cache(maxsize=1)
 def explain_reranking_benefits() -> Panel:
-    """Create a panel explaining the benefits of reranking."""
+    """Create a panel explaining the benefits of reranking (built once and reused)."""
     return Panel(
         "Reranking significantly improves your search results by:\n\n"
         "1. [bold]Improving relevance[/bold] - Reordering results based on semantic meaning\n"
@@ -844,6 +1287,56 @@ def explain_reranking_benefits() -> Panel:
     )
 
 
+# Listings of research papers in GCS are cached on disk for a few minutes, so
+# browsing with --papers and then ingesting doesn't re-list the bucket
+PAPERS_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "zero-day-scout", "papers.json"
+)
+PAPERS_CACHE_TTL_SECONDS = 300
+
+
+def _list_papers_cached(gcs_manager: "GcsManager", prefix: str) -> Dict[str, Optional[int]]:
+    """
+    List the files under a prefix with their sizes, using the disk cache when fresh.
+
+    Args:
+        gcs_manager: GcsManager for the papers bucket
+        prefix: Prefix to list
+
+    Returns:
+        Dictionary mapping GCS file paths to sizes in bytes
+    """
+    cache_key = f"{gcs_manager.bucket_name}|{prefix}"
+    cache = {}
+    try:
+        with open(PAPERS_CACHE_PATH) as f:
+            cache = json.load(f)
+        entry = cache.get(cache_key)
+        if entry and time.time() - entry["fetched_at"] < PAPERS_CACHE_TTL_SECONDS:
+            return entry["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        cache = {}
+
+    files = gcs_manager.list_file_sizes(prefix=prefix)
+    cache[cache_key] = {"fetched_at": time.time(), "files": files}
+    try:
+        os.makedirs(os.path.dirname(PAPERS_CACHE_PATH), exist_ok=True)
+        _write_json_file(PAPERS_CACHE_PATH, cache)
+    except OSError as e:
+        logger.debug(f"Could not write papers cache: {e}")
+    return files
+
+
+def invalidate_papers_cache() -> None:
+    """Discard cached research paper listings."""
+    try:
+        os.remove(PAPERS_CACHE_PATH)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove papers cache: {e}")
+
+
 def list_research_papers(pipeline=None, prefix=None, detailed=False):
     """
     List research papers from GCS.
@@ -855,9 +1348,9 @@ def list_research_papers(pipeline=None, prefix=None, detailed=False):
     """
     # Create pipeline if not provided
     if not pipeline:
-        with Status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
+        with maybe_status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
             try:
-                pipeline = VertexRagPipeline()
+                pipeline = _get_pipeline()
             except Exception as e:
                 console.print(f"[error]Error initializing pipeline: {e}[/error]")
                 return
@@ -865,8 +1358,7 @@ def list_research_papers(pipeline=None, prefix=None, detailed=False):
     # Create GCS manager
     gcs_manager = None
     try:
-        from src.rag.gcs_utils import GcsManager
-        gcs_manager = GcsManager(project_id=pipeline.project_id, bucket_name=None)
+        gcs_manager = _get_gcs_manager(pipeline.project_id)
     except Exception as e:
         console.print(f"[error]Error initializing GCS manager: {e}[/error]")
         return
@@ -875,21 +1367,23 @@ def list_research_papers(pipeline=None, prefix=None, detailed=False):
     config = get_config()
     doc_prefixes = config.get("document_prefixes", [])
     
-    with Status("[info]Retrieving papers from GCS...[/info]", spinner="dots") as status:
+    with maybe_status("[info]Retrieving papers from GCS...[/info]", spinner="dots") as status:
         try:
-            # Collect papers by prefix
+            # Collect papers by prefix, with sizes from the listing
             papers_by_prefix = {}
+            paper_sizes = {}
             all_papers = set()
             
             # If specific prefix provided, only check that one
             prefixes_to_check = [prefix] if prefix else doc_prefixes
             
             for p in prefixes_to_check:
-                papers = gcs_manager.list_files(prefix=p)
+                listed = _list_papers_cached(gcs_manager, p)
+                # Filter out directories (which usually end with /)
+                papers = [paper for paper in listed if not paper.endswith('/')]
                 if papers:
-                    # Filter out directories (which usually end with /)
-                    papers = [paper for paper in papers if not paper.endswith('/')]
                     papers_by_prefix[p] = papers
+                    paper_sizes.update(listed)
                     all_papers.update(papers)
             
             if not all_papers:
@@ -929,25 +1423,16 @@ def list_research_papers(pipeline=None, prefix=None, detailed=False):
                     # Get paper size if detailed view is requested
                     size_str = ""
                     if detailed:
-                        try:
-                            # Get file metadata from GCS
-                            bucket_name = paper.split('/')[2]
-                            blob_name = '/'.join(paper.split('/')[3:])
-                            
-                            bucket = gcs_manager.client.bucket(bucket_name)
-                            blob = bucket.blob(blob_name)
-                            blob.reload()
-                            
-                            # Format size
-                            size_bytes = blob.size
-                            if size_bytes < 1024:
-                                size_str = f"{size_bytes} B"
-                            elif size_bytes < 1024 * 1024:
-                                size_str = f"{size_bytes/1024:.1f} KB"
-                            else:
-                                size_str = f"{size_bytes/(1024*1024):.1f} MB"
-                        except Exception:
+                        # Format size
+                        size_bytes = paper_sizes.get(paper)
+                        if size_bytes is None:
                             size_str = "Unknown"
+                        elif size_bytes < 1024:
+                            size_str = f"{size_bytes} B"
+                        elif size_bytes < 1024 * 1024:
+                            size_str = f"{size_bytes/1024:.1f} KB"
+                        else:
+                            size_str = f"{size_bytes/(1024*1024):.1f} MB"
                     
                     # Add row to table
                     if detailed:
@@ -968,12 +1453,14 @@ def list_research_papers(pipeline=None, prefix=None, detailed=False):
             console.print(table)
             
             # Show summary
-            console.print(f"\n[bold]Summary:[/bold]")
             ingested_count = len(all_papers.intersection(ingested_papers))
             not_ingested = len(all_papers) - ingested_count
-            console.print(f"Total papers: {len(all_papers)}")
-            console.print(f"Ingested: [green]{ingested_count}[/green]")
-            console.print(f"Not ingested: [yellow]{not_ingested}[/yellow]")
+            _print_lines([
+                f"\n[bold]Summary:[/bold]",
+                f"Total papers: {len(all_papers)}",
+                f"Ingested: [green]{ingested_count}[/green]",
+                f"Not ingested: [yellow]{not_ingested}[/yellow]",
+            ])
             
         except Exception as e:
             console.print(f"[error]Error listing research papers: {e}[/error]")
@@ -994,7 +1481,7 @@ def clear_tracking_files():
         
         # Create pipeline to get tracking file paths
         try:
-            pipeline = VertexRagPipeline()
+            pipeline = _get_pipeline()
         except Exception as e:
             logger.error(f"Error creating pipeline: {e}")
             console.print(f"[yellow]Could not initialize VertexRagPipeline. Falling back to default paths.[/yellow]")
@@ -1011,8 +1498,7 @@ def clear_tracking_files():
         # Clear from cloud if available
         if hasattr(pipeline, 'cloud_tracking_path') and pipeline.cloud_tracking_path:
             try:
-                from src.rag.gcs_utils import GcsManager
-                gcs_manager = GcsManager(project_id=pipeline.project_id, bucket_name=None)
+                gcs_manager = _get_gcs_manager(pipeline.project_id)
                 
                 # Write empty lists to cloud tracking files to clear them
                 gcs_manager.write_json(pipeline.cloud_tracking_path, [])
@@ -1071,9 +1557,9 @@ def recreate_corpus(pipeline=None, clear_tracking=True):
     # Create pipeline if not provided
     if not pipeline:
         logger.debug("No pipeline provided, initializing a new one")
-        with Status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
+        with maybe_status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
             try:
-                pipeline = VertexRagPipeline()
+                pipeline = _get_pipeline()
                 logger.debug(
                     f"Pipeline initialized with project_id={pipeline.project_id}, location={pipeline.location}"
                 )
@@ -1083,7 +1569,7 @@ def recreate_corpus(pipeline=None, clear_tracking=True):
                 console.print(f"[error]{error_msg}[/error]")
                 return False
 
-    with Status("[info]Recreating corpus...[/info]", spinner="dots") as status:
+    with maybe_status("[info]Recreating corpus...[/info]", spinner="dots") as status:
         try:
             # Check if corpus exists
             logger.debug(f"Checking if corpus '{pipeline.corpus_name}' exists")
@@ -1191,6 +1677,12 @@ def recreate_corpus(pipeline=None, clear_tracking=True):
                     else:
                         console.print(f"[yellow]Warning: {clear_message}[/yellow]")
 
+                # Cached responses were generated from the old corpus
+                from src.rag.response_cache import invalidate_cached_responses
+
+                invalidate_cached_responses()
+                invalidate_papers_cache()
+
                 logger.debug("Corpus recreation completed successfully")
                 return True
             except Exception as create_error:
@@ -1216,6 +1708,7 @@ def ingest_documents(
     specific_paths=None,
     recreate_first=False,
     force_reingest=False,
+    concurrency=10,
 ):
     """
     Ingest documents into the RAG corpus.
@@ -1226,15 +1719,18 @@ def ingest_documents(
         specific_paths: List of specific GCS paths to ingest
         recreate_first: Whether to recreate the corpus before ingestion
         force_reingest: Whether to force reingestion of already tracked documents
+        concurrency: Maximum number of configured prefixes listed in parallel
 
     Returns:
         Success status as boolean
     """
+    from rich.prompt import Prompt
+
     # Create pipeline if not provided
     if not pipeline:
-        with Status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
+        with maybe_status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
             try:
-                pipeline = VertexRagPipeline()
+                pipeline = _get_pipeline()
             except Exception as e:
                 console.print(f"[error]Error initializing pipeline: {e}[/error]")
                 return False
@@ -1248,7 +1744,7 @@ def ingest_documents(
             return False
         console.print("[green]Corpus recreation successful. Proceeding with ingestion...[/green]")
 
-    with Status("[info]Ingesting documents...[/info]", spinner="dots") as status:
+    with maybe_status("[info]Ingesting documents...[/info]", spinner="dots") as status:
         try:
             # Determine which documents to ingest
             gcs_paths = []
@@ -1260,8 +1756,7 @@ def ingest_documents(
 
             # If prefix provided, list files with that prefix
             elif prefix:
-                from src.rag.gcs_utils import GcsManager
-                gcs_manager = GcsManager(project_id=pipeline.project_id, bucket_name=None)
+                gcs_manager = _get_gcs_manager(pipeline.project_id)
                 gcs_paths = gcs_manager.list_files(prefix=prefix)
 
                 if not gcs_paths:
@@ -1297,8 +1792,9 @@ def ingest_documents(
                     "[yellow]Force reingestion enabled - will reingest all documents[/yellow]"
                 )
             import_op = pipeline.ingest_documents(
-                gcs_paths, force_reingest=force_reingest
+                gcs_paths, force_reingest=force_reingest, concurrency=concurrency
             )
+            invalidate_papers_cache()
 
             # Determine if any new documents were ingested
             ingested_after = len(pipeline.ingested_documents) if hasattr(pipeline, 'ingested_documents') else 0
@@ -1316,7 +1812,7 @@ def ingest_documents(
                 if hasattr(import_op, "operation") and sys.stdin.isatty():
                     wait = Prompt.ask("[info]Wait for ingestion to complete?[/info] (y/n)").lower() in ('y', 'yes')
                     if wait:
-                        with Status("[info]Waiting for ingestion to complete...[/info]", spinner="dots") as wait_status:
+                        with maybe_status("[info]Waiting for ingestion to complete...[/info]", spinner="dots") as wait_status:
                             import_op.operation.wait()
                         console.print("[green]Ingestion completed successfully![/green]")
             except KeyboardInterrupt:
@@ -1330,23 +1826,81 @@ def ingest_documents(
             return False
 
 
-def list_ingested_documents(pipeline=None):
+def _fetch_corpus_files(pipeline) -> Tuple[Optional[str], List[Any], List[str]]:
     """
-    List documents that have been ingested into the RAG corpus.
-    
+    Look up the current corpus ID and its files in the Vertex AI RAG engine.
+
     Args:
-        pipeline: An existing VertexRagPipeline instance (optional)
+        pipeline: A VertexRagPipeline instance
+
+    Returns:
+        Tuple of (corpus ID or None, corpus files, warning messages)
+    """
+    warnings = []
+
+    current_corpus_id = None
+    try:
+        corpus = pipeline.get_corpus()
+        if corpus and hasattr(corpus, 'name'):
+            current_corpus_id = corpus.name
+    except Exception as e:
+        warnings.append(f"Could not get corpus ID: {e}")
+
+    try:
+        corpus_files = pipeline.list_corpus_files()
+        corpus_files = list(corpus_files) if corpus_files else []
+    except Exception as e:
+        warnings.append(f"Could not retrieve corpus files from Vertex AI: {e}")
+        corpus_files = []
+
+    return current_corpus_id, corpus_files, warnings
+
+
+def _load_tracking_state(pipeline, tracking_file, cloud_tracking_path) -> Tuple[bool, bool]:
+    """
+    Check which of the cloud and local tracking files exist.
+
+    Args:
+        pipeline: A VertexRagPipeline instance
+        tracking_file: Local tracking file path (optional)
+        cloud_tracking_path: Cloud tracking file path (optional)
+
+    Returns:
+        Tuple of (cloud tracking exists, local tracking exists)
+    """
+    # Try to check if cloud tracking exists - for informational purposes
+    cloud_tracking_exists = False
+    if cloud_tracking_path:
+        try:
+            gcs_manager = _get_gcs_manager(pipeline.project_id)
+
+            # Just check if the file exists, don't read it
+            cloud_tracking_exists = gcs_manager.file_exists(cloud_tracking_path)
+        except Exception:
+            # Ignore errors here, just for informational display
+            pass
+
+    local_tracking_exists = bool(tracking_file) and os.path.exists(tracking_file)
+    return cloud_tracking_exists, local_tracking_exists
+
+
+def list_ingested_documents(pipeline=None):
+    """
+    List documents that have been ingested into the RAG corpus.
+    
+    Args:
+        pipeline: An existing VertexRagPipeline instance (optional)
     """
     # Create pipeline if not provided
     if not pipeline:
-        with Status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
+        with maybe_status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
             try:
-                pipeline = VertexRagPipeline()
+                pipeline = _get_pipeline()
             except Exception as e:
                 console.print(f"[error]Error initializing pipeline: {e}[/error]")
                 return
 
-    with Status("[info]Retrieving ingested documents...[/info]", spinner="dots") as status:
+    with maybe_status("[info]Retrieving ingested documents...[/info]", spinner="dots") as status:
         try:
             # Get tracking information - include more details about where docs are tracked
             tracking_file = pipeline.tracking_file if hasattr(pipeline, 'tracking_file') else None
@@ -1361,16 +1915,20 @@ def list_ingested_documents(pipeline=None):
                 console.print('[yellow]Warning: Pipeline does not have ingested_documents attribute. Initializing it.[/yellow]')
                 pipeline.ingested_documents = set()
             ingested_docs = pipeline.ingested_documents
-            
-            # Get current corpus ID for filtering
-            current_corpus_id = None
-            try:
-                corpus = pipeline.get_corpus()
-                if corpus and hasattr(corpus, 'name'):
-                    current_corpus_id = corpus.name
-            except Exception as e:
-                console.print(f"[yellow]Could not get corpus ID: {e}[/yellow]")
-            
+
+            # The Vertex AI corpus lookups and the tracking file checks are
+            # independent, so run them concurrently rather than back to back
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                corpus_future = executor.submit(_fetch_corpus_files, pipeline)
+                tracking_future = executor.submit(
+                    _load_tracking_state, pipeline, tracking_file, cloud_tracking_path
+                )
+                current_corpus_id, corpus_files, corpus_warnings = corpus_future.result()
+                cloud_tracking_exists, local_exists = tracking_future.result()
+
+            for warning in corpus_warnings:
+                console.print(f"[yellow]{warning}[/yellow]")
+
             # Filter documents by corpus ID - only if the corpus is set
             corpus_docs = []
             gs_docs = []
@@ -1387,30 +1945,6 @@ def list_ingested_documents(pipeline=None):
             # Create filtered list showing only relevant documents
             filtered_docs = corpus_docs + gs_docs
 
-            # Try to check if cloud tracking exists - for informational purposes
-            cloud_tracking_exists = False
-            if cloud_tracking_path:
-                try:
-                    from src.rag.gcs_utils import GcsManager
-
-                    gcs_manager = GcsManager(
-                        project_id=pipeline.project_id, bucket_name=None
-                    )
-
-                    # Just check if the file exists, don't read it
-                    cloud_tracking_exists = gcs_manager.file_exists(cloud_tracking_path)
-                except Exception:
-                    # Ignore errors here, just for informational display
-                    pass
-
-            # Get corpus files from the RAG engine
-            try:
-                corpus_files = pipeline.list_corpus_files()
-                corpus_files = list(corpus_files) if corpus_files else []
-            except Exception as e:
-                console.print(f"[yellow]Could not retrieve corpus files from Vertex AI: {e}[/yellow]")
-                corpus_files = []
-
             # Display tracking information with more details
             status.stop()  # Stop the spinner to show tracking info
 
@@ -1431,7 +1965,6 @@ def list_ingested_documents(pipeline=None):
                 )
 
             if tracking_file:
-                local_exists = os.path.exists(tracking_file)
                 local_status = (
                     "[green]Found[/green]"
                     if local_exists
@@ -1490,12 +2023,13 @@ def list_ingested_documents(pipeline=None):
                 tracking_table.add_column("Document Name", style="green")
                 tracking_table.add_column("Full Path", style="blue")
 
-                # Group documents by prefix for better display
+                # Group documents by prefix for better display, resolving each
+                # document's display filename once while grouping
                 docs_by_prefix = {}
                 for doc in filtered_docs:
                     # Extract prefix (up to the second-to-last path component)
                     path_parts = doc.split('/')
-                    
+
                     if doc.startswith('projects/'):  
                         # For Vertex AI RAG document paths
                         # Format: projects/{project_id}/locations/{location}/ragCorpora/{corpus_id}/ragFiles/{file_id}
@@ -1506,34 +2040,23 @@ def list_ingested_documents(pipeline=None):
                                 prefix = f"Current Corpus Document"
                         else:
                             prefix = "Unknown Corpus Path"
-                    elif len(path_parts) > 4:  # gs://bucket/prefix/filename
-                        prefix = '/'.join(path_parts[:-1]) + '/'
+                        # Use the file ID for a more useful name, falling back to the position
+                        file_id = path_parts[-1] if len(path_parts) >= 7 else ""
                     else:
+                        # gs://bucket/prefix/filename
                         prefix = '/'.join(path_parts[:-1]) + '/'
+                        file_id = None
 
-                    if prefix not in docs_by_prefix:
-                        docs_by_prefix[prefix] = []
-
-                    docs_by_prefix[prefix].append(doc)
+                    entries = docs_by_prefix.setdefault(prefix, [])
+                    if file_id is None:
+                        filename = path_parts[-1]
+                    else:
+                        filename = f"File {file_id[:8]}" if file_id else f"File {len(entries) + 1}"
+                    entries.append((filename, doc))
 
                 # Add rows to table organized by prefix
-                for prefix, docs in docs_by_prefix.items():
-                    for i, doc in enumerate(docs):
-                        # Extract filename from path
-                        if doc.startswith('projects/'):
-                            # For Vertex AI RAG document paths
-                            filename = f"File {i+1}"
-                            # Try to extract file ID for a more useful name
-                            path_parts = doc.split('/')
-                            if len(path_parts) >= 7 and path_parts:
-                                file_id = path_parts[-1]
-                                # Add a safety check for empty file_id
-                                if file_id:
-                                    filename = f"File {file_id[:min(8, len(file_id))]}"
-                        else:
-                            path_parts = doc.split('/')
-                            filename = path_parts[-1] if path_parts else "Unknown"
-
+                for prefix, entries in docs_by_prefix.items():
+                    for i, (filename, doc) in enumerate(entries):
                         tracking_table.add_row(
                             prefix if i == 0 else "",
                             filename,
@@ -1630,7 +2153,7 @@ def display_logs_panel():
     else:
         logs_panel = Panel(
             table,
-            title=f"[bold blue]System Logs[/bold blue] (Level: {logging.getLevelName(logger.getEffectiveLevel())})",
+            title=f"[bold blue]System Logs[/bold blue] (Level: {_current_level_name})",
             border_style="blue",
             padding=(1, 2),
         )
@@ -1638,8 +2161,38 @@ def display_logs_panel():
     console.print(logs_panel)
 
 
-def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: bool = False):
-    """Run the CLI in interactive mode for multiple queries with improved UI."""
+# Fixed sub-command vocabulary, interned once so command parsing compares
+# tokens against shared constants instead of re-lowercasing each one
+_ALL = sys.intern("all")
+_FORCE = sys.intern("force")
+_PREFIX = sys.intern("prefix")
+_REBUILD = sys.intern("rebuild")
+_CLEAR = sys.intern("clear")
+_DETAILED = sys.intern("detailed")
+
+# Minimum number of words required for a query
+MIN_QUERY_WORDS = 3
+
+
+def interactive_mode(
+    use_reranking: bool = True,
+    debug: bool = False,
+    verbose: bool = False,
+    pipeline_future: Optional[Future] = None,
+    stream: bool = True,
+):
+    """
+    Run the CLI in interactive mode for multiple queries with improved UI.
+
+    Args:
+        use_reranking: Whether to use reranking
+        debug: Show debug information
+        verbose: Show verbose output including contexts
+        pipeline_future: Pipeline already being initialized in the background (optional)
+        stream: Show responses as they are generated
+    """
+    from rich.prompt import Prompt
+
     # Show the logo first
     show_logo()
 
@@ -1716,11 +2269,15 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
     # Command history
     history = []
 
-    # Create pipeline once for reuse
+    # Whether the previous input was a command, and the last query run
+    last_was_command = False
+    last_query = None
+
+    # Create pipeline once for reuse, picking up the one started during the splash screen
     pipeline = None
     try:
-        with Status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
-            pipeline = VertexRagPipeline()
+        with maybe_status("[info]Initializing pipeline...[/info]", spinner="dots") as status:
+            pipeline = _resolve_prefetched_pipeline(pipeline_future) or _get_pipeline()
     except Exception as e:
         console.print(f"[error]Error initializing pipeline: {e}[/error]")
 
@@ -1753,7 +2310,6 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
             console.print("[bold green]❯[/bold green] ", end="")
 
             # Get user input - check if the last query was a command
-            last_was_command = getattr(interactive_mode, "last_was_command", False)
             if last_was_command:
                 # Show a helpful indicator that we're in command mode
                 query = Prompt.ask("", default="/")
@@ -1761,7 +2317,7 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
                 query = Prompt.ask("")
 
             # Store whether this is a command for next iteration
-            interactive_mode.last_was_command = query.startswith("/")
+            last_was_command = query.startswith("/")
 
             # Display the query in a styled panel if it's not empty
             if query.strip():
@@ -1788,13 +2344,15 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
             console.print("\n[yellow]Exiting Zero-Day Scout[/yellow]")
             sys.exit(0)
 
-        # Define minimum word requirement for queries
-        MIN_QUERY_WORDS = 3
-
         # Check if it's a command (starts with /)
         is_command = query.startswith("/")
         command = query[1:].lower() if is_command else query.lower()
 
+        # Tokenize commands once: lowercase tokens for keyword checks, raw
+        # tokens for case-sensitive values such as GCS prefixes and paths
+        raw_parts = query[1:].split() if is_command else []
+        parts = tuple(map(str.lower, raw_parts))
+
         # Handle commands with the / prefix
         if is_command and command == "help":
             help_panel = Panel(
@@ -1857,14 +2415,16 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
             continue
 
         if is_command and command == "suggestions":
-            last_query = getattr(interactive_mode, 'last_query', None)
             if last_query:
-                with Status("[suggestion]Generating query suggestions...[/suggestion]", spinner="dots") as status:
-                    suggestions = suggest_query_improvements(last_query)
+                # Only show the spinner when the model actually has to be called
+                suggestions = get_cached_suggestions(last_query)
+                if suggestions is None:
+                    with maybe_status("[suggestion]Generating query suggestions...[/suggestion]", spinner="dots") as status:
+                        suggestions = suggest_query_improvements(last_query)
 
                 if suggestions:
                     suggestion_panel = Panel(
-                        "\n".join(f"[suggestion]{i}. {suggestion}[/suggestion]" for i, suggestion in enumerate(suggestions, 1)),
+                        create_suggestion_grid(suggestions),
                         title="Suggested Query Improvements",
                         border_style="yellow"
                     )
@@ -1900,13 +2460,12 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
 
         # Handle research papers listing
         if is_command and command.startswith("papers"):
-            parts = command.split()
             if len(parts) > 1:
-                if parts[1].lower() == 'detailed':
+                if parts[1] == _DETAILED:
                     list_research_papers(pipeline=pipeline, detailed=True)
                 else:
                     # Assume the second part is a prefix
-                    prefix = parts[1]
+                    prefix = raw_parts[1]
                     list_research_papers(pipeline=pipeline, prefix=prefix)
             else:
                 list_research_papers(pipeline=pipeline)
@@ -1920,7 +2479,7 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
         # Handle corpus recreation command with options
         if is_command and command.startswith("recreate corpus"):
             # Check for the "clear" option
-            clear_tracking = "clear" in command
+            clear_tracking = _CLEAR in parts
             if clear_tracking:
                 console.print("[bold yellow]Will clear all tracking files after recreating corpus[/bold yellow]")
             recreate_corpus(pipeline=pipeline, clear_tracking=clear_tracking)
@@ -1942,13 +2501,12 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
 
         # Handle document ingestion commands
         if is_command and command.startswith("ingest"):
-            parts = command.split()
             if len(parts) > 1:
                 # Check for force option
-                force_reingest = "force" in [p.lower() for p in parts]
+                force_reingest = _FORCE in parts
 
                 # Extract prefix or specific paths
-                if parts[1].lower() == 'all':
+                if parts[1] == _ALL:
                     # Ingest using all configured prefixes
                     console.print("[info]Ingesting documents from all configured prefixes...[/info]")
                     # Ask if user wants to recreate corpus first - only for "ingest all"
@@ -1960,7 +2518,7 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
                         recreate_first=recreate,
                         force_reingest=force_reingest,
                     )
-                elif parts[1].lower() == 'force' and len(parts) > 2 and parts[2].lower() == 'all':
+                elif parts[1] == _FORCE and len(parts) > 2 and parts[2] == _ALL:
                     # Force reingest all documents
                     console.print("[bold yellow]Force reingestion enabled - will reingest all documents[/bold yellow]")
                     # Ask if user wants to recreate corpus first
@@ -1972,13 +2530,13 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
                         recreate_first=recreate,
                         force_reingest=True,
                     )
-                elif parts[1].lower() == 'prefix' and len(parts) > 2:
+                elif parts[1] == _PREFIX and len(parts) > 2:
                     # Find the prefix - it could be after 'force'
                     prefix_idx = 2
-                    if parts[2].lower() == "force" and len(parts) > 3:
+                    if parts[2] == _FORCE and len(parts) > 3:
                         prefix_idx = 3
 
-                    prefix = parts[prefix_idx]
+                    prefix = raw_parts[prefix_idx]
                     console.print(f"[info]Ingesting documents from prefix '{prefix}'...[/info]")
                     ingest_documents(
                         pipeline=pipeline, prefix=prefix, force_reingest=force_reingest
@@ -1987,7 +2545,7 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
                     len(parts) > 2 and parts[2].startswith("gs://")
                 ):
                     # Ingest specific GCS paths - no corpus recreation
-                    paths = [p for p in parts[1:] if p.startswith('gs://')]
+                    paths = [p for p in raw_parts[1:] if p.startswith('gs://')]
                     console.print(f"[info]Ingesting {len(paths)} specific documents...[/info]")
                     ingest_documents(
                         pipeline=pipeline,
@@ -2024,8 +2582,7 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
         # Handle tracking sync command
         if is_command and command.startswith("sync"):
             # Check if it's a rebuild
-            parts = command.split()
-            rebuild = len(parts) > 1 and parts[1].lower() == "rebuild"
+            rebuild = len(parts) > 1 and parts[1] == _REBUILD
             
             console.print("[info]Synchronizing document tracking files...[/info]")
             if rebuild:
@@ -2048,9 +2605,9 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
 
         # If it's not a command, treat it as a query
 
-        # Check if the query meets the minimum word requirement
-        word_count = len(query.split())
-        if word_count < MIN_QUERY_WORDS:
+        # Check if the query meets the minimum word requirement; splitting at most
+        # MIN_QUERY_WORDS times bounds the work for long pasted queries
+        if len(query.split(None, MIN_QUERY_WORDS)) < MIN_QUERY_WORDS:
             console.print(
                 f"[error]Your query is too short. Please use at least {MIN_QUERY_WORDS} words for a meaningful search.[/error]"
             )
@@ -2060,14 +2617,16 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
             continue
 
         # Save the query for suggestions and add to history
-        interactive_mode.last_query = query
+        last_query = query
         history.append(query)
 
         # Process the query
         console.print(f"\n[query]Query: {query}[/query]")
         # Log before query execution
         logger.info(f"Starting RAG query: {query}")
-        response, execution_time, metrics = run_rag_query(query, use_reranking, debug, verbose, update_in_place=True)
+        response, execution_time, metrics = run_rag_query(
+            query, use_reranking, debug, verbose, update_in_place=True, pipeline=pipeline, stream=stream
+        )
         # Log after query completion
         logger.info(
             f"Query completed in {metrics.get('formatted_time', 'unknown time')}"
@@ -2080,36 +2639,8 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
             if context_panel:
                 console.print(context_panel)
 
-        # Display the response in a prominent panel with appropriate coloring
-        # Use yellow for empty responses
-        border_style = "yellow" if metrics.get("is_empty_response", False) else "green"
-        title_color = "yellow" if metrics.get("is_empty_response", False) else "green"
-
-        # Use the pre-calculated formatted time
-        formatted_time = metrics.get("formatted_time", "unknown time")
-        
-        # Extract source citations if contexts are available
-        contexts = metrics.get("contexts", [])
-        source_citations = extract_source_citations(contexts)
-
-        # Combine response with source citations - use proper spacing
-        formatted_response = response
-        if source_citations:
-            # Add a clear separator to distinguish response from sources
-            if not formatted_response.endswith("\n"):
-                formatted_response += "\n"
-            formatted_response += "\n" + "-" * 50 + source_citations
-
-        response_panel = Panel(
-            Markdown(formatted_response),
-            title=f"[bold {title_color}]Response[/bold {title_color}] (completed in [time]{formatted_time}[/time])",
-            border_style=border_style,
-            expand=True,
-            padding=(1, 2)
-        )
-
-        # Display immediately without extra spacing
-        console.print(response_panel)
+        # Display the response in a prominent panel with source citations
+        console.print(create_response_panel(response, metrics))
 
         # Automatically offer suggestions after each query
         console.print("\n[suggestion]Would you like to see suggested query improvements? (y/n)[/suggestion]")
@@ -2120,22 +2651,26 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
             sys.exit(0)
 
         if want_suggestions:
-            with Status("[suggestion]Generating query suggestions...[/suggestion]", spinner="dots") as status:
-                suggestions = suggest_query_improvements(query)
+            # Only show the spinner when the model actually has to be called
+            suggestions = get_cached_suggestions(query)
+            if suggestions is None:
+                with maybe_status("[suggestion]Generating query suggestions...[/suggestion]", spinner="dots") as status:
+                    suggestions = suggest_query_improvements(query)
 
             if suggestions:
-                console.print("\n[suggestion]Suggested query improvements:[/suggestion]")
-                for i, suggestion in enumerate(suggestions, 1):
-                    console.print(f"[suggestion]{i}. {suggestion}[/suggestion]")
-
-                # Allow user to select a suggestion
-                console.print("\n[suggestion]Enter a [bold]number[/bold] to use a suggestion, or press Enter to continue[/suggestion]")
+                # Render the menu and the selection hint as one block
+                console.print(Group(
+                    "\n[suggestion]Suggested query improvements:[/suggestion]",
+                    create_suggestion_grid(suggestions),
+                    # Allow user to select a suggestion
+                    "\n[suggestion]Enter a [bold]number[/bold] to use a suggestion, or press Enter to continue[/suggestion]",
+                ))
                 try:
                     selection = Prompt.ask("")
 
                     if selection.isdigit() and 1 <= int(selection) <= len(suggestions):
                         selected_query = suggestions[int(selection) - 1]
-                        interactive_mode.last_query = selected_query
+                        last_query = selected_query
                         history.append(selected_query)
 
                         console.print(f"\n[info]Processing suggested query: [query]{selected_query}[/query][/info]")
@@ -2146,7 +2681,10 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
                             logger.info(
                                 f"Starting RAG query with suggested query: {selected_query}"
                             )
-                            response, execution_time, metrics = run_rag_query(selected_query, use_reranking, debug, verbose, update_in_place=True)
+                            response, execution_time, metrics = run_rag_query(
+                                selected_query, use_reranking, debug, verbose,
+                                update_in_place=True, pipeline=pipeline, stream=stream,
+                            )
                             # Log after query completion
                             logger.info(
                                 f"Suggested query completed in {metrics.get('formatted_time', 'unknown time')}"
@@ -2163,33 +2701,8 @@ def interactive_mode(use_reranking: bool = True, debug: bool = False, verbose: b
                             if context_panel:
                                 console.print(context_panel)
 
-                        # Display the response in a prominent panel with appropriate coloring
-                        # Use yellow for empty responses
-                        border_style = "yellow" if metrics.get("is_empty_response", False) else "green"
-                        title_color = "yellow" if metrics.get("is_empty_response", False) else "green"
-
-                        # Extract source citations if contexts are available
-                        contexts = metrics.get("contexts", [])
-                        source_citations = extract_source_citations(contexts)
-
-                        # Combine response with source citations - use proper spacing
-                        formatted_response = response
-                        if source_citations:
-                            # Add a clear separator to distinguish response from sources
-                            if not formatted_response.endswith("\n"):
-                                formatted_response += "\n"
-                            formatted_response += "\n" + "-" * 50 + source_citations
-
-                        response_panel = Panel(
-                            Markdown(formatted_response),
-                            title=f"[bold {title_color}]Response[/bold {title_color}] (completed in [time]{metrics.get('formatted_time', 'unknown time')}[/time])",
-                            border_style=border_style,
-                            expand=True,
-                            padding=(1, 2)
-                        )
-
-                        # Display immediately without extra spacing
-                        console.print(response_panel)
+                        # Display the response in a prominent panel with source citations
+                        console.print(create_response_panel(response, metrics))
                 except KeyboardInterrupt:
                     console.print("\n[yellow]Exiting Zero-Day Scout[/yellow]")
                     sys.exit(0)
@@ -2211,15 +2724,62 @@ LOGO_ART = """
 ╚══════╝ ╚═════╝ ╚═════╝  ╚═════╝    ╚═╝   
 """
 
+# Static logo renderables, built once and reused by show_logo and the splash screen.
+# They are styled Text rather than markup strings, so repaints skip the markup parser.
+_LOGO_TEXT = Text(f"\n{LOGO_ART}", style="bold cyan")
+_TAGLINE_TEXT = Text("Vertex AI RAG Engine CLI", style="bold blue")
+_LOGO_TAGLINE = Align.center(_TAGLINE_TEXT)
+_SPLASH_LOGO = Align.center(Text(LOGO_ART, style="bold cyan"), vertical="middle")
+_SPLASH_TAGLINE = Align.center(_TAGLINE_TEXT, vertical="middle")
+_SPLASH_FOOTER = Align.center(Text("Press CTRL+C to exit", style="dim"), vertical="middle")
+
+
+@lru_cache(maxsize=4)
+def _logo_segments(width: int) -> "Segments":
+    """
+    Render the logo and tagline once per console width into plain segments.
+
+    Args:
+        width: Console width the tagline is centered in
+
+    Returns:
+        Segments that replay the rendered logo without restyling it
+    """
+    from rich.segment import Segment, Segments
+
+    lines = console.render_lines(
+        Group(_LOGO_TEXT, _LOGO_TAGLINE, Text("")),  # Add empty line after logo
+        console.options.update_width(width),
+        pad=False,
+    )
+    segments = []
+    for line in lines:
+        segments.extend(line)
+        segments.append(Segment.line())
+    return Segments(segments)
+
+
 def show_logo():
     """Show the logo with proper spacing to ensure it's visible."""
-    console.print(f"\n[bold cyan]{LOGO_ART}[/bold cyan]")
-    console.print(Align.center("[bold blue]Vertex AI RAG Engine CLI[/bold blue]"))
-    console.print("")  # Add empty line after logo
+    console.print(_logo_segments(console.width))
+
 
+# Minimum time the splash screen is shown, and how long each loading message stays up
+SPLASH_MIN_SECONDS = 0.2
+SPLASH_STEP_SECONDS = 0.4
+
+
+def show_splash_screen(ready_event: Optional[threading.Event] = None):
+    """
+    Display a splash screen until startup work has finished.
+
+    Args:
+        ready_event: Event set when background startup work completes (optional).
+            The loading messages advance while it is pending; without an event
+            the splash is only shown for SPLASH_MIN_SECONDS.
+    """
+    from rich.layout import Layout
 
-def show_splash_screen():
-    """Display a splash screen with animation."""
     # Create fancy splash screen with more space for the logo
     splash = Layout()
     splash.split_column(
@@ -2229,22 +2789,38 @@ def show_splash_screen():
         Layout(name="footer", size=1),
     )
     
-    splash["logo"].update(Align.center(f"[bold cyan]{LOGO_ART}[/bold cyan]", vertical="middle"))
-    splash["tagline"].update(Align.center("[bold blue]Vertex AI RAG Engine CLI[/bold blue]", vertical="middle"))
-    splash["footer"].update(Align.center("[dim]Press CTRL+C to exit[/dim]", vertical="middle"))
+    splash["logo"].update(_SPLASH_LOGO)
+    splash["tagline"].update(_SPLASH_TAGLINE)
+    splash["footer"].update(_SPLASH_FOOTER)
     
     loading_steps = [
         "Initializing environment...",
         "Loading configuration...",
         "Preparing RAG engine...",
-        "Ready!"
     ]
     
     try:
         with Live(splash, refresh_per_second=10, console=console) as live:
-            for step in loading_steps:
-                splash["loading"].update(Align.center(f"[yellow]{step}[/yellow]", vertical="middle"))
-                time.sleep(0.8)  # Longer delay to keep logo visible
+            # Advance the loading message while startup work is still running
+            start = time.monotonic()
+            shown_step = None
+            while True:
+                elapsed = time.monotonic() - start
+                ready = ready_event is None or ready_event.is_set()
+                if ready and elapsed >= SPLASH_MIN_SECONDS:
+                    break
+
+                step = min(int(elapsed / SPLASH_STEP_SECONDS), len(loading_steps) - 1)
+                if step != shown_step:
+                    splash["loading"].update(
+                        Align.center(f"[yellow]{loading_steps[step]}[/yellow]", vertical="middle")
+                    )
+                    shown_step = step
+
+                if ready_event is not None:
+                    ready_event.wait(0.05)
+                else:
+                    time.sleep(0.05)
             
             # Keep the logo visible with "Press any key to continue..." message
             splash["loading"].update(Align.center("[green]Ready![/green]", vertical="middle"))
@@ -2265,23 +2841,47 @@ def show_splash_screen():
     console.print("\n" + "=" * 80 + "\n")
 
 
+# Common phrases that indicate no information was found
+EMPTY_RESPONSE_INDICATORS = (
+    "i don't have enough information",
+    "no relevant information found",
+    "cannot answer",
+    "don't have sufficient information",
+    "unable to provide",
+    "no information available",
+    "no specific information",
+    "no data found",
+    "not enough context",
+)
+
+# All indicators combined into one case-insensitive alternation so a response
+# is scanned once without building a lowercased copy
+_EMPTY_RESPONSE_RE = re.compile(
+    "|".join(map(re.escape, EMPTY_RESPONSE_INDICATORS)), re.IGNORECASE
+)
+
+# Refusals state that no information was found up front, so only the start
+# of the response needs to be scanned
+EMPTY_RESPONSE_SCAN_CHARS = 512
+
+
 def is_empty_response(response: str) -> bool:
     """Check if a response indicates no information was found."""
-    # Common phrases that indicate no information was found
-    empty_indicators = [
-        "i don't have enough information",
-        "no relevant information found",
-        "cannot answer",
-        "don't have sufficient information",
-        "unable to provide", 
-        "no information available",
-        "no specific information",
-        "no data found",
-        "not enough context"
-    ]
-    
-    response_lower = response.lower()
-    return any(indicator in response_lower for indicator in empty_indicators)
+    return _EMPTY_RESPONSE_RE.search(response, 0, EMPTY_RESPONSE_SCAN_CHARS) is not None
+
+
+# Matches the pipeline output lines worth reporting; the group name of each
+# alternative is the info key it fills
+_PIPELINE_OUTPUT_RE = re.compile(
+    r"^.*?(?:"
+    r"Using reranking with model:(?P<reranker_model>.*)"
+    r"|Response type:(?P<response_type>.*)"
+    r"|Contexts type:(?P<contexts_type>.*)"
+    r"|Found\s+(?P<context_count>\d+)\s+results"
+    r"|(?P<error>Error:)"
+    r").*$",
+    re.MULTILINE,
+)
 
 
 def parse_pipeline_output(output: str, use_reranking: bool) -> Dict[str, Any]:
@@ -2304,49 +2904,87 @@ def parse_pipeline_output(output: str, use_reranking: bool) -> Dict[str, Any]:
         "errors": []
     }
     
-    # Parse output line by line
-    for line in output.strip().split("\n"):
-        if not line:
-            continue
-            
-        if "Using reranking with model:" in line:
-            info["reranker_model"] = line.split(":", 1)[1].strip()
-        elif "Response type:" in line:
-            info["response_type"] = line.split(":", 1)[1].strip()
-        elif "Contexts type:" in line:
-            info["contexts_type"] = line.split(":", 1)[1].strip()
-        elif "Found" in line and "results" in line:
-            try:
-                count = int(line.split()[1])
-                info["context_count"] = count
-            except (ValueError, IndexError):
-                pass
-        elif "Error:" in line:
-            info["errors"].append(line.strip())
+    # Scan all lines in one pass, dispatching on whichever marker matched
+    for match in _PIPELINE_OUTPUT_RE.finditer(output):
+        field = match.lastgroup
+        if field == "context_count":
+            info["context_count"] = int(match.group(field))
+        elif field == "error":
+            info["errors"].append(match.group(0).strip())
+        else:
+            info[field] = match.group(field).strip()
     
     return info
 
 
+# Splits a gs:// URI into its bucket and object path
+_GCS_URI_RE = re.compile(r"^gs://([^/]+)/?(.*)$")
+
+
+@lru_cache(maxsize=1024)
+def _gcs_to_https(uri: str) -> Optional[str]:
+    """
+    Convert a gs:// URI into a Cloud Storage browser URL.
+
+    Args:
+        uri: The GCS URI to convert
+
+    Returns:
+        The https URL, or None if the URI is not a gs:// URI
+    """
+    match = _GCS_URI_RE.match(uri)
+    if not match:
+        return None
+    bucket_name, object_path = match.groups()
+    return f"https://storage.cloud.google.com/{bucket_name}/{quote(object_path)}"
+
+
+# Attribute getters tried in order to find a context's text, and a corpus
+# file's document path, across the object shapes the RAG engine returns
+_CONTEXT_TEXT_GETTERS = (
+    operator.attrgetter("text"),
+    operator.attrgetter("content"),
+    operator.attrgetter("chunk.data"),
+)
+_CORPUS_FILE_PATH_GETTERS = (
+    operator.attrgetter("gcs_uri"),
+    operator.attrgetter("uri"),
+    operator.attrgetter("file_path"),
+    operator.attrgetter("name"),
+)
+
+
+def _first_attr(obj: Any, getters: Tuple[Any, ...]) -> Any:
+    """Return the value from the first getter whose attribute exists, or None."""
+    for getter in getters:
+        try:
+            return getter(obj)
+        except AttributeError:
+            continue
+    return None
+
+
+# Number of contexts shown in a preview, and characters shown per context
+CONTEXT_PREVIEW_LIMIT = 3
+CONTEXT_PREVIEW_CHARS = 300
+
+
 def format_context_preview(contexts: List[Any]) -> str:
     """Format retrieved contexts for display in debug mode."""
     if not contexts:
         return "[dim italic]No contexts retrieved[/dim italic]"
         
     preview = []
-    for i, ctx in enumerate(contexts[:3], 1):  # Show first 3 contexts
+    remaining_contexts = iter(contexts)
+    # Show only the first few contexts without copying the list
+    for i, ctx in enumerate(islice(remaining_contexts, CONTEXT_PREVIEW_LIMIT), 1):
         # Try different possible attributes based on context object structure
-        content = None
-        if hasattr(ctx, "text"):
-            content = ctx.text
-        elif hasattr(ctx, "content"):
-            content = ctx.content
-        elif hasattr(ctx, "chunk") and hasattr(ctx.chunk, "data"):
-            content = ctx.chunk.data
+        content = _first_attr(ctx, _CONTEXT_TEXT_GETTERS)
             
         if content:
             # Truncate long texts
-            if len(content) > 300:
-                content = content[:300] + "..."
+            if len(content) > CONTEXT_PREVIEW_CHARS:
+                content = content[:CONTEXT_PREVIEW_CHARS] + "..."
             
             # Format with metadata if available
             if hasattr(ctx, "metadata"):
@@ -2365,23 +3003,20 @@ def format_context_preview(contexts: List[Any]) -> str:
                     gcs_uri = source
                 
                 source_info = source
-                if gcs_uri:
+                if gcs_uri and isinstance(gcs_uri, str):
                     # Convert the GCS URI to a hyperlink if possible
-                    if gcs_uri.startswith("gs://"):
-                        # Split URL and add safety checks
-                        uri_parts = gcs_uri.split("/")
-                        if len(uri_parts) > 2:
-                            bucket_name = uri_parts[2]
-                            object_path = "/".join(uri_parts[3:] if len(uri_parts) > 3 else [])
-                        gcs_url = f"https://storage.cloud.google.com/{bucket_name}/{object_path}"
+                    gcs_url = _gcs_to_https(gcs_uri)
+                    if gcs_url:
                         source_info = f"[link={gcs_url}]{source}[/link]"
                 
                 preview.append(f"[bold]Context {i}[/bold] (from {source_info}):\n[dim]{content}[/dim]\n")
             else:
                 preview.append(f"[bold]Context {i}[/bold]:\n[dim]{content}[/dim]\n")
     
-    if len(contexts) > 3:
-        preview.append(f"[dim italic]...and {len(contexts) - 3} more contexts[/dim italic]")
+    # Whatever the preview loop didn't consume is the overflow
+    more_count = sum(1 for _ in remaining_contexts)
+    if more_count:
+        preview.append(f"[dim italic]...and {more_count} more contexts[/dim italic]")
         
     if not preview:
         return "[dim italic]Contexts retrieved but content not accessible[/dim italic]"
@@ -2389,92 +3024,86 @@ def format_context_preview(contexts: List[Any]) -> str:
     return "\n".join(preview)
 
 
+def _ellipsize(text: str, limit: int) -> str:
+    """Truncate text to at most limit characters, ending in '...' when cut."""
+    return text if len(text) <= limit else f"{text[:limit - 3]}..."
+
+
+def _format_citation(ctx: Any, index: int) -> Tuple[str, str]:
+    """
+    Format the citation for a single retrieved context.
+
+    Args:
+        ctx: Context object returned by the RAG engine
+        index: 1-based position of the context, used for generic labels
+
+    Returns:
+        Tuple of (source name, citation line)
+    """
+    # Get source display name and URI (from the actual context structure)
+    source_name = getattr(ctx, "source_display_name", None)
+    source_uri = getattr(ctx, "source_uri", None)
+    if not isinstance(source_uri, str):
+        source_uri = None
+
+    # Extract filename from URI if no display name
+    if not source_name and source_uri:
+        source_name = source_uri.rsplit('/', 1)[-1] or "Unknown"
+
+    # If we couldn't get a source name or URI, try to create a generic one
+    if not source_name:
+        text = getattr(ctx, "text", None)
+        # Create a preview from the text, or fall back to a completely generic label
+        source_name = f"Document containing '{text.strip()[:30]}...'" if text else f"Context {index}"
+
+    # Format source citation - simpler format without Rich markup to ensure compatibility
+    if source_uri and source_uri.startswith("gs://"):
+        try:
+            # Build the browser URL; problematic chars in the path are quoted
+            gcs_url = _gcs_to_https(source_uri)
+            return source_name, f"Document: {_ellipsize(source_name, 30)} (URL: {gcs_url})"
+        except Exception:
+            # If URL creation fails, just use the source name
+            pass
+    return source_name, f"Document: {_ellipsize(source_name, 40)}"
+
+
 def extract_source_citations(contexts: List[Any]) -> str:
     """Extract source citations from contexts for display with the response."""
     if not contexts:
         return ""
-    
-    # Extract unique sources with their hyperlinks
-    sources = []
-    seen_sources = set()
-    
-    for ctx in contexts:
-        # Based on the observed context structure, extract relevant information
-        source_name = None
-        source_uri = None
-        
-        # Get source display name (from the actual context structure)
-        if hasattr(ctx, "source_display_name") and ctx.source_display_name:
-            source_name = ctx.source_display_name
-        
-        # Get source URI (from the actual context structure)
-        if hasattr(ctx, "source_uri") and ctx.source_uri:
-            source_uri = ctx.source_uri
-            
-            # Extract filename from URI if no display name
-            if not source_name and isinstance(source_uri, str):
-                uri_parts = source_uri.split('/')
-                if uri_parts and len(uri_parts) > 0:
-                    source_name = uri_parts[-1] if uri_parts[-1] else "Unknown"
-        
-        # If we couldn't get a source name or URI, try to create a generic one
-        if not source_name:
-            # Use a generic name based on context content
-            if hasattr(ctx, "text") and ctx.text:
-                # Create a preview from the text
-                preview = ctx.text.strip()[:30]
-                source_name = f"Document containing '{preview}...'"
-            else:
-                # Completely generic label
-                source_name = f"Context {len(sources) + 1}"
-        
-        # Skip if this source has already been seen
-        if source_name in seen_sources:
-            continue
-            
-        seen_sources.add(source_name)
-        
-        # Format source citation - simpler format without Rich markup to ensure compatibility
-        if source_uri and isinstance(source_uri, str) and source_uri.startswith("gs://"):
-            # Create hyperlink to GCS bucket
-            try:
-                # Split URL and add safety checks
-                uri_parts = source_uri.split("/")
-                if len(uri_parts) > 2:
-                    bucket_name = uri_parts[2]
-                    object_path = "/".join(uri_parts[3:] if len(uri_parts) > 3 else [])
-                # Remove spaces or problematic chars in URL
-                object_path = object_path.replace(" ", "%20")
-                gcs_url = f"https://storage.cloud.google.com/{bucket_name}/{object_path}"
-                
-                # Add formatted citation - use a more explicit source reference
-                display_name = source_name
-                if len(display_name) > 30:
-                    display_name = display_name[:27] + "..."
-                    
-                sources.append(f"Document: {display_name} (URL: {gcs_url})")
-            except Exception as e:
-                # If URL creation fails, just use the source name
-                display_name = source_name
-                if len(display_name) > 40:
-                    display_name = display_name[:37] + "..."
-                sources.append(f"Document: {display_name}")
-        else:
-            # Just add the source name without link
-            display_name = source_name
-            if len(display_name) > 40:
-                display_name = display_name[:37] + "..."
-            sources.append(f"Document: {display_name}")
-    
+
+    # Keep the first citation for each source name; dicts preserve first-seen order
+    sources: Dict[str, str] = {}
+    for source_name, citation in map(_format_citation, contexts, count(1)):
+        sources.setdefault(source_name, citation)
+
     if not sources:
         return ""
-        
+
     # Format the citations section in a plain-text way that will survive any rendering issues
-    citations = "\n\nSources:\n"
-    for i, source in enumerate(sources, 1):
-        citations += f"{i}. {source}\n"
-        
-    return citations
+    parts = ["\n\nSources:"]
+    parts.extend(f"{i}. {source}" for i, source in enumerate(sources.values(), 1))
+    parts.append("")
+    return "\n".join(parts)
+
+
+def _write_json_file(path: str, data: Any) -> None:
+    """
+    Write data to a local JSON file with 2-space indentation.
+
+    Uses orjson when it is installed and falls back to the standard json module.
+
+    Args:
+        path: Local file path to write
+        data: JSON serializable data
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
 
 
 def graceful_exit(signum=None, frame=None):
@@ -2504,13 +3133,13 @@ def sync_tracking_files(verbose=False, rebuild=False):
 
         status_obj = None
         if verbose:
-            status_obj = Status(
+            status_obj = maybe_status(
                 "[info]Synchronizing document tracking files...[/info]", spinner="dots"
             )
             status_obj.start()
 
         # Initialize pipeline to get access to tracking information
-        pipeline = VertexRagPipeline()
+        pipeline = _get_pipeline()
         
         # First try to get the actual corpus contents if rebuild is requested
         if rebuild:
@@ -2534,40 +3163,53 @@ def sync_tracking_files(verbose=False, rebuild=False):
                                 setattr(pipeline, attr, os.path.join(base_dir, ".document_metadata.json"))
                         logger.info(f"Initialized missing {attr} attribute")
                     
-                try:
-                    corpus_files = pipeline.list_corpus_files()
-                    
-                    # Extract document paths from corpus files
-                    corpus_docs = []
-                    for file_info in corpus_files:
-                        # Extract file paths from the corpus response
-                        if hasattr(file_info, 'gcs_uri'):
-                            corpus_docs.append(file_info.gcs_uri)
-                        elif hasattr(file_info, 'uri'):
-                            corpus_docs.append(file_info.uri)
-                        elif hasattr(file_info, 'file_path'):
-                            corpus_docs.append(file_info.file_path)
-                        elif hasattr(file_info, 'name'):
-                            corpus_docs.append(file_info.name)
-                except Exception as list_error:
-                    logger.error(f"Error listing corpus files: {list_error}")
-                    if verbose and status_obj:
-                        status_obj.update("[info]Could not list corpus files, falling back to GCS bucket listing...[/info]")
-                    
-                    # Fallback to listing files in the GCS bucket
-                    from src.rag.gcs_utils import GcsManager
-                    gcs_manager = GcsManager(project_id=pipeline.project_id, bucket_name=None)
-                    corpus_docs = []
-                    
-                    # Use document prefixes from config
-                    for prefix in pipeline.document_prefixes:
-                        paths = gcs_manager.list_files(prefix=prefix)
-                        corpus_docs.extend(paths)
-                        logger.info(f"Found {len(paths)} documents with prefix '{prefix}'")
+                # List the corpus and the fallback GCS prefixes concurrently so a
+                # corpus listing failure doesn't cost a second round of requests
+                prefixes = pipeline.document_prefixes
+                with ThreadPoolExecutor(max_workers=len(prefixes) + 1) as executor:
+                    corpus_future = executor.submit(pipeline.list_corpus_files)
+
+                    prefix_futures = {}
+                    gcs_error = None
+                    try:
+                        gcs_manager = _get_gcs_manager(pipeline.project_id)
+                        prefix_futures = {
+                            executor.submit(gcs_manager.list_files, prefix=prefix): prefix
+                            for prefix in prefixes
+                        }
+                    except Exception as e:
+                        # Only fatal if the corpus listing fails as well
+                        gcs_error = e
+
+                    try:
+                        corpus_files = corpus_future.result()
                         
-                    logger.info(f"Using GCS bucket listing as fallback: found {len(corpus_docs)} documents")
-                    if verbose and status_obj:
-                        status_obj.update(f"[info]Found {len(corpus_docs)} documents in GCS bucket[/info]")
+                        # Extract document paths from corpus files
+                        corpus_docs = []
+                        for file_info in corpus_files:
+                            # Extract file paths from the corpus response
+                            doc_path = _first_attr(file_info, _CORPUS_FILE_PATH_GETTERS)
+                            if doc_path is not None:
+                                corpus_docs.append(doc_path)
+                    except Exception as list_error:
+                        logger.error(f"Error listing corpus files: {list_error}")
+                        if verbose and status_obj:
+                            status_obj.update("[info]Could not list corpus files, falling back to GCS bucket listing...[/info]")
+                        
+                        # Fallback to the files listed in the GCS bucket
+                        if gcs_error:
+                            raise gcs_error
+                        corpus_docs = []
+                        
+                        # Use document prefixes from config
+                        for future in as_completed(prefix_futures):
+                            paths = future.result()
+                            corpus_docs.extend(paths)
+                            logger.info(f"Found {len(paths)} documents with prefix '{prefix_futures[future]}'")
+                            
+                        logger.info(f"Using GCS bucket listing as fallback: found {len(corpus_docs)} documents")
+                        if verbose and status_obj:
+                            status_obj.update(f"[info]Found {len(corpus_docs)} documents in GCS bucket[/info]")
                         
                 # Save to both cloud and local
                 if corpus_docs:
@@ -2576,15 +3218,13 @@ def sync_tracking_files(verbose=False, rebuild=False):
                     
                     # Save to cloud first
                     if hasattr(pipeline, "cloud_tracking_path") and pipeline.cloud_tracking_path:
-                        from src.rag.gcs_utils import GcsManager
-                        gcs_manager = GcsManager(project_id=pipeline.project_id, bucket_name=None)
+                        gcs_manager = _get_gcs_manager(pipeline.project_id)
                         gcs_manager.write_json(pipeline.cloud_tracking_path, corpus_docs)
                         logger.info(f"Updated cloud tracking with {len(corpus_docs)} documents from corpus")
                     
                     # Then save to local
                     if hasattr(pipeline, "tracking_file") and pipeline.tracking_file:
-                        with open(pipeline.tracking_file, "w") as f:
-                            json.dump(corpus_docs, f, indent=2)
+                        _write_json_file(pipeline.tracking_file, corpus_docs)
                         logger.info(f"Updated local tracking with {len(corpus_docs)} documents from corpus")
                         
                     sync_status["success"] = True
@@ -2612,16 +3252,12 @@ def sync_tracking_files(verbose=False, rebuild=False):
         if hasattr(pipeline, "cloud_tracking_path") and pipeline.cloud_tracking_path:
             # Get the cloud tracking file
             try:
-                from src.rag.gcs_utils import GcsManager
-
-                gcs_manager = GcsManager(
-                    project_id=pipeline.project_id, bucket_name=None
-                )
+                gcs_manager = _get_gcs_manager(pipeline.project_id)
 
-                # Check if cloud tracking exists
-                if gcs_manager.file_exists(pipeline.cloud_tracking_path):
-                    # Get the cloud data
-                    cloud_docs = gcs_manager.read_json(pipeline.cloud_tracking_path)
+                # Get the cloud data - read_json returns None if the file doesn't
+                # exist, so a separate existence check would be a wasted round trip
+                cloud_docs = gcs_manager.read_json(pipeline.cloud_tracking_path)
+                if cloud_docs is not None:
                     if cloud_docs:
                         logger.info(
                             f"Found {len(cloud_docs)} documents in cloud tracking"
@@ -2635,8 +3271,7 @@ def sync_tracking_files(verbose=False, rebuild=False):
                         ):
                             try:
                                 local_path = pipeline.tracking_file
-                                with open(local_path, "w") as f:
-                                    json.dump(cloud_docs, f, indent=2)
+                                _write_json_file(local_path, cloud_docs)
                                 logger.info(
                                     f"Successfully synchronized {len(cloud_docs)} documents to local tracking file"
                                 )
@@ -2688,61 +3323,54 @@ def sync_tracking_files(verbose=False, rebuild=False):
     return sync_status["success"], sync_status["message"], sync_status["doc_count"]
 
 
-def main():
-    """Main entry point for the CLI utility."""
-    # Default to WARNING level initially
-    logger.setLevel(logging.WARNING)
-
-    # Log application startup
-    logger.warning("Starting Zero-Day Scout CLI application")
-
-    # Parse command line arguments first to check for verbose flag
-    parser = argparse.ArgumentParser(description="Zero-Day Scout RAG Query CLI")
+def _add_query_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments for running a single query."""
+    parser.add_argument("--query", "-q", help="Query to process")
+    parser.add_argument("--suggest", "-s", action="store_true", help="Suggest query improvements")
     parser.add_argument(
-        "--debug", "-d", action="store_true", help="Show debug information"
+        "--no-prefetch",
+        action="store_true",
+        help="Don't initialize the pipeline in the background during startup",
     )
+    parser.add_argument("--no-stream", action="store_true", help="Show the response only once it is complete")
+    parser.add_argument("--no-cache", action="store_true", help="Always run the query instead of reusing a cached response")
+    parser.add_argument("--daemon", action="store_true", help="Serve queries from a resident process for faster --query runs")
+    parser.add_argument("--no-daemon", action="store_true", help="Run the query in this process even if a daemon is running")
     parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Show verbose output including contexts",
+        "--cache-threshold",
+        type=float,
+        default=0.95,
+        help="Minimum similarity to an earlier query for reusing its response (default: 0.95)",
     )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        default=86400,
+        help="Seconds a cached response stays valid (default: 86400)",
+    )
+    parser.add_argument("--clear-cache", action="store_true", help="Clear cached query responses")
 
-    # Parse arguments only to check for verbose/debug flags
-    # We'll do a full parse later
-    try:
-        args, _ = parser.parse_known_args()
-        verbose_startup = args.debug or args.verbose
-    except:
-        verbose_startup = False
-
-    # Synchronize tracking files at startup
-    sync_result = sync_tracking_files(verbose=verbose_startup)
-
-    # Set the verbose flag based on the sync result for debugging
-    if sync_result and verbose_startup:
-        success, message, doc_count = sync_result
-        if doc_count > 0:
-            console.print(f"[info]Ready with {doc_count} tracked documents.[/info]")
 
-    # Set up signal handlers for graceful exit
-    import signal
-    signal.signal(signal.SIGINT, graceful_exit)  # Handle Ctrl+C
-
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="Zero-Day Scout RAG Query CLI")
-    parser.add_argument("--query", "-q", help="Query to process")
+def _add_common_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments shared by every command family."""
     parser.add_argument("--no-reranking", action="store_true", help="Disable reranking (not recommended)")
     # For backward compatibility
-    parser.add_argument("--reranking", "-r", action="store_true", help=argparse.SUPPRESS)
-    parser.add_argument("--suggest", "-s", action="store_true", help="Suggest query improvements")
+    parser.add_argument("--reranking", "-r", action="store_true", default=False, help=argparse.SUPPRESS)
     parser.add_argument("--no-splash", action="store_true", help="Skip splash screen")
     parser.add_argument("--debug", "-d", action="store_true", help="Show debug information")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show verbose output including contexts")
+
+
+def _add_listing_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments for listing research papers and ingested documents."""
     parser.add_argument("--papers", action="store_true", help="List research papers in GCS")
     parser.add_argument("--papers-detailed", action="store_true", help="List research papers with detailed information")
     parser.add_argument("--papers-prefix", help="List research papers with the specified prefix")
     parser.add_argument("--ingested", action="store_true", help="List ingested documents")
+
+
+def _add_ingest_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments for ingestion and corpus management."""
     parser.add_argument("--ingest-all", action="store_true", help="Ingest documents from all configured prefixes")
     parser.add_argument("--ingest-prefix", help="Ingest documents from the specified prefix")
     parser.add_argument("--ingest-paths", nargs='+', help="Ingest specific document paths (space-separated list of gs:// URLs)")
@@ -2752,18 +3380,222 @@ def main():
         help="Force reingestion of documents even if they're in the tracking list",
     )
     parser.add_argument("--recreate-before-ingest", action="store_true", help="Recreate the corpus before ingestion")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=10,
+        help="Number of document prefixes listed in parallel during ingestion (default: 10)",
+    )
     parser.add_argument("--recreate-corpus", action="store_true", help="Drop and recreate the RAG corpus")
+
+
+# Argument groups for each command family, in --help order
+_ARGUMENT_GROUPS = {
+    "query": _add_query_arguments,
+    "common": _add_common_arguments,
+    "listing": _add_listing_arguments,
+    "ingest": _add_ingest_arguments,
+}
+
+# Flags that select a command family; the common flags are valid with any of them
+_COMMAND_FAMILY_FLAGS = {
+    "--query": "query",
+    "-q": "query",
+    "--suggest": "query",
+    "-s": "query",
+    "--no-prefetch": "query",
+    "--no-stream": "query",
+    "--no-cache": "query",
+    "--daemon": "query",
+    "--no-daemon": "query",
+    "--cache-threshold": "query",
+    "--cache-ttl": "query",
+    "--clear-cache": "query",
+    "--papers": "listing",
+    "--papers-detailed": "listing",
+    "--papers-prefix": "listing",
+    "--ingested": "listing",
+    "--ingest-all": "ingest",
+    "--ingest-prefix": "ingest",
+    "--ingest-paths": "ingest",
+    "--force": "ingest",
+    "--recreate-before-ingest": "ingest",
+    "--concurrency": "ingest",
+    "--recreate-corpus": "ingest",
+}
+_COMMON_FLAGS = frozenset(
+    ("--no-reranking", "--reranking", "-r", "--no-splash", "--debug", "-d", "--verbose", "-v")
+)
+
+# Value of every parsed argument when its group is not registered, so the
+# namespace has the same shape whichever parser handled the command line
+_ARGUMENT_DEFAULTS = {
+    "query": None,
+    "suggest": False,
+    "no_prefetch": False,
+    "no_stream": False,
+    "no_cache": False,
+    "daemon": False,
+    "no_daemon": False,
+    "cache_threshold": 0.95,
+    "cache_ttl": 86400,
+    "clear_cache": False,
+    "papers": False,
+    "papers_detailed": False,
+    "papers_prefix": None,
+    "ingested": False,
+    "ingest_all": False,
+    "ingest_prefix": None,
+    "ingest_paths": None,
+    "force": False,
+    "recreate_before_ingest": False,
+    "concurrency": 10,
+    "recreate_corpus": False,
+}
+
+
+def _sniff_command_family(argv: List[str]) -> Optional[str]:
+    """
+    Detect which command family the command line asks for without parsing it.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        "query", "listing", "ingest" or "interactive", or None when the full
+        parser is needed (--help, unknown or abbreviated flags, or flags from
+        more than one family)
+    """
+    family = "interactive"
+    for token in argv:
+        if not token.startswith("-"):
+            # Option value
+            continue
+        flag = token.split("=", 1)[0]
+        if flag in _COMMON_FLAGS:
+            continue
+        token_family = _COMMAND_FAMILY_FLAGS.get(flag)
+        if token_family is None or family not in ("interactive", token_family):
+            return None
+        family = token_family
+    return family
+
+
+def build_arg_parser(family: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the command-line parser.
+
+    Args:
+        family: Command family from _sniff_command_family; only its arguments
+            and the common ones are registered. None builds the full parser.
+
+    Returns:
+        Configured ArgumentParser
+    """
+    parser = argparse.ArgumentParser(description="Zero-Day Scout RAG Query CLI")
+    parser.set_defaults(**_ARGUMENT_DEFAULTS)
+    for group, add_arguments in _ARGUMENT_GROUPS.items():
+        if family is None or group in (family, "common"):
+            add_arguments(parser)
+    return parser
+
+
+def main():
+    """Main entry point for the CLI utility."""
+    from rich.prompt import Prompt
+
+    # Default to WARNING level initially
+    logger.setLevel(logging.WARNING)
+
+    # Log application startup
+    logger.warning("Starting Zero-Day Scout CLI application")
+
+    # Parse command line arguments once; --help exits here before any startup work.
+    # Only the arguments for the requested command family are registered.
+    parser = build_arg_parser(_sniff_command_family(sys.argv[1:]))
     args = parser.parse_args()
 
+    if args.clear_cache:
+        for cache in (_open_response_cache(), _open_semantic_cache()):
+            if cache is not None:
+                cache.clear()
+        console.print("[green]Cleared cached query responses[/green]")
+        if not args.query:
+            return 0
+
+    if args.daemon:
+        set_log_level(args.debug, args.verbose)
+        return run_daemon()
+
+    verbose_startup = args.debug or args.verbose
+    # The listing commands build their own pipeline, which loads tracking
+    # itself, so the startup sync can be skipped for them
+    skip_sync = (
+        args.papers
+        or args.papers_detailed
+        or bool(args.papers_prefix)
+        or args.ingested
+    )
+
+    # Synchronize tracking files at startup. Unless its progress is being
+    # displayed, run it in the background so it overlaps the splash screen
+    startup_ready = threading.Event()
+    if skip_sync:
+        startup_ready.set()
+    elif verbose_startup:
+        sync_result = sync_tracking_files(verbose=True)
+
+        # Set the verbose flag based on the sync result for debugging
+        if sync_result:
+            success, message, doc_count = sync_result
+            if doc_count > 0:
+                console.print(f"[info]Ready with {doc_count} tracked documents.[/info]")
+        startup_ready.set()
+    else:
+        def startup_sync():
+            try:
+                sync_tracking_files(verbose=False)
+            finally:
+                startup_ready.set()
+
+        threading.Thread(target=startup_sync, daemon=True).start()
+
+    # Set up signal handlers for graceful exit
+    import signal
+    signal.signal(signal.SIGINT, graceful_exit)  # Handle Ctrl+C
+
     # Load environment variables
+    from dotenv import load_dotenv
     load_dotenv()
 
+    # Remove the plaintext .env snapshot left behind by earlier versions
+    try:
+        os.remove(_LEGACY_ENV_CACHE_PATH)
+    except OSError:
+        pass
+
+    # Queries and interactive mode need the pipeline, so start initializing it
+    # now, overlapping the splash screen, logo, suggestions and cache lookups
+    pipeline_future = None
+    querying = args.query or not (
+        skip_sync
+        or args.recreate_corpus
+        or args.ingest_all
+        or args.ingest_prefix
+        or args.ingest_paths
+    )
+    if querying and not args.no_prefetch:
+        pipeline_future = _prefetch_pipeline(startup_ready)
+
     # Print a message about Ctrl+C
     console.print("[dim]Press Ctrl+C at any time to exit[/dim]")
 
     # Show splash screen unless disabled
     if not args.no_splash and not args.query:
-        show_splash_screen()
+        show_splash_screen(startup_ready)
+
+    # Commands below read the tracking files, so wait for the startup sync
+    startup_ready.wait()
 
     # Wrap the entire execution in a try block to handle any exceptions gracefully
     try:
@@ -2822,7 +3654,9 @@ def main():
                 if recreate_first:
                     console.print("[info]Will recreate corpus before ingestion[/info]")
                 success = ingest_documents(
-                    recreate_first=recreate_first, force_reingest=args.force
+                    recreate_first=recreate_first,
+                    force_reingest=args.force,
+                    concurrency=args.concurrency,
                 )
 
             return 0 if success else 1
@@ -2834,36 +3668,39 @@ def main():
             # Set appropriate log level based on command-line flags
             set_log_level(args.debug, args.verbose)
 
-            console.print(f"[bold bright_red]Query: {args.query}[/bold bright_red]")
+            # Collect the query header and print it in one write
+            header = [Text.from_markup(f"[bold bright_red]Query: {args.query}[/bold bright_red]")]
 
-            # Always enable reranking by default unless explicitly disabled
-            # Handle both the new --no-reranking flag and the legacy --reranking flag
-            use_reranking = True
-            if args.no_reranking:
-                use_reranking = False
-            elif hasattr(args, 'reranking') and args.reranking:
-                use_reranking = True
+            # Always enable reranking by default unless explicitly disabled;
+            # the legacy --reranking flag is accepted but is already the default
+            use_reranking = not args.no_reranking
 
             if use_reranking:
-                console.print("[green]Reranking enabled for better results![/green]")
+                header.append(Text("Reranking enabled for better results!", style="green"))
                 if sys.stdin.isatty():  # Only show benefits if running in interactive terminal
-                    console.print(explain_reranking_benefits())
+                    header.append(explain_reranking_benefits())
             else:
-                console.print("[yellow]Reranking disabled (not recommended)[/yellow]")
+                header.append(Text("Reranking disabled (not recommended)", style="yellow"))
+            console.print(Group(*header))
 
             if args.suggest:
-                with Status("[suggestion]Generating query suggestions...[/suggestion]", spinner="dots") as status:
-                    suggestions = suggest_query_improvements(args.query)
+                # Only show the spinner when the model actually has to be called
+                suggestions = get_cached_suggestions(args.query)
+                if suggestions is None:
+                    with maybe_status("[suggestion]Generating query suggestions...[/suggestion]", spinner="dots") as status:
+                        suggestions = suggest_query_improvements(args.query)
 
                 if suggestions:
                     suggestion_panel = Panel(
-                        "\n".join(f"[suggestion]{i}. {suggestion}[/suggestion]" for i, suggestion in enumerate(suggestions, 1)),
+                        create_suggestion_grid(suggestions),
                         title="Suggested Query Improvements",
                         border_style="yellow"
                     )
-                    console.print(suggestion_panel)
-
-                    console.print("\n[suggestion]Enter a [bold]number[/bold] to use a suggestion, or press Enter to use original query[/suggestion]")
+                    console.print(
+                        suggestion_panel,
+                        "\n[suggestion]Enter a [bold]number[/bold] to use a suggestion, or press Enter to use original query[/suggestion]",
+                        sep="\n",
+                    )
                     try:
                         selection = Prompt.ask("")
 
@@ -2880,53 +3717,92 @@ def main():
             else:
                 query = args.query
 
-            # Process the query with step tracking
-            try:
-                response, execution_time, metrics = run_rag_query(
-                    query, 
-                    use_reranking, 
-                    args.debug, 
-                    args.verbose,
-                    update_in_place=True
-                )
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Query processing interrupted[/yellow]")
-                graceful_exit()
+            # Reuse the answer to an identical earlier query, then to a
+            # near-duplicate one. Entries are kept apart by corpus version and
+            # reranking setting since both change the answer.
+            response_cache, cache_key = None, None
+            semantic_cache, query_vector, cached = None, None, None
+            if not args.no_cache:
+                response_cache = _open_response_cache()
+                corpus_version = "0"
+                if response_cache is not None:
+                    corpus_version = response_cache.corpus_version
+                    cache_key = response_cache.make_key(query, use_reranking)
+                    cached = response_cache.get(cache_key)
+                    if cached:
+                        console.print("[info]Using cached response[/info]")
+
+                cache_namespace = f"corpus={corpus_version};reranking={use_reranking}"
+                if not cached:
+                    semantic_cache = _open_semantic_cache()
+                    if semantic_cache is not None:
+                        query_vector = _embed_query(query)
+                    if query_vector is not None:
+                        cached = semantic_cache.get(query_vector, args.cache_threshold, cache_namespace)
+                        if cached:
+                            console.print(
+                                f"[info]Using cached response for a similar query "
+                                f"(similarity {cached['similarity']:.2f})[/info]"
+                            )
+
+            if cached:
+                response, metrics = cached["response"], cached["metrics"]
+            else:
+                # Let a running daemon answer if there is one, which skips pipeline startup
+                daemon_result = None
+                if not args.no_daemon:
+                    from src.apps.rag_daemon import query_daemon
+
+                    daemon_result = query_daemon(query, use_reranking, args.debug, args.verbose)
 
-            # Check if this is an empty response that needs more context
+                if daemon_result:
+                    response, metrics = daemon_result
+                    if args.debug or args.verbose:
+                        show_pipeline_details(metrics, args.verbose)
+                else:
+                    # Use the prefetched pipeline; if its initialization failed,
+                    # run_rag_query initializes (and reports) it again
+                    pipeline = _resolve_prefetched_pipeline(pipeline_future)
+
+                    # Process the query with step tracking
+                    try:
+                        response, execution_time, metrics = run_rag_query(
+                            query, 
+                            use_reranking, 
+                            args.debug, 
+                            args.verbose,
+                            update_in_place=True,
+                            pipeline=pipeline,
+                            stream=not args.no_stream,
+                        )
+                    except KeyboardInterrupt:
+                        console.print("\n[yellow]Query processing interrupted[/yellow]")
+                        graceful_exit()
+
+                # Only cache real answers
+                if "error" not in metrics and not metrics.get("is_empty_response", False):
+                    cached_metrics = None
+                    if cache_key is not None:
+                        cached_metrics = _snapshot_metrics(metrics)
+                        response_cache.set(cache_key, response, cached_metrics, ttl=args.cache_ttl)
+                    if query_vector is not None:
+                        semantic_cache.set(
+                            query_vector,
+                            response,
+                            cached_metrics or _snapshot_metrics(metrics),
+                            cache_namespace,
+                            ttl=args.cache_ttl,
+                        )
+
+            # Display the response in a prominent panel with source citations,
+            # preceded by the retrieved context for empty responses, in one write
+            result_panels = []
             if metrics.get("is_empty_response", False):
-                # Show context panel for empty responses
                 context_panel = create_context_panel(metrics)
                 if context_panel:
-                    console.print(context_panel)
-
-            # Display the response in a prominent panel with appropriate coloring
-            # Use yellow for empty responses
-            border_style = "yellow" if metrics.get("is_empty_response", False) else "green"
-            title_color = "yellow" if metrics.get("is_empty_response", False) else "green"
-
-            # Extract source citations if contexts are available
-            contexts = metrics.get("contexts", [])
-            source_citations = extract_source_citations(contexts)
-
-            # Combine response with source citations - use proper spacing
-            formatted_response = response
-            if source_citations:
-                # Add a clear separator to distinguish response from sources
-                if not formatted_response.endswith("\n"):
-                    formatted_response += "\n"
-                formatted_response += "\n" + "-" * 50 + source_citations
-
-            response_panel = Panel(
-                Markdown(formatted_response),
-                title=f"[bold {title_color}]Response[/bold {title_color}] (completed in [time]{metrics.get('formatted_time', 'unknown time')}[/time])",
-                border_style=border_style,
-                expand=True,
-                padding=(1, 2)
-            )
-
-            # Display immediately without extra spacing
-            console.print(response_panel)
+                    result_panels.append(context_panel)
+            result_panels.append(create_response_panel(response, metrics))
+            console.print(Group(*result_panels))
         else:
             # Interactive mode - will handle its own KeyboardInterrupt
             try:
@@ -2935,7 +3811,9 @@ def main():
 
                 # Determine reranking setting (enabled by default unless explicitly disabled)
                 use_reranking = not args.no_reranking
-                interactive_mode(use_reranking, args.debug, args.verbose)
+                interactive_mode(
+                    use_reranking, args.debug, args.verbose, pipeline_future, stream=not args.no_stream
+                )
             except KeyboardInterrupt:
                 graceful_exit()
 
@@ -2946,8 +3824,7 @@ def main():
         # Handle all other exceptions
         console.print(f"[error]Error: {e}[/error]")
         if args and args.debug:
-            import traceback
-            console.print(f"[dim red]{traceback.format_exc()}[/dim red]")
+            print_traceback(e)
         return 1
 
     return 0
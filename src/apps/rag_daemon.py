@@ -0,0 +1,238 @@
+"""
+Resident query server for the RAG CLI.
+
+`rag_cli.py --daemon` keeps one process running with the RAG stack imported
+and the pipeline initialized, serving queries over a Unix domain socket.
+Later `rag_cli.py --query ...` invocations forward their query to it and only
+render the result, so they skip pipeline initialization entirely.
+
+The protocol is one JSON object per line: the client sends
+{"cmd": "query", "args": {...}} or {"cmd": "ping"}, and the server answers
+with {"response": ..., "metrics": ..., "exit_code": ...}.
+
+Queries run with the owner's cloud credentials, so the socket lives in a
+directory only its owner can access, and both sides refuse a socket or
+directory owned by another user.
+"""
+
+import os
+import json
+import stat
+import socket
+import logging
+import tempfile
+import socketserver
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Socket the daemon listens on, in a per-user directory. XDG_RUNTIME_DIR is
+# already private to the user; the shared temp directory gets a subdirectory.
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR")
+    or os.path.join(tempfile.gettempdir(), f"zds-{os.getuid() if hasattr(os, 'getuid') else 0}"),
+    "zds.sock",
+)
+
+# Seconds to wait when connecting, so a stale socket file fails fast
+CONNECT_TIMEOUT_SECONDS = 0.5
+
+# Runs a query (text, reranking, debug, verbose) and returns
+# (response text, JSON-serializable metrics)
+QueryRunner = Callable[[str, bool, bool, bool], Tuple[str, Dict[str, Any]]]
+
+
+def _owned_by_user(path: str) -> bool:
+    """Whether a path exists and belongs to the current user."""
+    try:
+        return os.stat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _prepare_socket_dir(socket_path: str) -> None:
+    """
+    Create the socket's directory, private to the current user.
+
+    Raises:
+        PermissionError: If the directory belongs to another user or is
+            accessible by others
+    """
+    socket_dir = os.path.dirname(socket_path)
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+
+    dir_stat = os.stat(socket_dir)
+    if dir_stat.st_uid != os.getuid():
+        raise PermissionError(f"Socket directory {socket_dir} is owned by another user")
+    if stat.S_IMODE(dir_stat.st_mode) & 0o077:
+        raise PermissionError(f"Socket directory {socket_dir} is accessible by other users")
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Serialize a protocol message as a JSON line."""
+    return json.dumps(message, default=str).encode("utf-8") + b"\n"
+
+
+class _QueryHandler(socketserver.StreamRequestHandler):
+    """Handles one client connection: a single request line and its reply."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            cmd = request.get("cmd")
+            if cmd == "ping":
+                reply = {"exit_code": 0}
+            elif cmd == "query":
+                reply = self.server.run_query(request.get("args", {}))
+            else:
+                reply = {"error": f"Unknown command: {cmd}", "exit_code": 2}
+        except Exception as e:
+            logger.exception("Daemon request failed")
+            reply = {"error": str(e), "exit_code": 1}
+        self.wfile.write(_encode(reply))
+
+
+class RagDaemon(socketserver.UnixStreamServer):
+    """
+    Unix socket server that answers RAG queries in a resident process.
+
+    Requests are served one at a time, since the pipeline captures its
+    diagnostic output through the process-wide stdout.
+    """
+
+    def __init__(self, query_runner: QueryRunner, socket_path: str = DEFAULT_SOCKET_PATH):
+        """
+        Bind the socket.
+
+        Args:
+            query_runner: Runs a query with the already loaded RAG stack
+            socket_path: Path of the Unix domain socket to listen on
+        """
+        _prepare_socket_dir(socket_path)
+
+        # Remove a socket left behind by a daemon that didn't shut down cleanly
+        if os.path.lexists(socket_path):
+            if not _owned_by_user(socket_path):
+                raise PermissionError(f"{socket_path} is owned by another user")
+            os.remove(socket_path)
+
+        self.socket_path = socket_path
+        self.query_runner = query_runner
+        super().__init__(socket_path, _QueryHandler)
+        os.chmod(socket_path, 0o600)
+
+    def run_query(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run one query.
+
+        Args:
+            args: Query arguments ("query", "use_reranking", "debug", "verbose")
+
+        Returns:
+            Reply with the response text and metrics
+        """
+        response, metrics = self.query_runner(
+            args["query"],
+            args.get("use_reranking", True),
+            args.get("debug", False),
+            args.get("verbose", False),
+        )
+        return {
+            "response": response,
+            "metrics": metrics,
+            "exit_code": 1 if "error" in metrics else 0,
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def serve(query_runner: QueryRunner, socket_path: str = DEFAULT_SOCKET_PATH) -> int:
+    """
+    Run the daemon until interrupted.
+
+    Args:
+        query_runner: Runs a query with the already loaded RAG stack
+        socket_path: Path of the Unix domain socket to listen on
+
+    Returns:
+        Process exit code
+    """
+    with RagDaemon(query_runner, socket_path) as daemon:
+        logger.warning(f"Zero-Day Scout daemon listening on {socket_path}")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+def _request(message: Dict[str, Any], socket_path: str) -> Optional[Dict[str, Any]]:
+    """Send one request to the daemon and read its reply; None if it's unreachable."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+
+    # Only talk to a daemon run by the current user
+    if not (_owned_by_user(socket_path) and _owned_by_user(os.path.dirname(socket_path))):
+        logger.warning(f"Ignoring RAG daemon socket {socket_path} owned by another user")
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT_SECONDS)
+            sock.connect(socket_path)
+            # Queries can take a while once the daemon has accepted them
+            sock.settimeout(None)
+            sock.sendall(_encode(message))
+            with sock.makefile("rb") as reply:
+                return json.loads(reply.readline())
+    except (OSError, ValueError) as e:
+        logger.debug(f"RAG daemon unavailable at {socket_path}: {e}")
+        return None
+
+
+def query_daemon(
+    query: str,
+    use_reranking: bool,
+    debug: bool = False,
+    verbose: bool = False,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Run a query on a running daemon.
+
+    Args:
+        query: The query to process
+        use_reranking: Whether to use reranking
+        debug: Show debug information
+        verbose: Show verbose output including contexts
+        socket_path: Path of the daemon's Unix domain socket
+
+    Returns:
+        Tuple of (response text, metrics), or None if no daemon answered.
+        Retrieved contexts come back as plain objects with the fields used
+        for previews and citations.
+    """
+    reply = _request(
+        {
+            "cmd": "query",
+            "args": {
+                "query": query,
+                "use_reranking": use_reranking,
+                "debug": debug,
+                "verbose": verbose,
+            },
+        },
+        socket_path,
+    )
+    if not reply or "metrics" not in reply:
+        return None
+
+    metrics = reply["metrics"]
+    metrics["contexts"] = [SimpleNamespace(**ctx) for ctx in metrics.get("contexts", [])]
+    return reply["response"], metrics
@@ -10,6 +10,7 @@ For detailed documentation, see:
 - USAGE.md: Quick reference guide for commands and examples
 """
 
+import re
 import sys
 import os
 import argparse
@@ -17,40 +18,53 @@ import time
 import asyncio
 import logging
 import datetime
-from typing import Optional, List, Dict, Any
-from dotenv import load_dotenv
-
-# Handle import paths whether running as a script or from another module
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Make the project root importable when running as a script. When imported as
+# part of the src package (or run with -m), it is already on sys.path.
+if not __package__:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
 # Rich library for beautiful terminal output
 try:
     from rich.console import Console
     from rich.theme import Theme
     from rich.panel import Panel
-    from rich.markdown import Markdown
     from rich.prompt import Prompt
-    from rich.spinner import Spinner
     from rich.status import Status
     from rich.logging import RichHandler
     from rich.table import Table
+    from rich.text import Text
     from rich import box
 except ImportError:
     print("This utility requires the 'rich' library. Install with: pip install rich")
     sys.exit(1)
 
 # Import our Scout Agent system
-from src.scout_agent.agent import OrchestratorAgent
 from config.config_manager import get_config
-from vertexai.generative_models import GenerativeModel
+from src.apps.markdown_exporter import SOURCES_HEADING_RE
+
+# The agent stack, Vertex AI SDK and Markdown renderer are imported where they
+# are used, so --help and argument errors don't pay for loading them
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+    from vertexai.generative_models import GenerativeModel
+    from vertexai.language_models import TextEmbeddingModel
+    from src.rag.semantic_cache import LSHCache
+    from src.scout_agent.agent import OrchestratorAgent
 
 # Import Markdown utilities
 try:
     from src.apps.markdown_utils import export_results_to_markdown
     markdown_export_supported = True
 except ImportError:
+    export_results_to_markdown = None
     markdown_export_supported = False
     print("Markdown export module not found. This feature will be disabled.")
 
@@ -82,14 +96,16 @@ custom_theme = Theme(
     }
 )
 
-console = Console(theme=custom_theme)
+# Output is styled explicitly with markup, so skip Rich's automatic
+# highlighting and emoji-code scans on every print
+console = Console(theme=custom_theme, highlight=False, emoji=False)
 
 # Setup logging with RichHandler
 logging.basicConfig(
     level=logging.INFO,
     format="%(message)s",
     datefmt="[%X]",
-    handlers=[RichHandler(console=console, rich_tracebacks=True)],
+    handlers=[RichHandler(console=console, rich_tracebacks=True, show_path=False)],
 )
 
 # Create logger
@@ -111,9 +127,8 @@ def set_log_level(debug=False, verbose=False):
         logger.setLevel(logging.WARNING)
 
 
-def display_logo():
-    """Display the Zero-Day Scout logo."""
-    logo = """
+# Logo markup, parsed once into styled text
+LOGO = """
 [logo]
 ███████╗███████╗██████╗  ██████╗       ██████╗  █████╗ ██╗   ██╗    ███████╗ ██████╗ ██████╗ ██╗   ██╗████████╗
 ╚══███╔╝██╔════╝██╔══██╗██╔═══██╗      ██╔══██╗██╔══██╗╚██╗ ██╔╝    ██╔════╝██╔════╝██╔═══██╗██║   ██║╚══██╔══╝
@@ -126,11 +141,17 @@ def display_logo():
 
 [logo.tagline]AGENTIC RAG SYSTEM FOR SECURITY VULNERABILITY RESEARCH[/logo.tagline]
 """
-    console.print(logo)
+_LOGO_TEXT = Text.from_markup(LOGO)
 
 
-def display_agent_structure():
-    """Display information about the agent structure and workflow."""
+def display_logo():
+    """Display the Zero-Day Scout logo."""
+    console.print(_LOGO_TEXT)
+
+
+@lru_cache(maxsize=1)
+def create_agent_structure_panel() -> Panel:
+    """Create a panel describing the agent structure and workflow (built once and reused)."""
     agent_table = Table(box=box.SIMPLE, expand=False)
     agent_table.add_column("[bold]Sequential Workflow[/bold]", style="bold cyan")
     agent_table.add_column("Description", style="bright_white")
@@ -148,7 +169,59 @@ def display_agent_structure():
         "Evaluates findings to provide actionable security insights"
     )
     
-    console.print(Panel(agent_table, title="Agent Workflow", border_style="cyan"))
+    return Panel(agent_table, title="Agent Workflow", border_style="cyan")
+
+
+def display_agent_structure():
+    """Display information about the agent structure and workflow."""
+    console.print(create_agent_structure_panel())
+
+
+@lru_cache(maxsize=1)
+def _commands_panel() -> Panel:
+    """Create the panel listing the interactive commands (built once and reused)."""
+    commands_table = Table(box=box.SIMPLE, expand=False, show_header=False)
+    commands_table.add_column("Command", style="cmd")
+    commands_table.add_column("Description", style="cmd.desc")
+
+    commands_table.add_row("/help", "Show help information (use /help detailed for more)")
+    commands_table.add_row("/examples", "Show example security queries")
+    commands_table.add_row("/exit, /quit", "Exit the application")
+    commands_table.add_row("Ctrl+C", "Interrupt current operation or exit the application")
+    commands_table.add_row("/suggest", "Get query improvement suggestions for your last query")
+    commands_table.add_row("/enhance", "Enhance your last query for better results")
+    commands_table.add_row("/debug", "Toggle debug logging")
+    commands_table.add_row("/verbose", "Toggle verbose logging")
+    commands_table.add_row("/agents", "Show agent structure and workflow information")
+    commands_table.add_row("/rag", "Toggle RAG information display")
+    commands_table.add_row("/plan", "Toggle execution plan display")
+    commands_table.add_row("/export", "Export current results to Markdown")
+    commands_table.add_row("/export auto", "Toggle automatic Markdown export")
+    commands_table.add_row("/clear", "Clear the screen")
+
+    return Panel(commands_table, title="Available Commands", border_style="blue")
+
+
+# Detailed help shown by /help detailed
+USAGE_PATH = os.path.join(os.path.dirname(__file__), "USAGE.md")
+
+
+@lru_cache(maxsize=1)
+def _usage_panel(mtime: float) -> Panel:
+    """
+    Read and parse USAGE.md into a help panel.
+
+    Args:
+        mtime: Modification time of the file, so an edited file is read again
+
+    Returns:
+        Panel with the rendered help
+    """
+    with open(USAGE_PATH, 'r') as f:
+        usage_content = f.read()
+    from rich.markdown import Markdown
+
+    return Panel(Markdown(usage_content), title="Zero-Day Scout CLI - Help", border_style="blue", expand=False)
 
 
 def display_commands(detailed=False):
@@ -160,34 +233,18 @@ def display_commands(detailed=False):
     """
     if not detailed:
         # Show basic command table
-        commands_table = Table(box=box.SIMPLE, expand=False, show_header=False)
-        commands_table.add_column("Command", style="cmd")
-        commands_table.add_column("Description", style="cmd.desc")
-        
-        commands_table.add_row("/help", "Show help information (use /help detailed for more)")
-        commands_table.add_row("/examples", "Show example security queries")
-        commands_table.add_row("/exit, /quit", "Exit the application")
-        commands_table.add_row("Ctrl+C", "Interrupt current operation or exit the application")
-        commands_table.add_row("/suggest", "Get query improvement suggestions for your last query")
-        commands_table.add_row("/enhance", "Enhance your last query for better results")
-        commands_table.add_row("/debug", "Toggle debug logging")
-        commands_table.add_row("/verbose", "Toggle verbose logging")
-        commands_table.add_row("/agents", "Show agent structure and workflow information")
-        commands_table.add_row("/rag", "Toggle RAG information display")
-        commands_table.add_row("/plan", "Toggle execution plan display")
-        commands_table.add_row("/export", "Export current results to Markdown")
-        commands_table.add_row("/export auto", "Toggle automatic Markdown export")
-        commands_table.add_row("/clear", "Clear the screen")
-        
-        console.print(Panel(commands_table, title="Available Commands", border_style="blue"))
+        console.print(_commands_panel())
     else:
         # Show detailed help from USAGE.md if it exists
         try:
-            usage_path = os.path.join(os.path.dirname(__file__), "USAGE.md")
-            if os.path.exists(usage_path):
-                with open(usage_path, 'r') as f:
-                    usage_content = f.read()
-                    console.print(Panel(Markdown(usage_content), title="Zero-Day Scout CLI - Help", border_style="blue", expand=False))
+            if os.path.exists(USAGE_PATH):
+                # Print the help and the agent structure together in one write
+                console.print(
+                    _usage_panel(os.path.getmtime(USAGE_PATH)),
+                    create_agent_structure_panel(),
+                    sep="\n",
+                )
+                return
             else:
                 # Fall back to basic help if file doesn't exist
                 display_commands(detailed=False)
@@ -201,7 +258,37 @@ def display_commands(detailed=False):
         display_agent_structure()
 
 
-def suggest_query_improvements(query: str, model_name: Optional[str] = None) -> List[str]:
+@lru_cache(maxsize=8)
+def _get_model(model_name: str) -> "GenerativeModel":
+    """
+    Get a GenerativeModel for a model name, shared across calls.
+
+    Suggestions, execution plans and query enhancement run several model calls
+    per query, so each model client is created once per process.
+
+    Args:
+        model_name: Name of the generative model
+    """
+    from vertexai.generative_models import GenerativeModel
+
+    return GenerativeModel(model_name)
+
+
+async def _load_model(model_name: str) -> "GenerativeModel":
+    """
+    Get the shared GenerativeModel from a coroutine.
+
+    Creating a model resolves credentials and the project, which can block on
+    network I/O, so the lookup runs in a worker thread to keep the event loop
+    (and Ctrl+C handling) responsive.
+
+    Args:
+        model_name: Name of the generative model
+    """
+    return await asyncio.to_thread(_get_model, model_name)
+
+
+async def suggest_query_improvements(query: str, model_name: Optional[str] = None) -> List[str]:
     """
     Generate query improvement suggestions based on the original query.
 
@@ -213,11 +300,10 @@ def suggest_query_improvements(query: str, model_name: Optional[str] = None) ->
         List of suggested improved queries
     """
     logger.info(f"Generating query improvement suggestions for: {query}")
-    config = get_config()
-    model_name = model_name or config.get("generative_model")
+    model_name = model_name or get_config().get("generative_model")
 
     # Use the generative model to suggest improvements
-    model = GenerativeModel(model_name)
+    model = await _load_model(model_name)
 
     prompt = f"""
     I want to use a security-focused Retrieval-Augmented Generation (RAG) system to search for 
@@ -232,10 +318,11 @@ def suggest_query_improvements(query: str, model_name: Optional[str] = None) ->
 
     try:
         logger.debug(f"Sending suggestion prompt to model: {model_name}")
-        response = model.generate_content(prompt)
-        suggestions = [line.strip() for line in response.text.strip().split('\n') if line.strip()]
+        response = await model.generate_content_async(prompt)
+        # Keep the first 3 non-empty lines, without scanning any extra ones
+        suggestions = list(islice(filter(None, map(str.strip, response.text.split('\n'))), 3))
         logger.info(f"Generated {len(suggestions)} query suggestions")
-        return suggestions[:3]  # Limit to 3 suggestions
+        return suggestions
     except Exception as e:
         error_msg = f"Error generating suggestions: {e}"
         logger.error(error_msg)
@@ -243,33 +330,73 @@ def suggest_query_improvements(query: str, model_name: Optional[str] = None) ->
         return []
 
 
-async def format_output_markdown(text, agent_type):
+# Section labels promoted to Markdown headings for each agent's output
+_AGENT_HEADINGS = {
+    "planner": {
+        "Key Security Concepts:": "### Key Security Concepts:",
+        "Context Analysis:": "### Context Analysis:",
+        "Research Plan:": "### Research Plan:",
+        "Analysis Requirements:": "### Analysis Requirements:",
+    },
+    "researcher": {
+        "Research Findings:": "### Research Findings:",
+        "Sources:": "#### Sources:",
+        "Key Information:": "#### Key Information:",
+    },
+    "analyst": {
+        "Analysis:": "### Analysis:",
+        "Recommendations:": "### Recommendations:",
+        "Vulnerability Assessment:": "### Vulnerability Assessment:",
+    },
+}
+
+# Prompts asked for every query, parsed from markup once
+_QUERY_PROMPT = Text.from_markup("\n[bold cyan]Scout Agent[/bold cyan]", style="prompt")
+_PROCEED_PROMPT = Text.from_markup("\n[bold cyan]Proceed with execution?[/bold cyan]", style="prompt")
+_USE_ENHANCED_PROMPT = Text.from_markup(
+    "\n[bold cyan]Use this enhanced query?[/bold cyan] ([green]y[/green]/[red]n[/red]/[yellow]edit[/yellow])",
+    style="prompt",
+)
+_EDIT_PROMPT = Text.from_markup("\n[bold cyan]Edit query[/bold cyan]", style="prompt")
+
+# Answers accepted by the enhanced query confirmation
+_YES = frozenset({"y", "yes"})
+_EDIT = frozenset({"e", "edit"})
+
+# One compiled pattern per agent type, so formatting is a single pass over the text
+_AGENT_HEADING_PATTERNS = {
+    agent_type: (re.compile("|".join(map(re.escape, headings))), headings)
+    for agent_type, headings in _AGENT_HEADINGS.items()
+}
+
+
+@lru_cache(maxsize=32)
+def _markdown(text: str) -> "Markdown":
+    """
+    Parse agent output into a Markdown renderable, reusing earlier parses.
+
+    Agent outputs are redisplayed (e.g. the final analysis after the workflow
+    panels), and parsing large outputs dominates rendering them.
+
+    Args:
+        text: Markdown source
+    """
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+def format_output_markdown(text, agent_type):
     """Format agent output as markdown with highlights based on agent type."""
     if not text:
         return ""
 
-    # Create different formatting based on agent type
-    if agent_type == "planner":
-        # For planner, format structured plans, highlight headings, lists
-        formatted = text.replace("Key Security Concepts:", "### Key Security Concepts:")
-        formatted = formatted.replace("Context Analysis:", "### Context Analysis:")
-        formatted = formatted.replace("Research Plan:", "### Research Plan:")
-        formatted = formatted.replace("Analysis Requirements:", "### Analysis Requirements:")
-    elif agent_type == "researcher":
-        # For researcher, highlight findings, sources, data points
-        formatted = text.replace("Research Findings:", "### Research Findings:")
-        formatted = formatted.replace("Sources:", "#### Sources:")
-        formatted = formatted.replace("Key Information:", "#### Key Information:")
-    elif agent_type == "analyst":
-        # For analyst, highlight analysis sections, recommendations, etc.
-        formatted = text.replace("Analysis:", "### Analysis:")
-        formatted = formatted.replace("Recommendations:", "### Recommendations:")
-        formatted = formatted.replace("Vulnerability Assessment:", "### Vulnerability Assessment:")
-    else:
-        # Default formatting
-        formatted = text
+    # Agent types without special sections are returned unchanged
+    if agent_type not in _AGENT_HEADING_PATTERNS:
+        return text
 
-    return formatted
+    pattern, headings = _AGENT_HEADING_PATTERNS[agent_type]
+    return pattern.sub(lambda match: headings[match.group(0)], text)
 
 
 async def create_execution_plan(
@@ -288,8 +415,7 @@ async def create_execution_plan(
     with Status("[info]Creating execution plan...[/info]", spinner="dots"):
         try:
             # Use a smaller, faster model to create the plan
-            config = get_config()
-            planner_model = GenerativeModel(model_name or config.get("generative_model"))
+            planner_model = await _load_model(model_name or get_config().get("generative_model"))
 
             prompt = f"""
             I'm about to use an Agentic RAG system with a sequential workflow to research this security query:
@@ -308,7 +434,7 @@ async def create_execution_plan(
             Keep your plan concise (maximum 8-10 lines total), focused, and use bullet points where appropriate.
             """
 
-            response = planner_model.generate_content(prompt)
+            response = await planner_model.generate_content_async(prompt)
             execution_plan = response.text.strip()
 
             return execution_plan
@@ -318,6 +444,128 @@ async def create_execution_plan(
             return f"Query: {query}\n\nBasic 3-step workflow:\n- Planning phase\n- Research phase\n- Analysis phase"
 
 
+# Status messages shown while the agent workflow runs, with how long each stays
+# up at most; the last one stays until the workflow finishes. The markup is
+# parsed once here rather than on every status update.
+WORKFLOW_STATUS_STAGES = tuple(
+    (Text.from_markup(markup), max_duration)
+    for markup, max_duration in (
+        ("[agent.planner]Planning security research strategy...[/agent.planner]", 1.8),
+        ("[agent.researcher]Retrieving relevant research...[/agent.researcher]", 0.8),
+        ("[agent.researcher]Analyzing security documents...[/agent.researcher]", 0.8),
+        ("[agent.analyst]Examining security implications...[/agent.analyst]", 0.8),
+        ("[agent.analyst]Developing security insights...[/agent.analyst]", 0.8),
+        ("[step.current]Synthesizing final analysis...[/step.current]", None),
+    )
+)
+
+
+def _create_orchestrator(model_name: str) -> "OrchestratorAgent":
+    """Create an OrchestratorAgent, importing the agent stack on first use."""
+    from src.scout_agent.agent import OrchestratorAgent
+
+    return OrchestratorAgent(model_name=model_name)
+
+
+@lru_cache(maxsize=8)
+def get_orchestrator(model_name: str) -> "OrchestratorAgent":
+    """
+    Get the OrchestratorAgent for a model name, shared across queries.
+
+    Each query runs in its own runner session and the CVE agent reconnects
+    on demand after cleanup, so an interactive session keeps one set of
+    agents, tools and RAG clients instead of rebuilding them per query.
+
+    Args:
+        model_name: The model to use for the agents
+    """
+    return _create_orchestrator(model_name)
+
+
+def start_orchestrator_init(model_name: str) -> "asyncio.Task":
+    """
+    Start getting the shared OrchestratorAgent in a worker thread.
+
+    The agent is needed whatever query ends up being processed, so callers
+    start this before query enhancement and confirmation, and pass the task
+    to process_query. After the first query this resolves immediately.
+
+    Args:
+        model_name: The model to use for the agents
+
+    Returns:
+        Task resolving to the initialized OrchestratorAgent
+    """
+    return asyncio.create_task(asyncio.to_thread(get_orchestrator, model_name))
+
+
+# Agents whose outputs are displayed, in workflow order
+AGENT_DISPLAY_ORDER = ("security_planner", "security_researcher", "security_analyst")
+
+
+def _agent_output_panels(agent_key: str, output: str, show_rag: bool = True) -> List[Panel]:
+    """
+    Build the panels displaying one agent's output.
+
+    Args:
+        agent_key: Agent the output came from (see AGENT_DISPLAY_ORDER)
+        output: The agent's raw output
+        show_rag: Whether to show the research sources panel
+
+    Returns:
+        Panels to print, in order
+    """
+    if agent_key == "security_planner":
+        planner_md = format_output_markdown(output, "planner")
+        return [Panel(
+            _markdown(planner_md),
+            title="[agent.planner]Research Plan[/agent.planner]",
+            border_style="cyan",
+            expand=False
+        )]
+
+    if agent_key == "security_researcher":
+        # Research agent output - will now show RAG retrieval information
+        researcher_md = format_output_markdown(output, "researcher")
+
+        # Split the research findings from the sources information, if present
+        sources_match = SOURCES_HEADING_RE.search(researcher_md)
+
+        if not sources_match:
+            # Display as usual if no RAG section found
+            return [Panel(
+                _markdown(researcher_md),
+                title="[agent.researcher]Research Findings[/agent.researcher]",
+                border_style="blue",
+                expand=False
+            )]
+
+        panels = [Panel(
+            _markdown(researcher_md[:sources_match.start()].strip()),
+            title="[agent.researcher]Research Findings[/agent.researcher]",
+            border_style="blue",
+            expand=False
+        )]
+
+        # Display research sources information in a highlighted panel only if enabled
+        if show_rag:
+            panels.append(Panel(
+                _markdown(researcher_md[sources_match.start():]),
+                title="[bright_cyan]Research Sources[/bright_cyan]",
+                border_style="cyan",
+                expand=False
+            ))
+        return panels
+
+    analyst_md = format_output_markdown(output, "analyst")
+    return [Panel(
+        _markdown(analyst_md),
+        title="[agent.analyst]Security Analysis[/agent.analyst]",
+        border_style="green",
+        expand=False
+    )]
+
+
 async def process_query(
     query: str,
     model_name: str = "gemini-2.5-flash",
@@ -325,6 +573,7 @@ async def process_query(
     show_agent_outputs: bool = True,
     show_rag: bool = True,
     show_plan: bool = True,
+    orchestrator_task: Optional["asyncio.Task"] = None,
 ):
     """
     Process a security query through the agent system.
@@ -336,18 +585,17 @@ async def process_query(
         show_agent_outputs: Whether to show individual agent outputs
         show_rag: Whether to show RAG match information
         show_plan: Whether to show execution plan before processing
+        orchestrator_task: Orchestrator initialization already started with
+            start_orchestrator_init (optional)
         
     Returns:
-        Tuple of (final_response, agent_outputs) or None if there was an error
+        Tuple of (final_response, agent_outputs), or None if there was an
+        error or the user canceled the execution plan
     """
-    # Initialize the orchestrator agent
-    with Status("[info]Initializing agent system...[/info]", spinner="dots") as status:
-        try:
-            orchestrator = OrchestratorAgent(model_name=model_name)
-            status.update(f"[info]Using model: {model_name}[/info]")
-        except Exception as e:
-            console.print(f"[error]Error initializing agent system: {e}[/error]")
-            return None
+    # Initialize the orchestrator agent in a worker thread, so it overlaps
+    # generating and reviewing the execution plan
+    if orchestrator_task is None:
+        orchestrator_task = start_orchestrator_init(model_name)
 
     # If show_plan is enabled, create and display execution plan
     if show_plan:
@@ -356,149 +604,103 @@ async def process_query(
             execution_plan = await create_execution_plan(query, model_name)
 
             # Display the plan in a highlighted panel
-            console.print("\n[bold]Execution Plan:[/bold]")
-            console.print(Panel(
-                Markdown(execution_plan),
-                title="[cyan]Query Execution Plan[/cyan]",
-                border_style="cyan",
-                expand=False
-            ))
+            console.print(
+                "\n[bold]Execution Plan:[/bold]",
+                Panel(
+                    _markdown(execution_plan),
+                    title="[cyan]Query Execution Plan[/cyan]",
+                    border_style="cyan",
+                    expand=False
+                ),
+                sep="\n",
+            )
 
             # Ask for confirmation to proceed
-            proceed = Prompt.ask("\n[bold cyan]Proceed with execution?[/bold cyan]", choices=["y", "n"], default="y")
+            proceed = Prompt.ask(_PROCEED_PROMPT, choices=["y", "n"], default="y")
 
             if proceed.lower() != "y":
+                # Drop the pending initialization; its result would go unused
+                orchestrator_task.cancel()
                 console.print("[info]Query execution canceled by user.[/info]")
-                return "Query execution was canceled."
+                return None
 
         except Exception as e:
             # If plan creation fails, just log and continue
             logger.warning(f"Error creating execution plan: {e}")
             console.print("[yellow]Could not create execution plan. Proceeding directly.[/yellow]")
 
+    with Status("[info]Initializing agent system...[/info]", spinner="dots") as status:
+        try:
+            orchestrator = await orchestrator_task
+            status.update(f"[info]Using model: {model_name}[/info]")
+        except Exception as e:
+            console.print(f"[error]Error initializing agent system: {e}[/error]")
+            return None
+
     # Process the query - use a distinctive separator for clarity
-    console.print("\n[bright_white]════════════════════════════════════════════[/bright_white]")
-    console.print(f"[query]Processing query: '{query}'[/query]")
-    console.print("[bright_white]════════════════════════════════════════════[/bright_white]\n")
+    console.print(
+        "\n[bright_white]════════════════════════════════════════════[/bright_white]\n"
+        f"[query]Processing query: '{query}'[/query]\n"
+        "[bright_white]════════════════════════════════════════════[/bright_white]\n"
+    )
+
+    # Each agent's output is shown as soon as the next agent starts, rather
+    # than after the whole workflow returns; the latest output is held back
+    # since an agent can send several messages before it's done
+    output_renderables = ["\n[bold]Agent Workflow Execution:[/bold]"] if show_agent_outputs else []
+    shown_agents = set()
+    pending_output = None
+
+    def on_agent_output(agent_key: str, text: str) -> None:
+        nonlocal pending_output
+        if not show_agent_outputs or agent_key not in AGENT_DISPLAY_ORDER or not text:
+            return
+        if pending_output and pending_output[0] != agent_key:
+            shown_agents.add(pending_output[0])
+            console.print(*output_renderables, *_agent_output_panels(*pending_output, show_rag), sep="\n")
+            output_renderables.clear()
+        pending_output = (agent_key, text)
 
     try:
         # Execute the query processing workflow
         with Status("[step.current]Starting agent workflow...[/step.current]", spinner="dots") as status:
             start_time = time.time()
 
-            # Show status updates for each agent in the workflow
-            status.update("[agent.planner]Planning security research strategy...[/agent.planner]")
-            # Small delay to show the status change (for user experience)
-            await asyncio.sleep(1)
+            # Run the orchestrator right away and advance the per-agent status
+            # messages while it works, instead of delaying the work behind them
+            task = asyncio.create_task(
+                orchestrator.process_query(query, on_agent_output=on_agent_output)
+            )
+            for status_text, max_duration in WORKFLOW_STATUS_STAGES:
+                status.update(status_text)
+                done, _ = await asyncio.wait({task}, timeout=max_duration)
+                if task in done:
+                    break
 
-            # Process query through the orchestrator
-            # These status updates provide real-time feedback while the actual processing is running
-            try:
-                # Simulate the workflow progression visually for better UX
-                # Step 1: The Planner agent
-                status.update("[agent.planner]Planning security research strategy...[/agent.planner]")
-                await asyncio.sleep(0.8)
-
-                # Step 2: The Research agent with better status updates
-                status.update("[agent.researcher]Retrieving relevant research...[/agent.researcher]")
-                await asyncio.sleep(0.8)
-                status.update("[agent.researcher]Analyzing security documents...[/agent.researcher]")
-                await asyncio.sleep(0.8)
-
-                # Step 3: The Analysis agent with better status updates
-                status.update("[agent.analyst]Examining security implications...[/agent.analyst]")
-                await asyncio.sleep(0.8)
-                status.update("[agent.analyst]Developing security insights...[/agent.analyst]")
-                await asyncio.sleep(0.8)
-
-                # Final synthesis
-                status.update("[step.current]Synthesizing final analysis...[/step.current]")
-                await asyncio.sleep(0.5)
-
-                # Process the query with the orchestrator - returns a dictionary
-                result = await orchestrator.process_query(query)
-
-                # The final response is in result["final_response"]
-                # The agent outputs are in result["agent_outputs"]
-                final_response = result["final_response"]
-                agent_outputs = result["agent_outputs"]
-
-            except Exception as workflow_error:
-                # If there's an error in the workflow display, still try the actual processing
-                console.print(f"[yellow]Warning: Workflow display error: {workflow_error}[/yellow]")
-                result = await orchestrator.process_query(query)
-                final_response = result["final_response"]
-                agent_outputs = result["agent_outputs"]
+            # Process the query with the orchestrator - returns a dictionary
+            result = await task
+
+            # The final response is in result["final_response"]
+            # The agent outputs are in result["agent_outputs"]
+            final_response = result["final_response"]
+            agent_outputs = result["agent_outputs"]
 
             elapsed_time = time.time() - start_time
             status.update(f"[step.complete]✓ Analysis completed in {elapsed_time:.2f} seconds[/step.complete]")
             console.print("\n[bright_white]════════════════════════════════════════════[/bright_white]")
 
-        # Display the results in a formatted way with panels
+        # Display the outputs that didn't arrive while the workflow ran, such
+        # as the analyst's, which is only complete once the workflow finishes
         if show_agent_outputs:
-            console.print("\n[bold]Agent Workflow Execution:[/bold]")
-
-            # Check if we have proper agent outputs to display
-            if agent_outputs:
-                # Create panels for each agent in the workflow
-                # Planner agent output
-                if agent_outputs["security_planner"]["output"]:
-                    planner_md = await format_output_markdown(agent_outputs["security_planner"]["output"], "planner")
-                    console.print(Panel(
-                        Markdown(planner_md),
-                        title="[agent.planner]Research Plan[/agent.planner]",
-                        border_style="cyan",
-                        expand=False
-                    ))
-
-                # Research agent output - will now show RAG retrieval information
-                if agent_outputs["security_researcher"]["output"]:
-                    researcher_md = await format_output_markdown(agent_outputs["security_researcher"]["output"], "researcher")
-
-                    # Parse for research sources information if present
-                    sources_section = ""
-                    research_content = researcher_md
-
-                    if "## Research Sources" in researcher_md:
-                        # Split the research findings from the sources information
-                        parts = researcher_md.split("## Research Sources", 1)
-                        research_content = parts[0].strip()
-                        sources_section = "## Research Sources" + parts[1]
-
-                        # Display research findings
-                        console.print(Panel(
-                            Markdown(research_content),
-                            title="[agent.researcher]Research Findings[/agent.researcher]",
-                            border_style="blue",
-                            expand=False
-                        ))
-
-                        # Display research sources information in a highlighted panel only if enabled
-                        if show_rag:
-                            console.print(Panel(
-                                Markdown(sources_section),
-                                title="[bright_cyan]Research Sources[/bright_cyan]",
-                                border_style="cyan",
-                                expand=False
-                            ))
-                    else:
-                        # Display as usual if no RAG section found
-                        console.print(Panel(
-                            Markdown(researcher_md),
-                            title="[agent.researcher]Research Findings[/agent.researcher]",
-                            border_style="blue",
-                            expand=False
-                        ))
-
-                # Analysis agent output
-                if agent_outputs["security_analyst"]["output"]:
-                    analyst_md = await format_output_markdown(agent_outputs["security_analyst"]["output"], "analyst")
-                    console.print(Panel(
-                        Markdown(analyst_md),
-                        title="[agent.analyst]Security Analysis[/agent.analyst]",
-                        border_style="green",
-                        expand=False
-                    ))
+            for agent_key in AGENT_DISPLAY_ORDER:
+                if pending_output and pending_output[0] == agent_key:
+                    output_renderables.extend(_agent_output_panels(*pending_output, show_rag))
+                elif agent_key not in shown_agents and agent_outputs and agent_outputs[agent_key]["output"]:
+                    output_renderables.extend(
+                        _agent_output_panels(agent_key, agent_outputs[agent_key]["output"], show_rag)
+                    )
+
+            console.print(*output_renderables, sep="\n")
 
         # Return both final_response and agent_outputs so they can be used for export
         return (final_response, agent_outputs)
@@ -513,27 +715,159 @@ async def process_query(
         return None
 
 
+async def batch_process_queries(
+    queries: List[str],
+    model_name: str = "gemini-2.5-flash",
+    concurrency: int = 4,
+) -> List[Any]:
+    """
+    Process several security queries concurrently through the agent system.
+
+    At most `concurrency` workflows run at once, which keeps the number of
+    parallel model calls within typical rate limits. Each query gets its own
+    orchestrator, so their sessions stay independent.
+
+    Args:
+        queries: The security queries to process
+        model_name: The model to use for the agents
+        concurrency: Maximum number of queries processed at the same time
+
+    Returns:
+        One entry per query, in order: the orchestrator's result dictionary,
+        or the exception that query failed with
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    completed = 0
+    query_seconds = 0.0
+
+    async def process_one(query: str) -> dict:
+        nonlocal completed, query_seconds
+        async with semaphore:
+            start_time = time.time()
+            orchestrator = await asyncio.to_thread(_create_orchestrator, model_name)
+            try:
+                return await orchestrator.process_query(query)
+            finally:
+                query_seconds += time.time() - start_time
+                completed += 1
+                status.update(f"[info]Processed {completed}/{len(queries)} queries...[/info]")
+
+    start_time = time.time()
+    with Status(f"[info]Processing {len(queries)} queries...[/info]", spinner="dots") as status:
+        results = await asyncio.gather(
+            *(process_one(query) for query in queries), return_exceptions=True
+        )
+
+    # Wall time well below the summed per-query time shows the workflows overlapped
+    elapsed_time = time.time() - start_time
+    logger.info(
+        f"Batch took {elapsed_time:.2f}s for {query_seconds:.2f}s of query time "
+        f"({query_seconds / max(elapsed_time, 1e-9):.1f}x overlap)"
+    )
+    return results
+
+
+# Enhanced queries are kept in a small LRU cache, so re-entering a query
+# doesn't repeat the suggestion and enhancement model calls
+ENHANCEMENT_CACHE_SIZE = 256
+_enhancement_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+
+# Minimum cosine similarity for a differently phrased query to reuse an enhancement
+ENHANCEMENT_SIMILARITY_THRESHOLD = 0.92
+
+
+@lru_cache(maxsize=1)
+def _semantic_enhancement_cache() -> Optional["LSHCache"]:
+    """Create the in-memory semantic enhancement cache, or None if it's unavailable."""
+    try:
+        from src.rag.semantic_cache import LSHCache
+
+        return LSHCache(path=None, max_entries=512)
+    except Exception as e:
+        # numpy missing
+        logger.warning(f"Semantic enhancement cache unavailable: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_embedding_model() -> "TextEmbeddingModel":
+    """Get the configured text embedding model, shared across calls."""
+    from vertexai.language_models import TextEmbeddingModel
+
+    return TextEmbeddingModel.from_pretrained(get_config().get("embedding_model"))
+
+
+async def _embed_query(query: str) -> Optional[List[float]]:
+    """
+    Embed a query for semantic cache lookups.
+
+    Args:
+        query: The query to embed
+
+    Returns:
+        The embedding values, or None if the query could not be embedded
+    """
+    try:
+        model = await asyncio.to_thread(_get_embedding_model)
+        embeddings = await model.get_embeddings_async([query])
+        return embeddings[0].values
+    except Exception as e:
+        logger.warning(f"Could not embed query for the enhancement cache: {e}")
+        return None
+
+
+def _enhancement_cache_key(query: str, model_name: str) -> Tuple[str, str]:
+    """
+    Build the enhancement cache key for a query.
+
+    Case and whitespace differences are folded so near-identical re-asks of
+    the same query share one entry.
+    """
+    return " ".join(query.casefold().split()), model_name
+
+
 async def enhance_query(query: str, model_name: str) -> str:
     """
     Enhance the user's query for better results before processing.
+
+    Successful enhancements are cached per query and model, and reused for
+    differently phrased queries whose embeddings are nearly identical.
     
     Args:
         query: The original user query
         model_name: The model to use for enhancing
         
     Returns:
-        Enhanced query that's more specific and focused
+        Enhanced query that's more specific and focused, or the original
+        query object itself when it couldn't be enhanced, so callers can
+        tell the two apart with a cheap comparison
     """
+    model_name = model_name or get_config().get("generative_model")
+    cache_key = _enhancement_cache_key(query, model_name)
+    cached = _enhancement_cache.get(cache_key)
+    if cached is not None:
+        _enhancement_cache.move_to_end(cache_key)
+        return cached
+
+    semantic_cache, query_vector = _semantic_enhancement_cache(), None
+    if semantic_cache is not None:
+        query_vector = await _embed_query(query)
+    if query_vector is not None:
+        similar = semantic_cache.get(query_vector, ENHANCEMENT_SIMILARITY_THRESHOLD, model_name)
+        if similar:
+            logger.info(f"Reusing enhancement of a similar query (similarity {similar['similarity']:.2f})")
+            return similar["response"]
+
     with Status("[info]Enhancing your query...[/info]", spinner="dots") as status:
         # Generate query improvements
-        suggestions = suggest_query_improvements(query, model_name)
+        suggestions = await suggest_query_improvements(query, model_name)
         
         if not suggestions:
             return query  # Return original if no suggestions
             
         # Create enhanced query with enriched details
-        config = get_config()
-        enhanced_model = GenerativeModel(model_name or config.get("generative_model"))
+        enhanced_model = await _load_model(model_name)
         
         prompt = f"""
         I'm going to use an Agentic RAG system for security research.
@@ -550,8 +884,16 @@ async def enhance_query(query: str, model_name: str) -> str:
         """
         
         try:
-            response = enhanced_model.generate_content(prompt)
+            response = await enhanced_model.generate_content_async(prompt)
             enhanced_query = response.text.strip()
+            if not enhanced_query:
+                return query  # Return original if the model gave no enhancement
+
+            _enhancement_cache[cache_key] = enhanced_query
+            if len(_enhancement_cache) > ENHANCEMENT_CACHE_SIZE:
+                _enhancement_cache.popitem(last=False)
+            if query_vector is not None:
+                semantic_cache.set(query_vector, enhanced_query, {}, model_name)
             return enhanced_query
         except KeyboardInterrupt:
             logger.warning("Query enhancement interrupted by user")
@@ -562,12 +904,261 @@ async def enhance_query(query: str, model_name: str) -> str:
             return query  # Return original if enhancement fails
 
 
+# Example queries listed by /examples, and their numbered listing
+EXAMPLE_QUERIES = (
+    "What are the latest zero-day vulnerabilities in Apache Struts?",
+    "How can organizations protect against Log4Shell vulnerabilities?",
+    "What are the common exploit techniques for SQL injection?",
+    "How can I detect if my system has been compromised by a zero-day exploit?",
+    "What security vulnerabilities affect Docker containers?",
+)
+_EXAMPLES_TEXT = Text(
+    "\n".join(f"  {i}. {example}" for i, example in enumerate(EXAMPLE_QUERIES, 1)),
+    style="suggestion",
+)
+
+
+@dataclass
+class CLIState:
+    """Settings and results carried between commands in an interactive session."""
+
+    model_name: str = "gemini-2.5-flash"
+    debug: bool = False
+    verbose: bool = False
+    show_rag: bool = True
+    show_plan: bool = True
+    auto_export: bool = False
+    last_query: Optional[str] = None
+    # Results of the last successfully processed query, kept for /export
+    result_query: Optional[str] = None
+    final_response: Optional[str] = None
+    agent_outputs: Optional[Dict[str, Any]] = None
+
+    def set_results(self, query: str, final_response: str, agent_outputs: Dict[str, Any]) -> None:
+        """Record the results of a processed query together with the query itself."""
+        self.result_query = query
+        self.final_response = final_response
+        self.agent_outputs = agent_outputs
+
+
+async def _handle_exit(state: CLIState, cmd: str) -> bool:
+    """/exit: end the session."""
+    console.print("[info]Exiting Scout Agent CLI.[/info]")
+    return True
+
+
+async def _handle_help(state: CLIState, cmd: str) -> bool:
+    """/help [detailed]: show the command list or the full usage guide."""
+    # Check if detailed help requested
+    display_commands(detailed="detailed" in cmd or "full" in cmd)
+    return False
+
+
+async def _handle_examples(state: CLIState, cmd: str) -> bool:
+    """/examples: list example queries."""
+    console.print("\n[info]Example security queries:[/info]", _EXAMPLES_TEXT, sep="\n")
+    return False
+
+
+async def _handle_agents(state: CLIState, cmd: str) -> bool:
+    """/agents: show the agent workflow structure."""
+    display_agent_structure()
+    return False
+
+
+async def _handle_suggest(state: CLIState, cmd: str) -> bool:
+    """/suggest: suggest improvements to the last query."""
+    if not state.last_query:
+        console.print("[error]No previous query to suggest improvements for.[/error]")
+        return False
+
+    with Status("[info]Generating query suggestions...[/info]", spinner="dots"):
+        suggestions = await suggest_query_improvements(state.last_query, state.model_name)
+
+    if suggestions:
+        suggestions_table = Table(box=box.SIMPLE, show_header=False)
+        suggestions_table.add_column("", style="suggestion")
+
+        # Model output is added as plain Text, so it is not parsed as markup
+        for i, suggestion in enumerate(suggestions, 1):
+            suggestions_table.add_row(Text(f"{i}. {suggestion}"))
+
+        console.print(
+            "\n[info]Suggested query improvements:[/info]",
+            Panel(suggestions_table, title="Query Suggestions", border_style="yellow"),
+            sep="\n",
+        )
+    else:
+        console.print("[error]Could not generate suggestions.[/error]")
+    return False
+
+
+async def _handle_enhance(state: CLIState, cmd: str) -> bool:
+    """/enhance: enhance the last query and optionally run it."""
+    if not state.last_query:
+        console.print("[error]No previous query to enhance.[/error]")
+        return False
+
+    # Enhance the query
+    with Status("[info]Enhancing your query...[/info]", spinner="dots"):
+        enhanced_query = await enhance_query(state.last_query, state.model_name)
+
+    if enhanced_query == state.last_query:
+        console.print("[info]Could not further enhance the query.[/info]")
+        return False
+
+    console.print(
+        "\n[info]Enhanced query for better results:[/info]",
+        Panel(
+            f"[bold]Original:[/bold] {state.last_query}\n\n[bold]Enhanced:[/bold] {enhanced_query}",
+            title="Query Enhancement",
+            border_style="yellow"
+        ),
+        sep="\n",
+    )
+
+    # Ask if they want to use this query now
+    use_now = Prompt.ask("Process this enhanced query now?", choices=["y", "n"], default="n")
+    if use_now.lower() == "y":
+        # Process the enhanced query with display settings
+        response = await process_query(
+            enhanced_query,
+            state.model_name,
+            state.verbose,
+            show_rag=state.show_rag,
+            show_plan=state.show_plan
+        )
+
+        if response:
+            # The formatted output is already displayed in process_query if show_agent_outputs=True
+            state.set_results(enhanced_query, *response)
+
+            # Display the final response with markdown formatting
+            console.print(
+                "\n[bold green]Agent Response:[/bold green]",
+                Panel(
+                    _markdown(format_output_markdown(state.final_response, "analyst")),
+                    title="[bold]Final Analysis[/bold]",
+                    border_style="green",
+                    expand=False
+                ),
+                sep="\n",
+            )
+    return False
+
+
+async def _handle_debug(state: CLIState, cmd: str) -> bool:
+    """/debug: toggle debug logging."""
+    state.debug = not state.debug
+    set_log_level(debug=state.debug, verbose=state.verbose)
+    status_message = "enabled" if state.debug else "disabled"
+    console.print(f"[info]Debug mode {status_message}[/info]")
+    return False
+
+
+async def _handle_verbose(state: CLIState, cmd: str) -> bool:
+    """/verbose: toggle verbose logging."""
+    state.verbose = not state.verbose
+    set_log_level(debug=state.debug, verbose=state.verbose)
+    status_message = "enabled" if state.verbose else "disabled"
+    console.print(f"[info]Verbose mode {status_message}[/info]")
+    return False
+
+
+async def _handle_rag(state: CLIState, cmd: str) -> bool:
+    """/rag: toggle the research sources display."""
+    state.show_rag = not state.show_rag
+    status_message = "enabled" if state.show_rag else "disabled"
+    console.print(f"[info]RAG information display {status_message}[/info]")
+    return False
+
+
+async def _handle_plan(state: CLIState, cmd: str) -> bool:
+    """/plan: toggle showing the execution plan before each query."""
+    state.show_plan = not state.show_plan
+    status_message = "enabled" if state.show_plan else "disabled"
+    console.print(f"[info]Execution plan display {status_message}[/info]")
+    return False
+
+
+async def _handle_export(state: CLIState, cmd: str) -> bool:
+    """/export [auto|no-sources]: export the last results, or toggle auto-export."""
+    # Toggle auto-export if specified
+    if "auto" in cmd:
+        state.auto_export = not state.auto_export
+        status_message = "enabled" if state.auto_export else "disabled"
+        console.print(f"[info]Automatic Markdown export {status_message}[/info]")
+        return False
+
+    if state.last_query is None:
+        console.print("[error]No query has been processed yet.[/error]")
+        return False
+
+    # Check if we have results to export
+    if state.result_query is None or not state.final_response or not state.agent_outputs:
+        console.print("[error]No results available to export.[/error]")
+        return False
+
+    # Check if Markdown export is supported
+    if not markdown_export_supported:
+        console.print("[md.error]Markdown export not available.[/md.error]")
+        return False
+
+    # Export to Markdown, including sources unless explicitly disabled
+    export_results_to_markdown(
+        query=state.result_query,
+        final_response=state.final_response,
+        agent_outputs=state.agent_outputs,
+        include_sources="no-sources" not in cmd and "nosources" not in cmd,
+        console=console
+    )
+    return False
+
+
+async def _handle_clear(state: CLIState, cmd: str) -> bool:
+    """/clear: clear the screen."""
+    console.clear()
+    display_logo()
+    console.print()
+    display_commands()
+    return False
+
+
+# Interactive command handlers by the word typed (including aliases). Each
+# takes the session state and the lowercased command line, and returns True
+# when the session should end.
+COMMANDS: Dict[str, Callable[[CLIState, str], Awaitable[bool]]] = {
+    "/exit": _handle_exit,
+    "/quit": _handle_exit,
+    "/bye": _handle_exit,
+    "/q": _handle_exit,
+    "/help": _handle_help,
+    "/examples": _handle_examples,
+    "/example": _handle_examples,
+    "/ex": _handle_examples,
+    "/agents": _handle_agents,
+    "/agent": _handle_agents,
+    "/structure": _handle_agents,
+    "/workflow": _handle_agents,
+    "/suggest": _handle_suggest,
+    "/suggestions": _handle_suggest,
+    "/enhance": _handle_enhance,
+    "/debug": _handle_debug,
+    "/verbose": _handle_verbose,
+    "/rag": _handle_rag,
+    "/plan": _handle_plan,
+    "/export": _handle_export,
+    "/clear": _handle_clear,
+}
+
+
 async def interactive_mode(
     model_name: str = "gemini-2.5-flash",
     verbose: bool = False,
     show_rag: bool = True,
     show_plan: bool = True,
     auto_export_md: bool = False,
+    debug: bool = False,
 ):
     """
     Run the agent in interactive mode.
@@ -577,7 +1168,8 @@ async def interactive_mode(
         verbose: Whether to show debugging information
         show_rag: Whether to show RAG information in the output
         show_plan: Whether to show execution plan before processing
-        auto_export_pdf: Whether to automatically export results to PDF
+        auto_export_md: Whether to automatically export results to Markdown
+        debug: Whether debug logging is enabled
     """
     # Display logo and commands
     display_logo()
@@ -585,18 +1177,28 @@ async def interactive_mode(
 
     # Show startup information
     with Status("[info]Loading Zero-Day Scout Agent system...[/info]", spinner="dots") as status:
+        # Create the model client during the loading sequence, so the first
+        # suggestion, plan or enhancement call doesn't pay for it
+        warmup = asyncio.create_task(asyncio.to_thread(_get_model, model_name))
+
         # Show loading sequence for better UX
         status.update("[info]Initializing system components...[/info]")
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
         status.update("[info]Loading security knowledge base...[/info]")
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
         status.update("[info]Configuring agent workflow...[/info]")
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
 
         status.update("[info]Setting up sequential agent pipeline...[/info]")
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+
+        try:
+            await warmup
+        except Exception as e:
+            # The model is created again (and errors reported) on first use
+            logger.warning(f"Could not initialize model {model_name}: {e}")
 
         status.update("[green]System ready![/green]")
 
@@ -609,235 +1211,67 @@ async def interactive_mode(
     console.print("\nType your security query to get started, or type /help for available commands.")
     console.print()
 
-    example_queries = [
-        "What are the latest zero-day vulnerabilities in Apache Struts?",
-        "How can organizations protect against Log4Shell vulnerabilities?",
-        "What are the common exploit techniques for SQL injection?",
-        "How can I detect if my system has been compromised by a zero-day exploit?",
-        "What security vulnerabilities affect Docker containers?",
-    ]
-
-    last_query = None
-    show_rag_info = show_rag  # Flag to control RAG information display
-    show_execution_plan = show_plan  # Flag to control execution plan display
-    auto_export = auto_export_md  # Flag to control auto Markdown export
+    state = CLIState(
+        model_name=model_name,
+        debug=debug,
+        verbose=verbose,
+        show_rag=show_rag,
+        show_plan=show_plan,
+        auto_export=auto_export_md,
+    )
 
     while True:
         try:
-            query = Prompt.ask("\n[bold cyan]Scout Agent[/bold cyan]")
+            query = Prompt.ask(_QUERY_PROMPT)
 
             # Process commands (starting with /)
             if query.startswith('/'):
                 cmd = query.lower().strip()
-
-                # Exit commands
-                if cmd in ["/exit", "/quit", "/bye", "/q"]:
-                    console.print("[info]Exiting Scout Agent CLI.[/info]")
-                    break
-
-                # Help commands
-                elif cmd.startswith("/help"):
-                    # Check if detailed help requested
-                    if "detailed" in cmd or "full" in cmd:
-                        display_commands(detailed=True)
-                    else:
-                        display_commands(detailed=False)
-                    continue
-
-                # Example queries
-                elif cmd in ["/examples", "/example", "/ex"]:
-                    console.print("\n[info]Example security queries:[/info]")
-                    for i, example in enumerate(example_queries, 1):
-                        console.print(f"  [suggestion]{i}. {example}[/suggestion]")
-                    continue
-
-                # Show agent structure
-                elif cmd in ["/agents", "/agent", "/structure", "/workflow"]:
-                    display_agent_structure()
-                    continue
-
-                # Query suggestions
-                elif cmd.startswith("/suggest"):
-                    if not last_query:
-                        console.print("[error]No previous query to suggest improvements for.[/error]")
-                        continue
-
-                    with Status("[info]Generating query suggestions...[/info]", spinner="dots"):
-                        suggestions = suggest_query_improvements(last_query, model_name)
-
-                    if suggestions:
-                        console.print("\n[info]Suggested query improvements:[/info]")
-                        suggestions_table = Table(box=box.SIMPLE, show_header=False)
-                        suggestions_table.add_column("", style="suggestion")
-
-                        for i, suggestion in enumerate(suggestions, 1):
-                            suggestions_table.add_row(f"{i}. {suggestion}")
-
-                        console.print(Panel(suggestions_table, title="Query Suggestions", border_style="yellow"))
-                    else:
-                        console.print("[error]Could not generate suggestions.[/error]")
-                    continue
-
-                # Enhance last query
-                elif cmd.startswith("/enhance"):
-                    if not last_query:
-                        console.print("[error]No previous query to enhance.[/error]")
-                        continue
-
-                    # Enhance the query
-                    with Status("[info]Enhancing your query...[/info]", spinner="dots"):
-                        enhanced_query = await enhance_query(last_query, model_name)
-
-                    if enhanced_query and enhanced_query != last_query:
-                        console.print("\n[info]Enhanced query for better results:[/info]")
-                        console.print(Panel(
-                            f"[bold]Original:[/bold] {last_query}\n\n[bold]Enhanced:[/bold] {enhanced_query}",
-                            title="Query Enhancement",
-                            border_style="yellow"
-                        ))
-
-                        # Ask if they want to use this query now
-                        use_now = Prompt.ask("Process this enhanced query now?", choices=["y", "n"], default="n")
-                        if use_now.lower() == "y":
-                            # Process the enhanced query with display settings
-                            response = await process_query(
-                                enhanced_query, 
-                                model_name, 
-                                verbose, 
-                                show_rag=show_rag_info,
-                                show_plan=show_execution_plan
-                            )
-
-                            if response:
-                                # The formatted output is already displayed in process_query if show_agent_outputs=True
-
-                                # Display the final response with markdown formatting
-                                console.print("\n[bold green]Agent Response:[/bold green]")
-                                console.print(Panel(Markdown(response), title="[bold]Final Analysis[/bold]", border_style="green", expand=False))
-                    else:
-                        console.print("[info]Could not further enhance the query.[/info]")
-                    continue
-
-                # Debug toggle
-                elif cmd == "/debug":
-                    # Toggle debug mode
-                    current_level = logger.getEffectiveLevel()
-                    if current_level == logging.DEBUG:
-                        set_log_level(debug=False, verbose=False)
-                        console.print("[info]Debug mode disabled[/info]")
-                    else:
-                        set_log_level(debug=True, verbose=False)
-                        console.print("[info]Debug mode enabled[/info]")
-                    continue
-
-                # Verbose toggle
-                elif cmd == "/verbose":
-                    # Toggle verbose mode
-                    current_level = logger.getEffectiveLevel()
-                    if current_level == logging.INFO:
-                        set_log_level(debug=False, verbose=False)
-                        console.print("[info]Verbose mode disabled[/info]")
-                    else:
-                        set_log_level(debug=False, verbose=True)
-                        console.print("[info]Verbose mode enabled[/info]")
-                    continue
-
-                # Toggle RAG information display
-                elif cmd == "/rag":
-                    show_rag_info = not show_rag_info
-                    status_message = "enabled" if show_rag_info else "disabled"
-                    console.print(f"[info]RAG information display {status_message}[/info]")
-                    continue
-
-                # Toggle execution plan display
-                elif cmd == "/plan":
-                    show_execution_plan = not show_execution_plan
-                    status_message = "enabled" if show_execution_plan else "disabled"
-                    console.print(f"[info]Execution plan display {status_message}[/info]")
-                    continue
-
-                # Export results to PDF
-                elif cmd.startswith("/export"):
-                    # Toggle auto-export if specified
-                    if "auto" in cmd:
-                        auto_export = not auto_export
-                        status_message = "enabled" if auto_export else "disabled"
-                        console.print(f"[info]Automatic Markdown export {status_message}[/info]")
-                        continue
-
-                    if last_query is None:
-                        console.print("[error]No query has been processed yet.[/error]")
-                        continue
-
-                    # Check if we have results to export
-                    if "final_response" not in locals() or not final_response or "agent_outputs" not in locals() or not agent_outputs:
-                        console.print("[error]No results available to export.[/error]")
-                        continue
-
-                    # Check if Markdown export is supported
-                    if not markdown_export_supported:
-                        console.print("[md.error]Markdown export not available.[/md.error]")
-                        continue
-
-                    # Include sources by default, unless explicitly disabled
-                    include_sources = True
-                    if "no-sources" in cmd or "nosources" in cmd:
-                        include_sources = False
-
-                    # Export to Markdown
-                    from src.apps.markdown_utils import export_results_to_markdown
-                    export_results_to_markdown(
-                        query=last_query,
-                        final_response=final_response,
-                        agent_outputs=agent_outputs,
-                        include_sources=include_sources,
-                        console=console
-                    )
-                    continue
-
-                # Clear screen
-                elif cmd == "/clear":
-                    console.clear()
-                    display_logo()
-                    console.print()
-                    display_commands()
-                    continue
-
-                # Unknown command
-                else:
+                # Resolve the command word (and its aliases) with one lookup
+                handler = COMMANDS.get(cmd.split(maxsplit=1)[0])
+                if handler is None:
                     console.print(f"[error]Unknown command: {cmd}[/error]")
                     console.print("[info]Type /help to see available commands[/info]")
-                    continue
+                elif await handler(state, cmd):
+                    break
+                continue
 
             # Empty query
             if not query.strip():
                 continue
 
             # Save query for suggestion feature
-            last_query = query
+            state.last_query = query
+
+            # Initialize the agents while the query is enhanced and confirmed
+            orchestrator_task = start_orchestrator_init(model_name)
 
             # QUERY ENHANCEMENT STEP - Improve query before sending to agents
             enhanced_query = await enhance_query(query, model_name)
 
             # If the query was enhanced, show the enhancement and ask for confirmation
             if enhanced_query != query:
-                console.print("\n[info]I've enhanced your query for better results:[/info]")
-                console.print(Panel(
-                    f"[bold]Original:[/bold] {query}\n\n[bold]Enhanced:[/bold] {enhanced_query}",
-                    title="Query Enhancement",
-                    border_style="yellow"
-                ))
+                console.print(
+                    "\n[info]I've enhanced your query for better results:[/info]",
+                    Panel(
+                        f"[bold]Original:[/bold] {query}\n\n[bold]Enhanced:[/bold] {enhanced_query}",
+                        title="Query Enhancement",
+                        border_style="yellow"
+                    ),
+                    sep="\n",
+                )
 
                 # Ask for user confirmation or modification
-                confirmation = Prompt.ask("\n[bold cyan]Use this enhanced query?[/bold cyan] ([green]y[/green]/[red]n[/red]/[yellow]edit[/yellow])")
+                confirmation = Prompt.ask(_USE_ENHANCED_PROMPT)
 
-                if confirmation.lower() in ["y", "yes"]:
+                answer = confirmation.lower()
+                if answer in _YES:
                     # Use the enhanced query
                     query_to_process = enhanced_query
                     console.print("\n[info]Using enhanced query[/info]")
-                elif confirmation.lower() in ["e", "edit"]:
+                elif answer in _EDIT:
                     # Let user edit the query
-                    edited_query = Prompt.ask("\n[bold cyan]Edit query[/bold cyan]", default=enhanced_query)
+                    edited_query = Prompt.ask(_EDIT_PROMPT, default=enhanced_query)
                     query_to_process = edited_query
                     console.print("\n[info]Using edited query[/info]")
                 else:
@@ -853,26 +1287,36 @@ async def interactive_mode(
             result = await process_query(
                 query_to_process, 
                 model_name, 
-                verbose, 
-                show_rag=show_rag_info,
-                show_plan=show_execution_plan
+                state.verbose, 
+                show_rag=state.show_rag,
+                show_plan=state.show_plan,
+                orchestrator_task=orchestrator_task,
             )
 
             if result:
-                # Unpack the result tuple
+                # Unpack the result tuple, keeping it for /export
                 final_response, agent_outputs = result
-
-                # Display the final response with markdown formatting
-                console.print("\n[bold green]Agent Response:[/bold green]")
-                console.print(Panel(Markdown(final_response), title="[bold]Final Analysis[/bold]", border_style="green", expand=False))
-
-                # Suggest improvements
-                console.print("\n[info]Type /suggest to get query improvement suggestions[/info]")
+                state.set_results(query_to_process, final_response, agent_outputs)
+
+                # Display the final response with markdown formatting. It is
+                # usually the analyst's output, which was just parsed for the
+                # workflow panels, so formatting it the same way reuses that parse.
+                # The final panel and the /suggest hint print in one write
+                console.print(
+                    "\n[bold green]Agent Response:[/bold green]",
+                    Panel(
+                        _markdown(format_output_markdown(final_response, "analyst")),
+                        title="[bold]Final Analysis[/bold]",
+                        border_style="green",
+                        expand=False
+                    ),
+                    "\n[info]Type /suggest to get query improvement suggestions[/info]",
+                    sep="\n",
+                )
 
                 # Auto-export to Markdown if enabled
-                if auto_export and markdown_export_supported:
+                if state.auto_export and markdown_export_supported:
                     console.print("\n[info]Auto-exporting results to Markdown...[/info]")
-                    from src.apps.markdown_utils import export_results_to_markdown
                     export_results_to_markdown(
                         query=query_to_process,
                         final_response=final_response,
@@ -898,7 +1342,7 @@ async def interactive_mode(
                 break
         except Exception as e:
             console.print(f"\n[error]Error: {str(e)}[/error]")
-            if verbose:
+            if state.verbose or state.debug:
                 import traceback
                 console.print(Panel(traceback.format_exc(), title="[error]Error Details[/error]", border_style="red"))
 
@@ -928,6 +1372,20 @@ async def main():
         help="Security query to process (if not provided, runs in interactive mode)"
     )
 
+    parser.add_argument(
+        "--batch-file",
+        type=str,
+        default=None,
+        help="File with one security query per line to process concurrently",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of queries processed at once with --batch-file",
+    )
+
     parser.add_argument(
         "--model",
         "-m",
@@ -990,10 +1448,64 @@ async def main():
     set_log_level(debug=args.debug, verbose=args.verbose)
 
     # Load environment variables
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     try:
-        if args.query:
+        if args.batch_file:
+            # Process a file of queries concurrently
+            display_logo()
+            console.print()
+
+            with open(args.batch_file, 'r') as f:
+                queries = [line.strip() for line in f if line.strip()]
+            if not queries:
+                console.print(f"[error]No queries found in {args.batch_file}[/error]")
+                return 1
+
+            console.print(
+                f"[info]Processing {len(queries)} queries "
+                f"(up to {args.concurrency} at a time)...[/info]"
+            )
+            start_time = time.time()
+            results = await batch_process_queries(queries, args.model, args.concurrency)
+            console.print(
+                f"[step.complete]✓ Processed {len(queries)} queries in "
+                f"{time.time() - start_time:.2f} seconds[/step.complete]"
+            )
+
+            failures = 0
+            for query, result in zip(queries, results):
+                if isinstance(result, BaseException):
+                    failures += 1
+                    console.print(
+                        f"\n[query]Query: {query}[/query]",
+                        f"[error]Error processing query: {result}[/error]",
+                        sep="\n",
+                    )
+                    continue
+
+                formatted_md = format_output_markdown(result["final_response"], "analyst")
+                console.print(
+                    f"\n[query]Query: {query}[/query]",
+                    Panel(_markdown(formatted_md), title="[bold]Final Analysis[/bold]", border_style="green", expand=False),
+                    sep="\n",
+                )
+
+                # Export to Markdown if requested
+                if args.export_md and markdown_export_supported:
+                    export_results_to_markdown(
+                        query=query,
+                        final_response=result["final_response"],
+                        agent_outputs=result["agent_outputs"],
+                        include_sources=not args.no_sources,
+                        console=console
+                    )
+
+            return 1 if failures else 0
+
+        elif args.query:
             # Process a single query
             # Display logo for consistency
             display_logo()
@@ -1001,18 +1513,24 @@ async def main():
 
             query_to_process = args.query
 
+            # Initialize the agents while the query is enhanced
+            orchestrator_task = start_orchestrator_init(args.model)
+
             # Enhance the query if requested
             if args.enhance and not args.no_enhancement:
                 console.print(f"\n[query]Original query: {args.query}[/query]")
                 enhanced_query = await enhance_query(args.query, args.model)
 
                 if enhanced_query != args.query:
-                    console.print("\n[info]Enhanced query for better results:[/info]")
-                    console.print(Panel(
-                        f"[bold]Enhanced:[/bold] {enhanced_query}",
-                        title="Query Enhancement",
-                        border_style="yellow"
-                    ))
+                    console.print(
+                        "\n[info]Enhanced query for better results:[/info]",
+                        Panel(
+                            f"[bold]Enhanced:[/bold] {enhanced_query}",
+                            title="Query Enhancement",
+                            border_style="yellow"
+                        ),
+                        sep="\n",
+                    )
                     query_to_process = enhanced_query
 
             # Process the query (original or enhanced) with display settings (unless disabled)
@@ -1021,93 +1539,32 @@ async def main():
                 args.model, 
                 args.verbose or args.debug, 
                 show_rag=not args.no_rag,
-                show_plan=not args.no_plan
+                show_plan=not args.no_plan,
+                orchestrator_task=orchestrator_task,
             )
 
             if response:
-                # Display the result in a formatted way
-                console.print("\n[bold green]Agent Response:[/bold green]")
-
-                # Get result with agent outputs
-                try:
-                    # Initialize the orchestrator agent for accessing outputs
-                    orchestrator = OrchestratorAgent(model_name=args.model)
-
-                    # Process the query to get all agent outputs
-                    result = await orchestrator.process_query(query_to_process)
-                    final_response = result["final_response"]
-                    agent_outputs = result["agent_outputs"]
-
-                    # Display individual agent outputs
-                    console.print("\n[bold]Agent Workflow Results:[/bold]")
-
-                    # Planner output
-                    if agent_outputs.get("security_planner", {}).get("output"):
-                        planner_md = await format_output_markdown(agent_outputs["security_planner"]["output"], "planner")
-                        console.print(Panel(
-                            Markdown(planner_md),
-                            title="[agent.planner]Research Plan[/agent.planner]",
-                            border_style="cyan",
-                            expand=False
-                        ))
-
-                    # Researcher output with RAG information
-                    if agent_outputs.get("security_researcher", {}).get("output"):
-                        researcher_md = await format_output_markdown(agent_outputs["security_researcher"]["output"], "researcher")
-
-                        # Parse for research sources information if present
-                        if "## Research Sources" in researcher_md:
-                            # Split the research findings from the sources information
-                            parts = researcher_md.split("## Research Sources", 1)
-                            research_content = parts[0].strip()
-                            sources_section = "## Research Sources" + parts[1]
-
-                            # Display research findings
-                            console.print(Panel(
-                                Markdown(research_content),
-                                title="[agent.researcher]Research Findings[/agent.researcher]",
-                                border_style="blue",
-                                expand=False
-                            ))
-
-                            # Display research sources information in a highlighted panel only if enabled
-                            if not args.no_rag:
-                                console.print(Panel(
-                                    Markdown(sources_section),
-                                    title="[bright_cyan]Research Sources[/bright_cyan]",
-                                    border_style="cyan",
-                                    expand=False
-                                ))
-                        else:
-                            # Display as usual if no RAG section found
-                            console.print(Panel(
-                                Markdown(researcher_md),
-                                title="[agent.researcher]Research Findings[/agent.researcher]",
-                                border_style="blue",
-                                expand=False
-                            ))
-
-                    # Display final response
-                    formatted_md = await format_output_markdown(final_response, "analyst")
-                    console.print(Panel(Markdown(formatted_md), title="[bold]Final Analysis[/bold]", border_style="green", expand=False))
-
-                    # Export to Markdown if requested
-                    if args.export_md and markdown_export_supported:
-                        console.print("\n[info]Exporting results to Markdown...[/info]")
-                        from src.apps.markdown_utils import export_results_to_markdown
-                        export_results_to_markdown(
-                            query=query_to_process,
-                            final_response=final_response,
-                            agent_outputs=agent_outputs,
-                            include_sources=not args.no_sources,
-                            console=console
-                        )
-                except Exception as e:
-                    # Fallback to simple formatting if the new method fails
-                    if args.debug:
-                        console.print(f"[yellow]Error accessing agent outputs: {e}[/yellow]")
-                    formatted_md = await format_output_markdown(response, "analyst")
-                    console.print(Panel(Markdown(formatted_md), title="[bold]Analysis[/bold]", border_style="green", expand=False))
+                # process_query has already shown the individual agent outputs
+                final_response, agent_outputs = response
+
+                # Display final response
+                formatted_md = format_output_markdown(final_response, "analyst")
+                console.print(
+                    "\n[bold green]Agent Response:[/bold green]",
+                    Panel(_markdown(formatted_md), title="[bold]Final Analysis[/bold]", border_style="green", expand=False),
+                    sep="\n",
+                )
+
+                # Export to Markdown if requested
+                if args.export_md and markdown_export_supported:
+                    console.print("\n[info]Exporting results to Markdown...[/info]")
+                    export_results_to_markdown(
+                        query=query_to_process,
+                        final_response=final_response,
+                        agent_outputs=agent_outputs,
+                        include_sources=not args.no_sources,
+                        console=console
+                    )
 
         else:
             # Run in interactive mode with all flags
@@ -1116,7 +1573,8 @@ async def main():
                 args.verbose or args.debug, 
                 show_rag=not args.no_rag,
                 show_plan=not args.no_plan,
-                auto_export_md=args.export_md
+                auto_export_md=args.export_md,
+                debug=args.debug,
             )
 
     except KeyboardInterrupt:
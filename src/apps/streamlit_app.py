@@ -3,6 +3,10 @@ Streamlit app to demonstrate the RAG pipeline functionality.
 """
 import os
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
 import streamlit as st
 from dotenv import load_dotenv
 
@@ -13,6 +17,9 @@ from config.config_manager import get_config
 # Load environment variables
 load_dotenv()
 
+# Maximum number of files uploaded to GCS at the same time
+UPLOAD_CONCURRENCY = 16
+
 # Set page config
 st.set_page_config(
     page_title="Zero-Day Scout RAG Demo",
@@ -21,11 +28,127 @@ st.set_page_config(
 )
 
 
+@st.cache_resource
+def get_pipeline() -> VertexRagPipeline:
+    """
+    Get the RAG pipeline shared by all sessions.
+
+    Creating the pipeline authenticates with Vertex AI and looks up the
+    corpus, so it is done once per server process rather than per session.
+    Failures are not cached, so a new session retries.
+    """
+    return VertexRagPipeline()
+
+
+@st.cache_resource
+def get_gcs_manager() -> GcsManager:
+    """Get the GCS manager shared by all sessions."""
+    return GcsManager()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_gcs(prefix: str) -> List[str]:
+    """
+    List the GCS files under a prefix, cached for a minute.
+
+    Args:
+        prefix: GCS path prefix (empty for the whole bucket)
+
+    Returns:
+        GCS file paths (gs://bucket/path/to/file)
+    """
+    return get_gcs_manager().fast_list_files(prefix)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _list_corpus() -> List[Dict[str, str]]:
+    """
+    List the files in the RAG corpus, cached for a minute.
+
+    The pager is drained into plain dictionaries so the result can be cached.
+
+    Returns:
+        One row per file with its ID, display name and state
+    """
+    return [
+        {
+            "ID": getattr(file_info, "name", "Unknown"),
+            "Name": getattr(file_info, "display_name", "Unknown"),
+            "State": str(getattr(file_info, "state", "Unknown")),
+        }
+        for file_info in get_pipeline().list_corpus_files()
+    ]
+
+
+def _clear_listings() -> None:
+    """Drop the cached GCS and corpus listings after this app changed them."""
+    _list_gcs.clear()
+    _list_corpus.clear()
+
+
+def _wait_with_progress(
+    import_op,
+    progress_bar,
+    status_text,
+    poll: float = 1.0,
+    timeout: float = 600.0,
+    expected: float = 120.0,
+) -> bool:
+    """
+    Wait for an ingestion operation, polling it and updating the progress bar.
+
+    The import API doesn't report progress, so the bar advances with the
+    elapsed time relative to a typical ingestion and completes when the
+    operation does.
+
+    Args:
+        import_op: Operation returned by ingest_documents
+        progress_bar: Streamlit progress bar to update
+        status_text: Streamlit placeholder for status messages
+        poll: Seconds between status checks
+        timeout: Seconds to wait before giving up
+        expected: Typical ingestion time in seconds, used to scale the bar
+
+    Returns:
+        True if the operation completed within the timeout
+    """
+    start_time = time.time()
+    while not import_op.operation.done():
+        elapsed = time.time() - start_time
+        if elapsed > timeout:
+            status_text.text(f"Ingestion still running after {timeout:.0f} seconds; check back later.")
+            return False
+        progress_bar.progress(min(elapsed / expected, 0.99))
+        status_text.text(f"Waiting for ingestion to complete... ({elapsed:.0f}s)")
+        time.sleep(poll)
+
+    progress_bar.progress(1.0)
+    status_text.text("Ingestion completed!")
+    return True
+
+
+def _extract_content(retrieval) -> Optional[str]:
+    """
+    Get the text of a retrieved context, whichever form the API returned it in.
+
+    Args:
+        retrieval: Retrieved context object
+
+    Returns:
+        The context text, or None if it has none
+    """
+    return (
+        getattr(retrieval, "text", None)
+        or getattr(getattr(retrieval, "chunk", None), "data", None)
+        or getattr(retrieval, "content", None)
+    )
+
+
 def initialize_session_state():
     """Initialize session state variables."""
     if "pipeline" not in st.session_state:
         try:
-            st.session_state.pipeline = VertexRagPipeline()
+            st.session_state.pipeline = get_pipeline()
             st.session_state.pipeline_initialized = True
         except Exception as e:
             st.session_state.pipeline_initialized = False
@@ -33,7 +156,7 @@ def initialize_session_state():
     
     if "gcs_manager" not in st.session_state:
         try:
-            st.session_state.gcs_manager = GcsManager()
+            st.session_state.gcs_manager = get_gcs_manager()
             st.session_state.gcs_initialized = True
         except Exception as e:
             st.session_state.gcs_initialized = False
@@ -102,17 +225,25 @@ def main():
                 st.error("RAG Pipeline not initialized. Check connection status.")
                 return
             
-            with st.spinner("Generating answer..."):
+            with st.status("Generating answer...", expanded=False) as status:
                 try:
-                    # Retrieve context if showing it
+                    # Retrieve context if showing it, getting the model client
+                    # ready at the same time when the answer is generated from it
                     retrievals = None
                     if show_context:
-                        retrievals = st.session_state.pipeline.retrieve_context(
-                            query=query,
-                            top_k=top_k
-                        )
+                        status.update(label="Retrieving context...")
+                        with ThreadPoolExecutor(max_workers=2) as executor:
+                            retrieval_future = executor.submit(
+                                st.session_state.pipeline.retrieve_context,
+                                query=query,
+                                top_k=top_k
+                            )
+                            if not use_direct_integration:
+                                executor.submit(st.session_state.pipeline.get_generative_model)
+                            retrievals = retrieval_future.result()
                     
                     # Generate answer
+                    status.update(label="Generating answer with the LLM...")
                     start_time = time.time()
                     if use_direct_integration:
                         answer = st.session_state.pipeline.direct_rag_response(
@@ -128,18 +259,19 @@ def main():
                         )
                     elapsed_time = time.time() - start_time
                     
-                    # Add to history
+                    # Add to history, with the context text extracted once so
+                    # reruns only redisplay it
                     st.session_state.history.append({
                         "query": query,
                         "answer": answer,
-                        "retrievals": retrievals,
+                        "retrieval_texts": [_extract_content(r) for r in retrievals or ()],
                         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
                         "elapsed": elapsed_time
                     })
                     
-                    # Display answer
-                    st.success(f"Answer generated in {elapsed_time:.2f} seconds")
+                    status.update(label=f"Answer generated in {elapsed_time:.2f} seconds", state="complete")
                 except Exception as e:
+                    status.update(label="Error generating answer", state="error", expanded=True)
                     st.error(f"Error generating answer: {e}")
         
         # Display context and answer if available
@@ -151,25 +283,11 @@ def main():
             st.markdown(latest["answer"])
             
             # Display context if requested
-            if show_context and latest["retrievals"]:
+            if show_context and latest["retrieval_texts"]:
                 with st.expander("Retrieved Context", expanded=True):
-                    for i, retrieval in enumerate(latest["retrievals"]):
+                    for i, content in enumerate(latest["retrieval_texts"]):
                         st.markdown(f"**Document {i+1}**")
-                        
-                        # Extract and display content
-                        content = None
-                        if hasattr(retrieval, "text"):
-                            content = retrieval.text
-                        elif hasattr(retrieval, "chunk") and hasattr(retrieval.chunk, "data"):
-                            content = retrieval.chunk.data
-                        elif hasattr(retrieval, "content"):
-                            content = retrieval.content
-                        
-                        if content:
-                            st.markdown(content)
-                        else:
-                            st.markdown("_No content found_")
-                        
+                        st.markdown(content or "_No content found_")
                         st.divider()
     
     # Tab 2: Ingest Documents
@@ -187,23 +305,24 @@ def main():
             
             prefix = st.text_input("GCS Path Prefix (optional):")
             
-            if st.button("List Files"):
+            list_col, refresh_col = st.columns(2)
+            with list_col:
+                list_clicked = st.button("List Files")
+            with refresh_col:
+                refresh_clicked = st.button("Refresh", key="refresh_gcs_files")
+            
+            if list_clicked or refresh_clicked:
                 if not st.session_state.gcs_initialized:
                     st.error("GCS connection not initialized. Check connection status.")
                     return
                 
+                # Listings are cached briefly; Refresh fetches them again
+                if refresh_clicked:
+                    _list_gcs.clear()
+                
                 with st.spinner("Listing files..."):
                     try:
-                        gcs_paths_result = st.session_state.gcs_manager.list_files(prefix)
-                        
-                        # Handle potential pager objects
-                        try:
-                            gcs_paths = list(gcs_paths_result)
-                        except Exception:
-                            # If conversion fails, try to iterate manually
-                            gcs_paths = []
-                            for path in gcs_paths_result:
-                                gcs_paths.append(path)
+                        gcs_paths = _list_gcs(prefix)
                         
                         if gcs_paths:
                             st.session_state.gcs_paths = gcs_paths
@@ -218,6 +337,10 @@ def main():
                     except Exception as e:
                         st.error(f"Error listing files: {e}")
             
+            # Asked before ingesting, since widgets created after the button
+            # click are reset by the rerun they trigger
+            wait = st.checkbox("Wait for ingestion to complete?", key="wait_gcs_ingestion")
+            
             # Ingest button (only enabled if files are listed)
             ingest_button = st.button(
                 "Ingest Documents",
@@ -234,26 +357,16 @@ def main():
                         import_op = st.session_state.pipeline.ingest_documents(
                             st.session_state.gcs_paths
                         )
+                        _clear_listings()
                         st.success(f"Started ingestion of {len(st.session_state.gcs_paths)} documents")
                         
-                        # Check if operation has a wait method
-                        if import_op and hasattr(import_op, "operation"):
-                            wait = st.checkbox("Wait for ingestion to complete?")
-                            if wait:
-                                progress_bar = st.progress(0)
-                                status_text = st.empty()
-                                
-                                # Simple progress simulation
-                                for i in range(100):
-                                    progress_bar.progress(i + 1)
-                                    status_text.text(f"Processing... ({i+1}%)")
-                                    time.sleep(0.1)
-                                
-                                # Actual wait
-                                status_text.text("Waiting for operation to complete...")
-                                import_op.operation.wait()
-                                status_text.text("Ingestion completed!")
+                        # Check if operation can be polled
+                        if wait and import_op and hasattr(import_op, "operation"):
+                            progress_bar = st.progress(0)
+                            status_text = st.empty()
+                            if _wait_with_progress(import_op, progress_bar, status_text):
                                 st.balloons()
+                            _clear_listings()
                     except Exception as e:
                         st.error(f"Error ingesting documents: {e}")
         
@@ -282,6 +395,7 @@ def main():
                 gcs_prefix = st.text_input("GCS Prefix for uploaded files:", value="uploaded_papers/")
             with upload_col2:
                 include_timestamp = st.checkbox("Add timestamp to filenames", value=True)
+            wait = st.checkbox("Wait for ingestion to complete?", key="wait_upload_ingestion")
             
             if st.button("Upload and Ingest") and uploaded_files:
                 if not st.session_state.gcs_initialized or not st.session_state.pipeline_initialized:
@@ -290,56 +404,51 @@ def main():
                 
                 with st.spinner("Uploading and ingesting documents..."):
                     try:
-                        # Create temp directory for files
-                        import tempfile
-                        import uuid
-                        
-                        # Track uploaded GCS paths
-                        uploaded_gcs_paths = []
-                        
                         # Progress indicators
                         progress_bar = st.progress(0)
                         status_text = st.empty()
                         
-                        # Process each file
-                        for i, file in enumerate(uploaded_files):
-                            # Update progress
-                            progress = (i / len(uploaded_files))
-                            progress_bar.progress(progress)
-                            status_text.text(f"Uploading {file.name}...")
-                            
-                            # Create a temporary file
-                            temp_dir = tempfile.mkdtemp()
-                            temp_path = os.path.join(temp_dir, file.name)
-                            
-                            # Write the uploaded file to the temp file
-                            with open(temp_path, "wb") as f:
-                                f.write(file.getbuffer())
-                            
+                        # Files in one upload share a timestamp; the UUID keeps names unique
+                        timestamp = time.strftime("%Y%m%d-%H%M%S")
+
+                        # Choose each file's GCS path
+                        work = []
+                        for file in uploaded_files:
                             # Determine GCS path
                             filename = file.name
                             if include_timestamp:
                                 name, ext = os.path.splitext(filename)
-                                timestamp = time.strftime("%Y%m%d-%H%M%S")
-                                unique_id = str(uuid.uuid4())[:8]  # Use part of a UUID for uniqueness
+                                unique_id = uuid.uuid4().hex[:8]  # Use part of a UUID for uniqueness
                                 filename = f"{name}_{timestamp}_{unique_id}{ext}"
                             
-                            gcs_path = os.path.join(gcs_prefix, filename)
-                            
-                            # Upload to GCS
-                            gcs_uri = st.session_state.gcs_manager.upload_file(temp_path, gcs_path)
-                            uploaded_gcs_paths.append(gcs_uri)
-                            
-                            # Clean up temp file
-                            os.remove(temp_path)
-                            os.rmdir(temp_dir)
+                            work.append((file, os.path.join(gcs_prefix, filename)))
                         
+                        # Upload the files in parallel straight from memory, tracking
+                        # the GCS paths in upload order
+                        uploaded_gcs_paths = [None] * len(work)
+                        status_text.text(f"Uploading {len(work)} files...")
+                        with ThreadPoolExecutor(max_workers=min(UPLOAD_CONCURRENCY, len(work))) as executor:
+                            futures = {
+                                executor.submit(
+                                    st.session_state.gcs_manager.upload_fileobj, file, gcs_path, file.type
+                                ): i
+                                for i, (file, gcs_path) in enumerate(work)
+                            }
+                            for completed, future in enumerate(as_completed(futures), 1):
+                                uploaded_gcs_paths[futures[future]] = future.result()
+                                progress_bar.progress(completed / len(work))
+                                status_text.text(f"Uploaded {completed}/{len(work)} files...")
+                        
+                        # The new files show up in the listings right away
+                        _clear_listings()
+
                         # Update progress to show completion of uploads
                         progress_bar.progress(1.0)
                         status_text.text(f"Successfully uploaded {len(uploaded_gcs_paths)} files. Starting ingestion...")
                         
                         # Ingest uploaded documents
                         import_op = st.session_state.pipeline.ingest_documents(uploaded_gcs_paths)
+                        _clear_listings()
                         
                         # Show success message
                         st.success(f"Successfully uploaded and started ingestion of {len(uploaded_gcs_paths)} documents")
@@ -349,23 +458,16 @@ def main():
                         })
                         
                         # Wait for ingestion to complete
-                        wait = st.checkbox("Wait for ingestion to complete?")
                         if wait and hasattr(import_op, "operation"):
                             wait_status = st.empty()
                             wait_progress = st.progress(0)
-                            
-                            # Wait with a simulated progress bar
-                            wait_status.text("Waiting for ingestion to complete...")
-                            for i in range(100):
-                                wait_progress.progress(i + 1)
-                                time.sleep(0.1)
-                            
-                            # Actual wait
-                            import_op.operation.wait()
-                            wait_status.text("Ingestion completed!")
-                            st.balloons()
+                            if _wait_with_progress(import_op, wait_progress, wait_status):
+                                st.balloons()
+                            _clear_listings()
                             
                     except Exception as e:
+                        # Some files may have been uploaded before the failure
+                        _clear_listings()
                         st.error(f"Error uploading and ingesting documents: {e}")
                         st.exception(e)
     
@@ -373,62 +475,29 @@ def main():
     with tab3:
         st.header("Corpus Files")
         
-        if st.button("List Corpus Files"):
+        list_col, refresh_col = st.columns(2)
+        with list_col:
+            list_clicked = st.button("List Corpus Files")
+        with refresh_col:
+            refresh_clicked = st.button("Refresh", key="refresh_corpus_files")
+        
+        if list_clicked or refresh_clicked:
             if not st.session_state.pipeline_initialized:
                 st.error("RAG Pipeline not initialized. Check connection status.")
                 return
             
+            # Listings are cached briefly; Refresh fetches them again
+            if refresh_clicked:
+                _list_corpus.clear()
+            
             with st.spinner("Listing corpus files..."):
                 try:
-                    # Get files - ListRagFilesPager needs to be converted to a list
-                    files_pager = st.session_state.pipeline.list_corpus_files()
-                    
-                    # Convert pager to list
-                    try:
-                        files = list(files_pager)
-                        if files:
-                            st.success(f"Found {len(files)} files in corpus")
-                            
-                            # Display files table
-                            file_data = []
-                            for file_info in files:
-                                file_data.append({
-                                    "ID": file_info.name if hasattr(file_info, "name") else "Unknown",
-                                    "Name": file_info.display_name if hasattr(file_info, "display_name") else "Unknown",
-                                    "State": file_info.state if hasattr(file_info, "state") else "Unknown",
-                                })
-                            
-                            if file_data:
-                                st.table(file_data)
-                            else:
-                                st.warning("Files found but could not extract their details")
-                        else:
-                            st.warning("No files found in corpus")
-                    except Exception as pager_error:
-                        st.error(f"Error processing file list: {pager_error}")
-                        
-                        # Alternative: try to iterate manually
-                        st.info("Trying alternative method to list files...")
-                        file_data = []
-                        file_count = 0
-                        
-                        try:
-                            for file_info in files_pager:
-                                file_count += 1
-                                file_data.append({
-                                    "ID": file_info.name if hasattr(file_info, "name") else "Unknown",
-                                    "Name": file_info.display_name if hasattr(file_info, "display_name") else "Unknown",
-                                    "State": file_info.state if hasattr(file_info, "state") else "Unknown",
-                                })
-                            
-                            if file_data:
-                                st.success(f"Found {file_count} files in corpus")
-                                st.table(file_data)
-                            else:
-                                st.warning("No files found in corpus")
-                        except Exception as iteration_error:
-                            st.error(f"Error during manual iteration: {iteration_error}")
-                    
+                    file_data = _list_corpus()
+                    if file_data:
+                        st.success(f"Found {len(file_data)} files in corpus")
+                        st.table(file_data)
+                    else:
+                        st.warning("No files found in corpus")
                 except Exception as e:
                     st.error(f"Error listing corpus files: {e}")
 
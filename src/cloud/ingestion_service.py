@@ -5,7 +5,11 @@ This service can be deployed to Cloud Run and triggered by Cloud Scheduler.
 
 import os
 import json
+import math
+import time
+import uuid
 import logging
+import threading
 from typing import Dict, Any, Optional, List
 from flask import Flask, request, jsonify
 from dotenv import load_dotenv
@@ -31,6 +35,27 @@ app = Flask(__name__)
 pipeline = None
 gcs_manager = None
 
+# Seconds a request with wait_for_completion waits before returning the
+# operation for polling instead
+DEFAULT_WAIT_TIMEOUT = 300
+
+# Longest wait a request may ask for; Cloud Run ends requests after the
+# service's request timeout (540s, see cloudbuild-deploy.yaml)
+MAX_WAIT_TIMEOUT = 540
+
+# GCS folder the operation statuses are stored in, so any instance can
+# answer a status request, including after a restart
+OPERATIONS_PREFIX = "ingestion_operations"
+
+# Number of ingestion operations kept for status polling; the oldest
+# finished ones are dropped beyond this
+MAX_TRACKED_OPERATIONS = 1000
+
+# Ingestion operations by ID, updated by their background wait threads;
+# a per-instance cache of the statuses stored in GCS
+_operations: Dict[str, Dict[str, Any]] = {}
+_operations_lock = threading.Lock()
+
 def initialize_services():
     """Initialize RAG pipeline and GCS manager."""
     global pipeline, gcs_manager
@@ -50,14 +75,103 @@ def initialize_services():
         return False
 
 
-def ingest_documents(prefix: Optional[str] = None, wait_for_completion: bool = False, batch_size: int = 25) -> Dict[str, Any]:
+# Initialize the services when the app is loaded, so the first request doesn't
+# pay for it; requests retry if this fails
+initialize_services()
+
+
+def _operation_path(op_id: str) -> str:
+    """GCS path of an ingestion operation's stored status."""
+    return f"{OPERATIONS_PREFIX}/{op_id}.json"
+
+
+def _update_operation(op_id: str, **fields: Any) -> None:
+    """Update the tracked status of an ingestion operation and store it in GCS."""
+    with _operations_lock:
+        operation = _operations.setdefault(op_id, {})
+        operation.update(fields)
+        record = dict(operation)
+
+        # Drop the oldest finished operations once over the limit
+        if len(_operations) > MAX_TRACKED_OPERATIONS:
+            for old_id in [k for k, v in _operations.items() if v.get("finished_at")]:
+                if len(_operations) <= MAX_TRACKED_OPERATIONS:
+                    break
+                del _operations[old_id]
+
+    try:
+        gcs_manager.write_json(_operation_path(op_id), record)
+    except Exception as e:
+        logger.warning(f"Could not store status of ingestion operation {op_id}: {e}")
+
+
+def get_operation(op_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get the tracked status of an ingestion operation.
+
+    Operations started by another instance, or before a restart, are read
+    from GCS.
+
+    Args:
+        op_id: Operation ID returned when the ingestion was started
+
+    Returns:
+        Copy of the operation's status, or None if it is unknown
+    """
+    with _operations_lock:
+        operation = _operations.get(op_id)
+        if operation:
+            return dict(operation)
+
+    # Operation IDs are hex UUIDs; don't build GCS paths from anything else
+    try:
+        uuid.UUID(hex=op_id)
+    except ValueError:
+        return None
+
+    try:
+        return gcs_manager.read_json(_operation_path(op_id))
+    except Exception as e:
+        logger.warning(f"Could not read status of ingestion operation {op_id}: {e}")
+        return None
+
+
+def _vertex_operation_name(import_op: Any) -> Optional[str]:
+    """Name of the Vertex AI long-running operation behind an import, if known."""
+    return getattr(getattr(import_op.operation, "operation", None), "name", None)
+
+
+def _await_and_record(import_ops: List[Any], op_id: str) -> None:
+    """Wait for import operations in the background and record the outcome."""
+    try:
+        for import_op in import_ops:
+            import_op.operation.wait()
+        _update_operation(op_id, status="completed", finished_at=time.time())
+        logger.info(f"Ingestion operation {op_id} completed")
+    except Exception as e:
+        logger.error(f"Ingestion operation {op_id} failed: {e}")
+        _update_operation(op_id, status="failed", finished_at=time.time(), error=str(e))
+
+
+def ingest_documents(
+    prefix: Optional[str] = None,
+    wait_for_completion: bool = False,
+    batch_size: int = 25,
+    timeout: float = DEFAULT_WAIT_TIMEOUT,
+) -> Dict[str, Any]:
     """
     Ingest documents from GCS bucket with optional prefix.
 
+    The import operations are awaited by a background thread, whose progress
+    can be polled with get_operation using the returned operation ID. The
+    Vertex AI operation names are returned as well, so clients can poll the
+    imports directly if the background thread doesn't get to finish.
+
     Args:
         prefix: Optional GCS path prefix to filter files
-        wait_for_completion: Whether to wait for ingestion to complete
+        wait_for_completion: Whether to wait (up to timeout) for ingestion to complete
         batch_size: Maximum number of GCS URIs to ingest at once (max 25)
+        timeout: Maximum seconds to wait when wait_for_completion is set
 
     Returns:
         Dictionary with ingestion status and details
@@ -65,17 +179,7 @@ def ingest_documents(prefix: Optional[str] = None, wait_for_completion: bool = F
     try:
         # List files in GCS bucket
         logger.info(f"Listing files with prefix: {prefix or 'None'}")
-        gcs_paths = gcs_manager.list_files(prefix)
-
-        # Handle potential pager objects
-        if not isinstance(gcs_paths, list):
-            try:
-                gcs_paths = list(gcs_paths)
-            except Exception:
-                temp_paths = []
-                for path in gcs_paths:
-                    temp_paths.append(path)
-                gcs_paths = temp_paths
+        gcs_paths = gcs_manager.fast_list_files(prefix)
 
         if not gcs_paths:
             logger.warning("No files found to ingest")
@@ -99,19 +203,14 @@ def ingest_documents(prefix: Optional[str] = None, wait_for_completion: bool = F
         failed_batches = 0
         total_batches = len(batches)
 
-        # Process each batch
+        # Process each batch. Batches stay sequential because RAG Engine
+        # rejects an import while another operation runs on the corpus.
         for i, batch in enumerate(batches):
             logger.info(f"Processing batch {i+1}/{total_batches} with {len(batch)} files")
             try:
                 import_op = pipeline.ingest_documents(batch)
                 import_ops.append(import_op)
                 successful_batches += 1
-
-                # Wait for batch completion if requested
-                if wait_for_completion and import_op and hasattr(import_op, "operation"):
-                    logger.info(f"Waiting for batch {i+1} to complete...")
-                    import_op.operation.wait()
-                    logger.info(f"Batch {i+1} completed successfully")
             except Exception as batch_error:
                 logger.error(f"Error in batch {i+1}: {batch_error}")
                 failed_batches += 1
@@ -125,12 +224,48 @@ def ingest_documents(prefix: Optional[str] = None, wait_for_completion: bool = F
         if failed_batches > 0:
             logger.warning(f"{failed_batches} out of {total_batches} batches failed")
 
-        completion_status = "completed" if wait_for_completion else "started"
+        # Wait for the long-running operations in the background, so the
+        # request doesn't hold a worker while they run
+        op_id = uuid.uuid4().hex
+        pending_ops = [op for op in import_ops if op and hasattr(op, "operation")]
+        vertex_operations = [name for name in map(_vertex_operation_name, pending_ops) if name]
+        if pending_ops:
+            _update_operation(
+                op_id,
+                status="running",
+                vertex_operations=vertex_operations,
+                started_at=time.time(),
+                finished_at=None,
+                error=None,
+            )
+            waiter = threading.Thread(target=_await_and_record, args=(pending_ops, op_id), daemon=True)
+            waiter.start()
+
+            # Kept for callers that need to block until ingestion completes
+            if wait_for_completion:
+                logger.info(f"Waiting up to {timeout} seconds for ingestion to complete...")
+                waiter.join(timeout)
+        else:
+            # Nothing to wait for; the imports have already completed
+            _update_operation(
+                op_id,
+                status="completed",
+                vertex_operations=vertex_operations,
+                started_at=time.time(),
+                finished_at=time.time(),
+                error=None,
+            )
+
+        operation = get_operation(op_id)
+        completion_status = "started" if operation["status"] == "running" else operation["status"]
         success_message = f"Ingestion {completion_status}: {successful_batches} successful batches, {failed_batches} failed batches"
 
         return {
             "status": "success",
             "message": success_message,
+            "operation_id": op_id,
+            "operation_status": operation["status"],
+            "vertex_operations": vertex_operations,
             "files_count": total_files,
             "batches_count": total_batches,
             "successful_batches": successful_batches,
@@ -161,10 +296,15 @@ def ingest_endpoint():
     {
         "prefix": "optional/gcs/prefix",
         "wait_for_completion": false,
-        "batch_size": 25
+        "batch_size": 25,
+        "timeout": 300
     }
+
+    Returns 202 while the ingestion is still running; its status can be
+    polled at /operations/<operation_id>, or through the returned Vertex AI
+    operation names. The timeout is capped at MAX_WAIT_TIMEOUT.
     """
-    # Initialize services if needed
+    # Retry initialization if it failed at startup (a no-op otherwise)
     if not initialize_services():
         return jsonify({
             "status": "error",
@@ -177,17 +317,30 @@ def ingest_endpoint():
         prefix = data.get('prefix')
         wait_for_completion = data.get('wait_for_completion', False)
         batch_size = data.get('batch_size', 25)
+        try:
+            timeout = float(data.get('timeout', DEFAULT_WAIT_TIMEOUT))
+        except (TypeError, ValueError):
+            timeout = -1.0
+        if not math.isfinite(timeout) or timeout < 0:
+            return jsonify({
+                "status": "error",
+                "message": "timeout must be a non-negative number of seconds"
+            }), 400
+        timeout = min(timeout, MAX_WAIT_TIMEOUT)
 
         # Log request
         logger.info(f"Received ingestion request: prefix={prefix}, wait={wait_for_completion}, batch_size={batch_size}")
 
         # Perform ingestion
-        result = ingest_documents(prefix, wait_for_completion, batch_size)
+        result = ingest_documents(prefix, wait_for_completion, batch_size, timeout)
         
         # Return response
         if result.get('status') == 'error':
             return jsonify(result), 500
         
+        if result.get('operation_status') == 'running':
+            return jsonify(result), 202
+        
         return jsonify(result), 200
         
     except Exception as e:
@@ -198,6 +351,19 @@ def ingest_endpoint():
         }), 500
 
 
+@app.route('/operations/<op_id>', methods=['GET'])
+def operation_status(op_id: str):
+    """Status of an ingestion operation started by /ingest."""
+    operation = get_operation(op_id)
+    if operation is None:
+        return jsonify({
+            "status": "error",
+            "message": f"Unknown operation: {op_id}"
+        }), 404
+    
+    return jsonify({"operation_id": op_id, **operation}), 200
+
+
 @app.route('/', methods=['GET', 'POST'])
 def default_handler():
     """
@@ -215,9 +381,9 @@ def default_handler():
 
 
 if __name__ == '__main__':
-    # Initialize services at startup
-    initialize_services()
-    
+    # Flask's development server, for running locally; the container serves
+    # the app with gunicorn (see Dockerfile)
+
     # Get port from environment or default to 8080
     port = int(os.environ.get('PORT', 8080))
     
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Test script for saving and reloading the local document tracking file.
+"""
+
+import os
+import sys
+import tempfile
+from unittest import mock
+
+from src.rag.pipeline import VertexRagPipeline
+
+
+def _offline_pipeline(tracking_file: str) -> VertexRagPipeline:
+    """Create a pipeline that only uses the local tracking file."""
+    # Skip __init__, which connects to Vertex AI and loads the tracking data
+    pipeline = VertexRagPipeline.__new__(VertexRagPipeline)
+    pipeline.project_id = "test-project"
+    pipeline.tracking_file = tracking_file
+    pipeline.cloud_tracking_path = "tracking/.ingested_docs.json"
+    pipeline.use_cloud_tracking = False
+    pipeline.ingested_documents = set()
+    return pipeline
+
+
+def test_tracking_file_round_trip():
+    """Documents saved to the local tracking file are loaded back."""
+    documents = {"gs://bucket/papers/a.pdf", "gs://bucket/papers/b.pdf"}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pipeline = _offline_pipeline(os.path.join(tmp_dir, ".ingested_docs.json"))
+        pipeline.ingested_documents = set(documents)
+
+        # No corpus and no cloud tracking, so the local file is the only source
+        gcs_manager = mock.MagicMock()
+        gcs_manager.return_value.read_json.return_value = None
+        with mock.patch("src.rag.gcs_utils.GcsManager", gcs_manager), \
+                mock.patch.object(VertexRagPipeline, "get_corpus", side_effect=ValueError("no corpus")):
+            pipeline._save_ingested_documents()
+            loaded = pipeline._load_ingested_documents()
+
+    assert loaded == documents, f"Expected {sorted(documents)}, loaded {sorted(loaded)}"
+
+
+def main():
+    """Run the tracking file round-trip test."""
+    try:
+        test_tracking_file_round_trip()
+    except AssertionError as e:
+        print(f"Tracking file round trip failed: {e}")
+        return 1
+
+    print("Tracking file round trip succeeded")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,25 @@ Utilities for working with Google Cloud Storage.
 
 import os
 import json
-from typing import List, Optional, Any
+import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Any
 
+from google.api_core.exceptions import NotFound
 from google.cloud import storage
 
+# orjson is optional - it parses large tracking files straight from bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config.config_manager import get_config
 
+# Characters that split a prefix into name ranges listed in parallel by
+# fast_list_files, in byte order
+_LIST_SPLIT_CHARS = string.digits + string.ascii_uppercase + string.ascii_lowercase
+
 
 class GcsManager:
     """
@@ -40,6 +53,10 @@ class GcsManager:
         # Validate bucket name
         if not self.bucket_name:
             raise ValueError("GCS bucket name not provided. Set GCS_BUCKET environment variable or provide it when initializing.")
+
+        # Bucket handle shared by all operations. Unlike client.get_bucket(),
+        # this makes no request; a missing bucket surfaces on first use.
+        self.bucket = self.client.bucket(self.bucket_name)
     
     def list_files(self, prefix: Optional[str] = None) -> List[str]:
         """
@@ -52,17 +69,77 @@ class GcsManager:
             List of GCS file paths (gs://bucket/path/to/file)
         """
         # Get bucket
-        bucket = self.client.get_bucket(self.bucket_name)
+        bucket = self.bucket
 
         if not prefix:
             prefix = ""
         
-        # List blobs with prefix
-        blobs = bucket.list_blobs(prefix=prefix)
+        # List blobs with prefix, fetching only the object names
+        blobs = bucket.list_blobs(prefix=prefix, fields="items(name),nextPageToken")
         
         # Format paths as gs:// URLs
         return [f"gs://{self.bucket_name}/{blob.name}" for blob in blobs]
     
+    def fast_list_files(self, prefix: Optional[str] = None, workers: int = 16) -> List[str]:
+        """
+        List files in the GCS bucket, listing large prefixes in parallel.
+        
+        A listing that fits in one page is returned as is. Otherwise the names
+        under the prefix are split into disjoint lexicographic ranges (at each
+        digit and letter following the prefix) that together cover all of
+        them, and the ranges are listed concurrently. Idle workers take the
+        next pending range, so uneven ranges don't leave workers waiting.
+        
+        Args:
+            prefix: Optional path prefix to filter results
+            workers: Maximum number of ranges listed at the same time
+            
+        Returns:
+            List of GCS file paths (gs://bucket/path/to/file), in name order
+        """
+        prefix = prefix or ""
+        fields = "items(name),nextPageToken"
+
+        # A single page answers small listings without fanning out
+        iterator = self.bucket.list_blobs(prefix=prefix, fields=fields)
+        first_page = next(iterator.pages, None)
+        if not iterator.next_page_token:
+            return [f"gs://{self.bucket_name}/{blob.name}" for blob in first_page or ()]
+
+        bounds = [None] + [prefix + c for c in _LIST_SPLIT_CHARS] + [None]
+
+        def list_range(name_range) -> List[str]:
+            start, end = name_range
+            blobs = self.bucket.list_blobs(
+                prefix=prefix, start_offset=start, end_offset=end, fields=fields
+            )
+            return [blob.name for blob in blobs]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            names_by_range = executor.map(list_range, zip(bounds[:-1], bounds[1:]))
+            return [
+                f"gs://{self.bucket_name}/{name}"
+                for names in names_by_range
+                for name in names
+            ]
+    
+    def list_file_sizes(self, prefix: Optional[str] = None) -> Dict[str, Optional[int]]:
+        """
+        List files in the GCS bucket together with their sizes.
+
+        Sizes come from the listing itself, so no per-file metadata request is needed.
+
+        Args:
+            prefix: Optional path prefix to filter results
+
+        Returns:
+            Dictionary mapping GCS file paths (gs://bucket/path/to/file) to sizes in bytes
+        """
+        blobs = self.bucket.list_blobs(
+            prefix=prefix or "", fields="items(name,size),nextPageToken"
+        )
+        return {f"gs://{self.bucket_name}/{blob.name}": blob.size for blob in blobs}
+
     def upload_file(self, local_path: str, gcs_path: Optional[str] = None) -> str:
         """
         Upload a local file to GCS bucket.
@@ -75,7 +152,7 @@ class GcsManager:
             GCS path of uploaded file (gs://bucket/path/to/file)
         """
         # Get bucket
-        bucket = self.client.get_bucket(self.bucket_name)
+        bucket = self.bucket
         
         # Determine GCS path
         if not gcs_path:
@@ -88,6 +165,32 @@ class GcsManager:
         # Return full GCS path
         return f"gs://{self.bucket_name}/{gcs_path}"
     
+    def upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        gcs_path: str,
+        content_type: Optional[str] = None
+    ) -> str:
+        """
+        Upload the contents of a file-like object to GCS bucket.
+        
+        Content already in memory (e.g. a file uploaded through a web app) is
+        sent directly, without writing it to a local file first.
+        
+        Args:
+            fileobj: Binary file-like object, read from the beginning
+            gcs_path: Destination path in GCS
+            content_type: Optional MIME type of the content
+            
+        Returns:
+            GCS path of uploaded file (gs://bucket/path/to/file)
+        """
+        blob = self.bucket.blob(gcs_path)
+        blob.upload_from_file(fileobj, rewind=True, content_type=content_type)
+        
+        # Return full GCS path
+        return f"gs://{self.bucket_name}/{gcs_path}"
+    
     def upload_directory(self, local_dir: str, gcs_prefix: Optional[str] = None) -> List[str]:
         """
         Upload all files in a local directory to GCS bucket.
@@ -100,7 +203,7 @@ class GcsManager:
             List of GCS paths for uploaded files
         """
         # Get bucket
-        bucket = self.client.get_bucket(self.bucket_name)
+        bucket = self.bucket
         
         # Determine GCS prefix
         if not gcs_prefix:
@@ -138,17 +241,20 @@ class GcsManager:
             Parsed JSON content or None if file doesn't exist
         """
         # Get bucket
-        bucket = self.client.get_bucket(self.bucket_name)
+        bucket = self.bucket
         
         # Get blob
         blob = bucket.blob(gcs_path)
         
-        # Check if file exists
-        if not blob.exists():
+        # Download in a single request; a missing file raises NotFound
+        try:
+            content = blob.download_as_bytes()
+        except NotFound:
             return None
-        
-        # Download and parse JSON
-        content = blob.download_as_text()
+
+        # Parse JSON from the raw bytes, skipping the text decode
+        if orjson is not None:
+            return orjson.loads(content)
         return json.loads(content)
     
     def write_json(self, gcs_path: str, data: Any) -> None:
@@ -160,7 +266,7 @@ class GcsManager:
             data: Data to write (must be JSON serializable)
         """
         # Get bucket
-        bucket = self.client.get_bucket(self.bucket_name)
+        bucket = self.bucket
         
         # Get blob
         blob = bucket.blob(gcs_path)
@@ -182,7 +288,7 @@ class GcsManager:
             True if the file exists, False otherwise
         """
         # Get bucket
-        bucket = self.client.get_bucket(self.bucket_name)
+        bucket = self.bucket
         
         # Get blob
         blob = bucket.blob(gcs_path)
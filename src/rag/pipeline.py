@@ -4,20 +4,68 @@ using Google Cloud Vertex AI RAG Engine with RagManagedDb.
 """
 
 import os
+import re
 import json
+import datetime
 import logging
-from typing import List, Dict, Any, Optional, Union, Set, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional, Union, Set, Tuple
 from pathlib import Path
 
 from google.cloud import aiplatform
 from vertexai import rag
 from vertexai.generative_models import GenerativeModel
 
+# orjson is optional - it parses large tracking files straight from bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config.config_manager import get_config
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Default number of GCS prefixes listed in parallel during ingestion
+DEFAULT_INGEST_CONCURRENCY = 10
+
+# Date patterns searched for in document filenames, most specific first.
+# Compiled once since they run for every document in an ingestion.
+_FILENAME_DATE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        # ISO format: 2023-01-15
+        r'(\d{4}-\d{2}-\d{2})',
+        # Basic numeric: 20230115
+        r'(\d{4}\d{2}\d{2})',
+        # With separators: 2023_01_15
+        r'(\d{4}[_\.]\d{2}[_\.]\d{2})',
+        # Year-Month: 2023-01
+        r'(\d{4}-\d{2}\b)',
+        # Just year: 2023
+        r'\b(\d{4})\b',
+    )
+)
+
+
+def _read_json_file(path: str) -> Any:
+    """
+    Parse a local JSON file, with orjson when available.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The parsed JSON value
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.load(f)
+        # orjson only accepts bytes-like input, not an mmap or a file
+        return orjson.loads(f.read())
+
 
 class VertexRagPipeline:
     """
@@ -55,6 +103,12 @@ class VertexRagPipeline:
         
         # Initialize last_contexts to store retrieved contexts for display
         self.last_contexts = []
+
+        # Generative model clients by model name, created on first use
+        self._generative_models: Dict[str, GenerativeModel] = {}
+
+        # Serializes tracking updates when batches are ingested concurrently
+        self._tracking_lock = threading.Lock()
         
         # Load configuration
         config = get_config()
@@ -250,32 +304,31 @@ class VertexRagPipeline:
             if not cloud_documents_loaded and (not self.use_cloud_tracking or 
                                               not documents):  # If cloud failed or is empty
                 if os.path.exists(self.tracking_file):
-                    with open(self.tracking_file, 'r') as f:
-                        local_data = json.load(f)
+                    local_data = _read_json_file(self.tracking_file)
+
+                    # Handle both old format (list) and new format (dict with corpus_id)
+                    if isinstance(local_data, dict) and 'documents' in local_data:
+                        stored_corpus_id = local_data.get('corpus_id')
+                        local_docs = local_data['documents']
                         
-                        # Handle both old format (list) and new format (dict with corpus_id)
-                        if isinstance(local_data, dict) and 'documents' in local_data:
-                            stored_corpus_id = local_data.get('corpus_id')
-                            local_docs = local_data['documents']
+                        # Filter by corpus ID if available
+                        if corpus_id and stored_corpus_id and corpus_id != stored_corpus_id:
+                            print(f"Warning: Local tracking file is for a different corpus.")
+                            print(f"Current corpus: {corpus_id}")
+                            print(f"Tracked corpus: {stored_corpus_id}")
+                            print("Loading only documents that match current corpus paths.")
                             
-                            # Filter by corpus ID if available
-                            if corpus_id and stored_corpus_id and corpus_id != stored_corpus_id:
-                                print(f"Warning: Local tracking file is for a different corpus.")
-                                print(f"Current corpus: {corpus_id}")
-                                print(f"Tracked corpus: {stored_corpus_id}")
-                                print("Loading only documents that match current corpus paths.")
-                                
-                                # Only use documents that start with projects/{project_id}/locations/{location}/ragCorpora/{corpus_id}
-                                local_docs = [doc for doc in local_docs if 
-                                            (isinstance(doc, str) and 
-                                            (doc.startswith(corpus_id) or 
-                                             not doc.startswith('projects/')))]
-                        else:
-                            # Legacy format - just a list of documents
-                            local_docs = local_data
-                        
-                        documents.update(local_docs)
-                        print(f"Loaded {len(local_docs)} ingested documents from local file")
+                            # Only use documents that start with projects/{project_id}/locations/{location}/ragCorpora/{corpus_id}
+                            local_docs = [doc for doc in local_docs if 
+                                        (isinstance(doc, str) and 
+                                        (doc.startswith(corpus_id) or 
+                                         not doc.startswith('projects/')))]
+                    else:
+                        # Legacy format - just a list of documents
+                        local_docs = local_data
+                    
+                    documents.update(local_docs)
+                    print(f"Loaded {len(local_docs)} ingested documents from local file")
                 else:
                     print(f"Local tracking file not found: {self.tracking_file}")
                     
@@ -354,10 +407,6 @@ class VertexRagPipeline:
         Returns:
             Dictionary containing metadata like timestamp, source, etc.
         """
-        import re
-        import datetime
-        from pathlib import Path
-        
         metadata = {
             "source": gcs_path,
             "ingestion_timestamp": datetime.datetime.now().isoformat(),
@@ -368,21 +417,8 @@ class VertexRagPipeline:
         
         # Try to extract timestamp from filename
         # Common patterns: YYYY-MM-DD, YYYYMMDD, etc.
-        date_patterns = [
-            # ISO format: 2023-01-15
-            r'(\d{4}-\d{2}-\d{2})',
-            # Basic numeric: 20230115
-            r'(\d{4}\d{2}\d{2})',
-            # With separators: 2023_01_15
-            r'(\d{4}[_\.]\d{2}[_\.]\d{2})',
-            # Year-Month: 2023-01
-            r'(\d{4}-\d{2}\b)',
-            # Just year: 2023
-            r'\b(\d{4})\b'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, filename)
+        for pattern in _FILENAME_DATE_PATTERNS:
+            match = pattern.search(filename)
             if match:
                 date_str = match.group(1)
                 try:
@@ -463,11 +499,10 @@ class VertexRagPipeline:
 
             # Fall back to local file
             if hasattr(self, 'metadata_file') and os.path.exists(self.metadata_file):
-                with open(self.metadata_file, 'r') as f:
-                    local_metadata = json.load(f)
-                    self.document_metadata = local_metadata
-                    #print(f"Loaded metadata for {len(local_metadata)} documents from local file")
-                    return
+                local_metadata = _read_json_file(self.metadata_file)
+                self.document_metadata = local_metadata
+                #print(f"Loaded metadata for {len(local_metadata)} documents from local file")
+                return
 
         except Exception as e:
             print(f"Warning: Could not load document metadata: {e}")
@@ -508,7 +543,12 @@ class VertexRagPipeline:
                 else:
                     print(f"Warning: Could not save local backup of document metadata: {e}")
         
-    def ingest_documents(self, gcs_paths: List[str], force_reingest: bool = False) -> Dict[str, Any]:
+    def ingest_documents(
+        self,
+        gcs_paths: List[str],
+        force_reingest: bool = False,
+        concurrency: int = DEFAULT_INGEST_CONCURRENCY,
+    ) -> Dict[str, Any]:
         """
         Ingest documents from GCS bucket into the RAG corpus.
         
@@ -516,6 +556,7 @@ class VertexRagPipeline:
             gcs_paths: List of GCS paths (e.g., ["gs://bucket_name/folder/file.pdf"])
                 If empty, reads from document_prefixes configured in settings.
             force_reingest: If True, will reingest documents even if they're in the tracking list
+            concurrency: Maximum number of configured prefixes listed in parallel
             
         Returns:
             Import operation details
@@ -528,13 +569,30 @@ class VertexRagPipeline:
             from src.rag.gcs_utils import GcsManager
             gcs_manager = GcsManager(project_id=self.project_id, bucket_name=None)
 
-            all_paths = []
-            for prefix in self.document_prefixes:
-                paths = gcs_manager.list_files(prefix=prefix)
-                all_paths.extend(paths)
-                print(f"Found {len(paths)} documents with prefix '{prefix}'")
-
-            gcs_paths = all_paths
+            # List the prefixes concurrently; each listing is a network round trip
+            paths_by_prefix = {}
+            if self.document_prefixes:
+                max_workers = max(1, min(concurrency, len(self.document_prefixes)))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(gcs_manager.list_files, prefix=prefix): prefix
+                        for prefix in self.document_prefixes
+                    }
+                    for future in as_completed(futures):
+                        prefix = futures[future]
+                        try:
+                            paths_by_prefix[prefix] = future.result()
+                        except Exception as e:
+                            print(f"Error listing documents with prefix '{prefix}': {e}")
+                            continue
+                        print(f"Found {len(paths_by_prefix[prefix])} documents with prefix '{prefix}'")
+
+            # Keep the configured prefix order
+            gcs_paths = [
+                path
+                for prefix in self.document_prefixes
+                for path in paths_by_prefix.get(prefix, [])
+            ]
 
         # Sometimes there can be a mismatch between the tracking file and actual ingested state
         # Especially after recreating the corpus but the tracking file still exists
@@ -711,21 +769,27 @@ class VertexRagPipeline:
                     new_documents
                 )
 
-        # Update tracking - also store metadata
-        self.ingested_documents.update(new_documents)
-        
-        # If we have document_metadata field, update it
-        if not hasattr(self, 'document_metadata'):
-            self.document_metadata = {}
-            # Try to load existing metadata
-            self._load_document_metadata()
-        
-        # Update our metadata tracking
-        self.document_metadata.update(document_metadata)
-        
-        # Save both ingested documents and metadata
-        self._save_ingested_documents()
-        self._save_document_metadata()
+        # Update tracking - also store metadata. Concurrent calls (e.g. one
+        # per batch) take turns, so each save sees a consistent state.
+        with self._tracking_lock:
+            self.ingested_documents.update(new_documents)
+            
+            # If we have document_metadata field, update it
+            if not hasattr(self, 'document_metadata'):
+                self.document_metadata = {}
+                # Try to load existing metadata
+                self._load_document_metadata()
+            
+            # Update our metadata tracking
+            self.document_metadata.update(document_metadata)
+            
+            # Save both ingested documents and metadata
+            self._save_ingested_documents()
+            self._save_document_metadata()
+
+        # Cached answers predate the new documents
+        from src.rag.response_cache import invalidate_cached_responses
+        invalidate_cached_responses()
 
         print(f"Started document ingestion from: {new_documents}")
         return import_op
@@ -1132,30 +1196,21 @@ class VertexRagPipeline:
         print(f"Found {len(results)} results")
         return results
 
-    def generate_answer(
-        self, 
-        query: str, 
-        model_name: Optional[str] = None, 
-        temperature: Optional[float] = None,
+    def _build_answer_prompt(
+        self,
+        query: str,
         retrievals: Optional[List[Dict[str, Any]]] = None
-    ) -> str:
+    ) -> Optional[str]:
         """
-        Generate an answer to a query by retrieving context and using LLM.
+        Build the answer-generation prompt for a query from its retrieved context.
         
         Args:
             query: The user query
-            model_name: Name of the generative model (defaults to config value)
-            temperature: Temperature parameter (defaults to config value)
             retrievals: Optional pre-retrieved context (if None, will retrieve)
             
         Returns:
-            Generated answer
+            The prompt, or None if no relevant context was found
         """
-        # Load config values if not provided
-        config = get_config()
-        model_name = model_name or config.get("generative_model")
-        temperature = temperature or config.get("temperature")
-
         # Retrieve context if not provided
         if retrievals is None:
             try:
@@ -1178,7 +1233,7 @@ class VertexRagPipeline:
                     retrievals = []
 
         if not retrievals:
-            return "No relevant information found."
+            return None
 
         # Format context for the prompt - based on documentation format
         context_parts = []
@@ -1196,11 +1251,8 @@ class VertexRagPipeline:
 
         context = "\n\n".join(context_parts)
 
-        # Create generative model
-        model = GenerativeModel(model_name)
-
         # Generate response
-        prompt = f"""
+        return f"""
         Use the following information to answer the question.
         If you don't know the answer, just say "I don't have enough information to answer that."
         
@@ -1212,12 +1264,100 @@ class VertexRagPipeline:
         Answer:
         """
 
+    def get_generative_model(self, model_name: Optional[str] = None) -> GenerativeModel:
+        """
+        Get the generative model client for a model, reusing it across answers.
+        
+        Callers can call this ahead of generating an answer (e.g. while context
+        is being retrieved) so the client is ready when it is needed.
+        
+        Args:
+            model_name: Name of the generative model (defaults to config value)
+            
+        Returns:
+            The model client
+        """
+        model_name = model_name or get_config().get("generative_model")
+        model = self._generative_models.get(model_name)
+        if model is None:
+            model = self._generative_models[model_name] = GenerativeModel(model_name)
+        return model
+
+    def generate_answer(
+        self, 
+        query: str, 
+        model_name: Optional[str] = None, 
+        temperature: Optional[float] = None,
+        retrievals: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Generate an answer to a query by retrieving context and using LLM.
+        
+        Args:
+            query: The user query
+            model_name: Name of the generative model (defaults to config value)
+            temperature: Temperature parameter (defaults to config value)
+            retrievals: Optional pre-retrieved context (if None, will retrieve)
+            
+        Returns:
+            Generated answer
+        """
+        return "".join(
+            self.generate_answer_stream(query, model_name, temperature, retrievals, stream=False)
+        )
+
+    def generate_answer_stream(
+        self,
+        query: str,
+        model_name: Optional[str] = None,
+        temperature: Optional[float] = None,
+        retrievals: Optional[List[Dict[str, Any]]] = None,
+        stream: bool = True,
+    ) -> Iterator[str]:
+        """
+        Generate an answer to a query, yielding the text as the model produces it.
+        
+        Args:
+            query: The user query
+            model_name: Name of the generative model (defaults to config value)
+            temperature: Temperature parameter (defaults to config value)
+            retrievals: Optional pre-retrieved context (if None, will retrieve)
+            stream: Whether to request a streamed response from the model
+            
+        Yields:
+            Successive pieces of the generated answer
+        """
+        # Load config values if not provided
+        config = get_config()
+        model_name = model_name or config.get("generative_model")
+        temperature = temperature or config.get("temperature")
+
+        prompt = self._build_answer_prompt(query, retrievals)
+        if prompt is None:
+            yield "No relevant information found."
+            return
+
+        # Get the generative model
+        model = self.get_generative_model(model_name)
+
         # Use generation_config to set temperature
         response = model.generate_content(
             prompt, 
-            generation_config={"temperature": temperature} if temperature is not None else None
+            generation_config={"temperature": temperature} if temperature is not None else None,
+            stream=stream,
         )
-        return response.text
+        if not stream:
+            yield response.text
+            return
+
+        for chunk in response:
+            try:
+                text = chunk.text
+            except ValueError:
+                # Chunks without text parts (e.g. only safety or finish metadata)
+                continue
+            if text:
+                yield text
 
     def list_corpus_files(self) -> List[Dict[str, Any]]:
         """
@@ -1334,7 +1474,7 @@ class VertexRagPipeline:
 
             # Use generative model with the retrieved context
             # This simulates a direct integration by using the most recent contexts
-            model = GenerativeModel(model_name)
+            model = self.get_generative_model(model_name)
 
             # Use a prompt that identifies this was retrieved with RAG
             prompt = f"""
@@ -0,0 +1,238 @@
+"""
+Persistent exact-match response cache for RAG queries, backed by SQLite.
+
+Entries are keyed by the query text, the reranking setting and the corpus
+version, expire after a TTL, and are evicted by a combined recency and
+frequency score once the cache grows past its size cap. Bumping the corpus
+version (e.g. after the corpus is recreated or documents are ingested)
+invalidates every entry.
+"""
+
+import os
+import time
+import pickle
+import sqlite3
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Default on-disk location of the cache
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "zero-day-scout", "responses.sqlite3"
+)
+
+# Default lifetime of a cached response in seconds (one day)
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+# Default maximum number of cached responses before eviction
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class ResponseCache:
+    """
+    Caches query responses on disk with LRU/LFU eviction and a per-entry TTL.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        recency_weight: float = 0.7,
+        frequency_weight: float = 0.3,
+    ):
+        """
+        Open the cache database, creating it if needed, and evict excess entries.
+
+        Args:
+            path: SQLite database file
+            max_entries: Number of entries above which the lowest-scoring are evicted
+            recency_weight: Weight of last-use recency in the eviction score
+            frequency_weight: Weight of hit count in the eviction score
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.recency_weight = recency_weight
+        self.frequency_weight = frequency_weight
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT, metrics BLOB, "
+                "inserted_at REAL, last_used_at REAL, hits INTEGER DEFAULT 0, ttl INTEGER)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+        self.sweep()
+
+    @property
+    def corpus_version(self) -> str:
+        """Version of the corpus the cached responses were generated from."""
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE name = 'corpus_version'"
+        ).fetchone()
+        return row[0] if row else "0"
+
+    def bump_corpus_version(self) -> str:
+        """
+        Start a new corpus version, invalidating every cached response.
+
+        Returns:
+            The new corpus version
+        """
+        version = str(int(self.corpus_version) + 1)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('corpus_version', ?)",
+                (version,),
+            )
+            self._conn.execute("DELETE FROM responses")
+        return version
+
+    def make_key(self, query: str, use_reranking: bool) -> str:
+        """
+        Build the cache key for a query.
+
+        Args:
+            query: The query text
+            use_reranking: Whether reranking is enabled
+
+        Returns:
+            Hex digest identifying the query, setting and corpus version
+        """
+        raw = f"{query}|{use_reranking}|{self.corpus_version}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an unexpired cached response and record the hit.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            Dictionary with "response" and "metrics", or None on a miss
+        """
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT response, metrics FROM responses WHERE key = ? AND inserted_at + ttl > ?",
+            (key, now),
+        ).fetchone()
+        if row is None:
+            return None
+
+        try:
+            metrics = pickle.loads(row[1])
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached response: {e}")
+            self.delete(key)
+            return None
+
+        with self._conn:
+            self._conn.execute(
+                "UPDATE responses SET hits = hits + 1, last_used_at = ? WHERE key = ?",
+                (now, key),
+            )
+        return {"response": row[0], "metrics": metrics}
+
+    def set(
+        self,
+        key: str,
+        response: str,
+        metrics: Dict[str, Any],
+        ttl: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from make_key
+            response: Generated response text
+            metrics: Picklable query metrics to replay with the response
+            ttl: Seconds until the entry expires
+        """
+        now = time.time()
+        try:
+            blob = pickle.dumps(metrics, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"Could not cache response: {e}")
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, response, metrics, inserted_at, last_used_at, hits, ttl) "
+                "VALUES (?, ?, ?, ?, ?, 0, ?)",
+                (key, response, blob, now, now, ttl),
+            )
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        with self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def sweep(self) -> None:
+        """
+        Delete expired entries and, above the size cap, the lowest-scoring 10%.
+
+        The score weights how recently an entry was used (relative to the
+        oldest and newest uses) against how often it was hit.
+        """
+        now = time.time()
+        with self._conn:
+            self._conn.execute("DELETE FROM responses WHERE inserted_at + ttl <= ?", (now,))
+
+            count, oldest, newest, max_hits = self._conn.execute(
+                "SELECT COUNT(*), MIN(last_used_at), MAX(last_used_at), MAX(hits) FROM responses"
+            ).fetchone()
+            if count <= self.max_entries:
+                return
+
+            span = (newest - oldest) or 1.0
+            evict = max(count - self.max_entries, count // 10)
+            self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY "
+                "? * (last_used_at - ?) / ? + ? * hits / ? ASC LIMIT ?)",
+                (
+                    self.recency_weight, oldest, span,
+                    self.frequency_weight, float(max_hits or 1),
+                    evict,
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def invalidate_cached_responses(path: str = DEFAULT_CACHE_PATH) -> None:
+    """
+    Start a new corpus version in the on-disk cache after the corpus changed.
+
+    Semantic cache entries are namespaced by the same version, so they stop
+    matching too. Does nothing if there is no cache yet; failures are logged
+    and ignored.
+
+    Args:
+        path: SQLite database file of the cache
+    """
+    if not os.path.exists(path):
+        return
+    try:
+        cache = ResponseCache(path)
+        try:
+            cache.bump_corpus_version()
+        finally:
+            cache.close()
+    except Exception as e:
+        logger.warning(f"Could not invalidate cached responses: {e}")
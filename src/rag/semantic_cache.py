@@ -0,0 +1,254 @@
+"""
+Semantic response cache for RAG queries using random-projection LSH.
+
+Queries are looked up by embedding: each embedding is hashed into several
+random-hyperplane signatures, candidates sharing a signature in any table are
+compared by exact cosine similarity, and the best match above a threshold is
+returned. This lets a near-duplicate question reuse an earlier answer instead
+of repeating retrieval, reranking and generation. Entries expire after a TTL.
+"""
+
+import os
+import time
+import pickle
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Default on-disk location of the cache
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "zero-day-scout", "lsh.pkl"
+)
+
+# Default minimum cosine similarity for a cache hit
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+
+# Default lifetime of a cached response in seconds (one day)
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+class LSHCache:
+    """
+    Caches responses keyed by query embedding, using locality-sensitive hashing
+    to find near-duplicate queries without comparing against every entry.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_CACHE_PATH,
+        n_bits: int = 16,
+        n_tables: int = 8,
+        max_entries: int = 512,
+        seed: int = 0,
+    ):
+        """
+        Initialize the cache, loading persisted entries if present.
+
+        Args:
+            path: File the cache is persisted to (None keeps it in memory only)
+            n_bits: Hyperplanes per signature; more bits means fewer, closer candidates
+            n_tables: Number of independent hash tables; more tables improves recall
+            max_entries: Maximum number of cached responses, least recently used evicted first
+            seed: Seed for the random projections, so persisted signatures stay valid
+        """
+        self.path = path
+        self.n_bits = n_bits
+        self.n_tables = n_tables
+        self.max_entries = max_entries
+        self.seed = seed
+
+        # Projection planes are created once the embedding dimension is known
+        self._planes: Optional[np.ndarray] = None
+        self._entries: List[Dict[str, Any]] = []
+        self._tables: List[Dict[bytes, List[int]]] = [{} for _ in range(n_tables)]
+
+        if path and os.path.exists(path):
+            self._load()
+
+    def _ensure_planes(self, dim: int) -> bool:
+        """Create the projection planes for a dimension; False if it doesn't match."""
+        if self._planes is None:
+            rng = np.random.default_rng(self.seed)
+            self._planes = rng.standard_normal((self.n_tables, self.n_bits, dim))
+        return self._planes.shape[2] == dim
+
+    def _signatures(self, vector: np.ndarray) -> List[bytes]:
+        """Compute one packed sign-bit signature per hash table."""
+        bits = (self._planes @ vector) > 0
+        return [row.tobytes() for row in np.packbits(bits, axis=1)]
+
+    @staticmethod
+    def _normalize(qvec: Sequence[float]) -> Optional[np.ndarray]:
+        """Convert an embedding to a unit-length float32 vector, or None if empty."""
+        vector = np.asarray(qvec, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if vector.ndim != 1 or norm == 0:
+            return None
+        return vector / norm
+
+    @staticmethod
+    def _expired(entry: Dict[str, Any], now: float) -> bool:
+        """Whether an entry has outlived its TTL; entries without one count as expired."""
+        return entry.get("inserted_at", 0.0) + entry.get("ttl", 0) <= now
+
+    @staticmethod
+    def _last_used(entry: Dict[str, Any]) -> float:
+        """When an entry was last stored or returned, for LRU eviction."""
+        return entry.get("last_used", entry.get("inserted_at", 0.0))
+
+    def get(
+        self,
+        qvec: Sequence[float],
+        thresh: float = DEFAULT_SIMILARITY_THRESHOLD,
+        namespace: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached response for the most similar earlier, unexpired query.
+
+        Args:
+            qvec: Query embedding
+            thresh: Minimum cosine similarity for a hit
+            namespace: Only entries stored under the same namespace can match
+
+        Returns:
+            Dictionary with "response", "metrics" and "similarity", or None on a miss
+        """
+        vector = self._normalize(qvec)
+        if vector is None or not self._entries or not self._ensure_planes(len(vector)):
+            return None
+
+        candidates = set()
+        for table, signature in zip(self._tables, self._signatures(vector)):
+            candidates.update(table.get(signature, ()))
+
+        now = time.time()
+        best_entry, best_similarity = None, thresh
+        for entry_id in candidates:
+            entry = self._entries[entry_id]
+            if entry["namespace"] != namespace or self._expired(entry, now):
+                continue
+            similarity = float(entry["vector"] @ vector)
+            if similarity >= best_similarity:
+                best_entry, best_similarity = entry, similarity
+
+        if best_entry is None:
+            return None
+
+        # Hits only refresh recency in memory; it is persisted with the next set
+        best_entry["last_used"] = now
+        logger.info(f"Semantic cache hit (similarity {best_similarity:.3f})")
+        return {
+            "response": best_entry["response"],
+            "metrics": best_entry["metrics"],
+            "similarity": best_similarity,
+        }
+
+    def set(
+        self,
+        qvec: Sequence[float],
+        response: str,
+        metrics: Dict[str, Any],
+        namespace: str = "",
+        ttl: int = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Store a response for a query embedding and persist the cache.
+
+        Args:
+            qvec: Query embedding
+            response: Generated response text
+            metrics: Picklable query metrics to replay with the response
+            namespace: Namespace the entry is stored under
+            ttl: Seconds until the entry expires
+        """
+        vector = self._normalize(qvec)
+        if vector is None or not self._ensure_planes(len(vector)):
+            return
+
+        self._entries.append({
+            "vector": vector,
+            "response": response,
+            "metrics": metrics,
+            "namespace": namespace,
+            "inserted_at": time.time(),
+            "last_used": time.time(),
+            "ttl": ttl,
+        })
+        if len(self._entries) > self.max_entries:
+            # Drop the least recently used entries and re-index the rest
+            self._entries.sort(key=self._last_used)
+            del self._entries[:len(self._entries) - self.max_entries]
+            self._rebuild_tables()
+        else:
+            self._index(len(self._entries) - 1)
+
+        self.save()
+
+    def _index(self, entry_id: int) -> None:
+        """Add an entry to every hash table."""
+        signatures = self._signatures(self._entries[entry_id]["vector"])
+        for table, signature in zip(self._tables, signatures):
+            table.setdefault(signature, []).append(entry_id)
+
+    def _rebuild_tables(self) -> None:
+        """Rebuild the hash tables from the stored entries."""
+        self._tables = [{} for _ in range(self.n_tables)]
+        for entry_id in range(len(self._entries)):
+            self._index(entry_id)
+
+    def clear(self) -> None:
+        """Remove all entries from the cache and from disk."""
+        self._entries = []
+        self._tables = [{} for _ in range(self.n_tables)]
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def save(self) -> None:
+        """Persist the cache entries; failures are logged and ignored."""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "n_bits": self.n_bits,
+                        "n_tables": self.n_tables,
+                        "seed": self.seed,
+                        "entries": self._entries,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save semantic cache to {self.path}: {e}")
+
+    def _load(self) -> None:
+        """Load persisted entries; an unreadable or incompatible file is ignored."""
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load semantic cache from {self.path}: {e}")
+            return
+
+        # Signatures depend on the projection settings, so only reuse entries
+        # that were hashed with the same ones
+        if (state.get("n_bits"), state.get("n_tables"), state.get("seed")) != (
+            self.n_bits, self.n_tables, self.seed
+        ):
+            return
+
+        now = time.time()
+        entries = [e for e in state.get("entries", []) if not self._expired(e, now)]
+        entries.sort(key=self._last_used)
+        self._entries = entries[-self.max_entries:]
+        if self._entries:
+            self._ensure_planes(len(self._entries[0]["vector"]))
+            self._rebuild_tables()
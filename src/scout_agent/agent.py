@@ -7,7 +7,7 @@ This module implements the core agents using Google ADK:
 - AnalysisAgent: LLMAgent that evaluates information for security insights
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 import json
 import logging
 import os
@@ -143,13 +143,20 @@ class OrchestratorAgent:
 
         logger.info("Orchestrator resource cleanup complete")
 
-    async def process_query(self, query: str, timeout: float = 300.0) -> dict:
+    async def process_query(
+        self,
+        query: str,
+        timeout: float = 300.0,
+        on_agent_output: Optional[Callable[[str, str], None]] = None,
+    ) -> dict:
         """
         Process a user query through the complete agent workflow.
         
         Args:
             query: The security query from the user
             timeout: Maximum time in seconds to wait for a response (default: 5 minutes)
+            on_agent_output: Called with (agent key, output text) as each agent
+                output arrives, so callers can display results progressively
             
         Returns:
             Dictionary containing the final response and intermediate outputs
@@ -289,12 +296,16 @@ class OrchestratorAgent:
                     break
 
                 try:
-                    msg_type, msg_data = response_queue.get(timeout=0.5) # Add timeout to get
+                    # Wait off the event loop so other tasks (status updates,
+                    # concurrent batch queries) keep running meanwhile
+                    msg_type, msg_data = await asyncio.to_thread(response_queue.get, timeout=0.5)
 
                     if msg_type == "agent_output":
                         agent_name, text = msg_data
                         agent_outputs[agent_name]["output"] = text
                         logger.info(f"Received agent output from thread: {agent_name}")
+                        if on_agent_output:
+                            on_agent_output(agent_name, text)
                     elif msg_type == "error":
                         logger.error(f"Thread reported error: {msg_data}")
                         raise Exception(msg_data)
@@ -311,7 +322,7 @@ class OrchestratorAgent:
                 logger.warning(f"Thread processing timed out after {timeout} seconds")
                 final_response = "I apologize, but the query processing timed out."
                 # Attempt to join the thread briefly, but don't hang indefinitely
-                worker_thread.join(timeout=1.0)
+                await asyncio.to_thread(worker_thread.join, timeout=1.0)
 
             # If thread finished but we missed the 'final' message due to timing
             if not final_response and not worker_thread.is_alive():